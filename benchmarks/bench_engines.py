@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Compare the edit-mode operator, bmesh and ladder repair engines.
+
+Run inside Blender's Python (``bpy`` must be importable)::
+
+    python benchmarks/bench_engines.py --faces 1000000 --repeat 3
+
+The test mesh is a triangulated grid stored as an unwelded triangle soup with
+a few square holes punched in it, so every engine has to merge duplicates,
+fill holes and fix normals.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from stl_repair.cli import (
+    basic_mesh_repair,
+    bmesh_mesh_repair,
+    build_mesh_object,
+    ladder_mesh_repair,
+    load_bpy,
+)
+
+bpy = load_bpy()
+
+ENGINES = {
+    "ops": basic_mesh_repair,
+    "bmesh": bmesh_mesh_repair,
+    "ladder": ladder_mesh_repair,
+}
+
+
+def grid_soup(faces: int, holes: int = 16) -> tuple[np.ndarray, np.ndarray]:
+    """Unwelded triangle soup of a grid with roughly ``faces`` triangles."""
+    n = max(2, int(np.sqrt(faces / 2)))
+    xs, ys = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing="ij")
+    grid = np.stack([xs, ys, np.zeros_like(xs)], axis=-1).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    keep = np.ones((n, n), dtype=bool)
+    rng = np.random.default_rng(0)
+    for x, y in rng.integers(1, n - 1, size=(holes, 2)):
+        keep[x, y] = False
+    i, j = i[keep], j[keep]
+    a = i * (n + 1) + j
+    b, c, d = a + n + 1, a + n + 2, a + 1
+    tris = np.concatenate([np.stack([a, b, c], 1), np.stack([a, c, d], 1)])
+    # Flip every other triangle so normals need recalculating
+    tris[::2] = tris[::2, ::-1]
+    soup = grid[tris].reshape(-1, 3).astype(np.float32)
+    return soup, np.arange(len(soup), dtype=np.int32).reshape(-1, 3)
+
+
+def run_once(engine: str, vertices: np.ndarray, faces: np.ndarray) -> float:
+    """Build a fresh object and time one repair."""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    obj = build_mesh_object("bench", vertices, faces)
+    start = time.perf_counter()
+    ENGINES[engine](obj)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--faces", type=int, default=1_000_000)
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    vertices, faces = grid_soup(args.faces)
+    print(f"Mesh: {len(faces)} faces, {len(vertices)} unwelded vertices")
+    medians = {}
+    for engine in ENGINES:
+        times = [run_once(engine, vertices, faces) for _ in range(args.repeat)]
+        medians[engine] = statistics.median(times)
+        print(f"{engine:>6}: median {medians[engine]:.3f}s over {args.repeat} runs")
+    print(f"bmesh speedup: {medians['ops'] / medians['bmesh']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
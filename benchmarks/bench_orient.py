@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare NumPy/SciPy face orientation with Blender's normals operator.
+
+    python benchmarks/bench_orient.py --faces 2000000 --repeat 3
+
+The test mesh is a closed torus with a share of its faces flipped and the
+whole shell turned inside out. The NumPy and (if installed) SciPy backends of
+``orient_faces`` always run; ``mesh.normals_make_consistent`` is timed too
+when ``bpy`` is importable.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from stl_repair.orient import csr_matrix, orient_faces
+from stl_repair.synth import torus
+
+
+def scrambled_torus(faces: int, flipped: float = 0.3):
+    """Torus with ``flipped`` of its faces reversed, then turned inside out."""
+    vertices, tris = torus(faces)
+    rng = np.random.default_rng(0)
+    flip = rng.random(len(tris)) < flipped
+    tris[flip] = tris[flip, ::-1]
+    return vertices, np.ascontiguousarray(tris[:, ::-1])
+
+
+def time_numpy(vertices, faces, use_scipy: bool) -> float:
+    start = time.perf_counter()
+    orient_faces(vertices, faces, use_scipy)
+    return time.perf_counter() - start
+
+
+def time_operator(vertices, faces) -> float:
+    from stl_repair.cli import build_mesh_object, load_bpy, operator_repair
+
+    bpy = load_bpy()
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    obj = build_mesh_object("bench", vertices, faces)
+    start = time.perf_counter()
+    operator_repair(obj, ("mesh.normals_make_consistent", {"inside": False}))
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--faces", type=int, default=2_000_000)
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    vertices, faces = scrambled_torus(args.faces)
+    print(f"Mesh: {len(faces)} faces, {len(vertices)} vertices")
+    runs = {"numpy": lambda: time_numpy(vertices, faces, False)}
+    if csr_matrix is not None:
+        runs["scipy"] = lambda: time_numpy(vertices, faces, True)
+    try:
+        import bpy  # noqa: F401
+
+        runs["operator"] = lambda: time_operator(vertices, faces)
+    except ImportError:
+        print("bpy not importable; skipping normals_make_consistent")
+    for name, run in runs.items():
+        median = statistics.median(run() for _ in range(args.repeat))
+        print(f"{name:>8}: median {median:.3f}s over {args.repeat} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Stage-level benchmark suite with regression checks.
+
+Generates defective meshes at several scales, repairs each one with every
+engine and compares the median time of each ``repair_stl`` stage against
+stored baselines. Run inside Blender's Python::
+
+    python benchmarks/run_benchmarks.py --scales 10k,100k,1m
+    python benchmarks/run_benchmarks.py --update   # record new baselines
+
+The exit code is 1 if any stage regressed by more than ``--threshold``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+
+from stl_repair.cli import repair_stl
+from stl_repair.metrics import RepairMetrics
+from stl_repair.stl_io import write_binary_stl
+from stl_repair.synth import defective_mesh
+
+HERE = Path(__file__).parent
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+ENGINES = ["ops", "bmesh", "ladder"]
+
+
+def generate(workdir: Path, scale: str) -> Path:
+    """Write (or reuse) the defective STL for ``scale``."""
+    path = workdir / f"defective_{scale}.stl"
+    if not path.exists():
+        vertices, faces, applied = defective_mesh(SCALES[scale])
+        write_binary_stl(path, vertices, faces)
+        print(f"Generated {path.name}: {len(faces)} faces, defects {applied}")
+    return path
+
+
+def bench(path: Path, engine: str, repeat: int) -> dict[str, float]:
+    """Median wall time per stage over ``repeat`` repairs."""
+    samples: dict[str, list[float]] = {}
+    output = path.with_name(f"{path.stem}_{engine}_fixed.stl")
+    for _ in range(repeat):
+        metrics = RepairMetrics()
+        repair_stl(
+            path, output, False, "", engine=engine, skip_clean=True, metrics=metrics
+        )
+        for stage, values in metrics.stages.items():
+            samples.setdefault(stage, []).append(values["wall_s"])
+    return {stage: statistics.median(v) for stage, v in samples.items()}
+
+
+def compare(
+    current: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    min_delta: float,
+) -> list[str]:
+    """Describe every stage slower than its baseline beyond the threshold."""
+    regressions = []
+    for key, seconds in sorted(current.items()):
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if seconds > base * (1 + threshold) and seconds - base > min_delta:
+            regressions.append(f"{key}: {base:.3f}s -> {seconds:.3f}s")
+    return regressions
+
+
+def main():
+    """Run the suite."""
+    p = argparse.ArgumentParser(description="Benchmark repair stages")
+    p.add_argument("--scales", default="10k,100k,1m", help="Comma separated scales")
+    p.add_argument("--engines", default=",".join(ENGINES))
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--workdir", type=Path, default=HERE / ".data")
+    p.add_argument("--baseline", type=Path, default=HERE / "baselines.json")
+    p.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown (0.25=25%%)"
+    )
+    p.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.05,
+        help="Ignore regressions smaller than this many seconds",
+    )
+    p.add_argument("--update", action="store_true", help="Write new baselines")
+    args = p.parse_args()
+
+    args.workdir.mkdir(parents=True, exist_ok=True)
+    current = {}
+    for scale in args.scales.split(","):
+        path = generate(args.workdir, scale)
+        for engine in args.engines.split(","):
+            for stage, seconds in bench(path, engine, args.repeat).items():
+                key = f"{scale}/{engine}/{stage}"
+                current[key] = seconds
+                print(f"{key:<32} {seconds:8.3f}s")
+
+    if args.update:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text())
+        baseline.update(current)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baselines written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("No baselines yet; run with --update to record them")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(current, baseline, args.threshold, args.min_delta)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
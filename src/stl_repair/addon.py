@@ -0,0 +1,123 @@
+"""Provisioning of the 3D Print add-on from local archives or a version cache."""
+from __future__ import annotations
+
+import os
+import shutil
+import urllib.request
+import uuid
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+ADDON_NAME = "object_print3d_utils"
+ADDON_URL = "https://github.com/blender/blender-addons/archive/refs/heads/main.zip"
+
+
+@dataclass(frozen=True)
+class AddonSource:
+    """Where to get the add-on from, in order of preference."""
+
+    directory: Path | None = None
+    archive: Path | None = None
+    cache_dir: Path | None = None
+    offline: bool = False
+    url: str = ADDON_URL
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory for extracted add-ons."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "stl-repair" / "addons"
+
+
+def _addon_prefix(names: list[str]) -> str:
+    """Archive path prefix of the add-on package, e.g. ``repo-main/<addon>/``."""
+    marker = f"{ADDON_NAME}/__init__.py"
+    for name in names:
+        if name == marker or name.endswith("/" + marker):
+            return name[: -len("__init__.py")]
+    raise FileNotFoundError(f"{ADDON_NAME} not found in archive")
+
+
+def extract_addon(archive: Path, dest: Path) -> Path:
+    """Stream only the add-on's members from ``archive`` into ``dest``.
+
+    Extraction happens in a sibling temporary directory that is renamed into
+    place, so concurrent workers never see a half-extracted add-on.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}")
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            prefix = _addon_prefix(zf.namelist())
+            for info in zf.infolist():
+                if not info.filename.startswith(prefix) or info.is_dir():
+                    continue
+                rel = info.filename[len(prefix) :]
+                if ".." in rel.split("/"):
+                    continue
+                target = tmp.joinpath(*rel.split("/"))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+        try:
+            os.rename(tmp, dest)
+        except OSError:
+            # Another worker won the race; its copy is just as good
+            if not (dest / "__init__.py").exists():
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return dest
+
+
+def _download(url: str, dest: Path) -> Path:
+    """Stream ``url`` to ``dest`` via a temporary file."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}")
+    try:
+        with urllib.request.urlopen(url) as response, open(tmp, "wb") as f:
+            shutil.copyfileobj(response, f)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return dest
+
+
+def provision_addon(source: AddonSource, version: str) -> Path:
+    """Return a directory containing the add-on package, fetching if needed.
+
+    Preference order: a pre-extracted ``directory``, the version cache, a local
+    ``archive`` (extracted into the cache) and finally a download, unless
+    ``offline`` is set.
+    """
+    if source.directory is not None:
+        path = Path(source.directory)
+        if path.name != ADDON_NAME:
+            path = path / ADDON_NAME
+        if not (path / "__init__.py").exists():
+            raise FileNotFoundError(f"No {ADDON_NAME} package in {source.directory}")
+        return path
+
+    cached = (source.cache_dir or default_cache_dir()) / version / ADDON_NAME
+    if (cached / "__init__.py").exists():
+        logger.debug("Using cached add-on {}", cached)
+        return cached
+
+    if source.archive is not None:
+        logger.info("Extracting {} from {}", ADDON_NAME, source.archive)
+        return extract_addon(Path(source.archive), cached)
+
+    if source.offline:
+        raise FileNotFoundError(
+            f"{ADDON_NAME} is not cached for {version} and downloads are disabled"
+        )
+    archive = cached.parent / f".addons-{uuid.uuid4().hex}.zip"
+    logger.info("Downloading {} (blender-addons main)...", ADDON_NAME)
+    _download(source.url, archive)
+    try:
+        return extract_addon(archive, cached)
+    finally:
+        archive.unlink(missing_ok=True)
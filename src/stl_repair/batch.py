@@ -0,0 +1,195 @@
+"""Batch processing helpers for repairing many STL files in one process."""
+from __future__ import annotations
+
+import glob
+import os
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .metrics import RepairMetrics
+from .stl_io import sniff_format
+
+GLOB_CHARS = set("*?[")
+
+
+@dataclass
+class FileResult:
+    """Outcome of repairing a single file."""
+
+    input_path: Path
+    output_path: Path
+    ok: bool
+    error: str | None = None
+    seconds: float = 0.0
+    metrics: dict[str, Any] | None = None
+    # Set when a supervisor killed the repair ("timeout" or "memory"), or
+    # "crashed" when a resumed manifest found the previous run died on it
+    killed: str | None = None
+
+    @property
+    def status(self) -> str:
+        """``"ok"``, ``"failed"``, ``"timeout"``, ``"memory"`` or ``"crashed"``."""
+        if self.ok:
+            return "ok"
+        return self.killed or "failed"
+
+
+def is_glob(pattern: str) -> bool:
+    """Whether ``pattern`` contains glob wildcards."""
+    return any(c in GLOB_CHARS for c in pattern)
+
+
+def collect_inputs(
+    paths: Iterable[str | Path], file_list: Path | None = None
+) -> list[tuple[Path, Path | None]]:
+    """Expand files, directories and glob patterns into STL inputs.
+
+    Returns ``(path, root)`` pairs where ``root`` is the directory the file was
+    found under (``None`` for explicitly named files), so outputs can mirror
+    the input layout.
+    """
+    entries = [str(p) for p in paths]
+    if file_list is not None:
+        for line in file_list.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entries.append(line)
+
+    found: list[tuple[Path, Path | None]] = []
+    seen: set[Path] = set()
+
+    def add(path: Path, root: Path | None):
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            found.append((path, root))
+
+    for entry in entries:
+        if is_glob(entry):
+            matches = sorted(glob.glob(entry, recursive=True))
+            if not matches:
+                logger.warning("Pattern matched no files: {}", entry)
+            for m in matches:
+                if Path(m).is_file():
+                    add(Path(m), None)
+            continue
+        path = Path(entry)
+        if path.is_dir():
+            for p in sorted(path.rglob("*")):
+                if p.is_file() and p.suffix.lower() == ".stl":
+                    add(p, path)
+        else:
+            # Missing files are kept so they are reported as failures
+            add(path, None)
+    return found
+
+
+def output_path_for(
+    input_path: Path, suffix: str, output_dir: Path | None, root: Path | None = None
+) -> Path:
+    """Compute the output path for ``input_path``."""
+    if output_dir is None:
+        output = input_path.with_stem(input_path.stem + suffix)
+    elif root is not None:
+        output = output_dir / input_path.relative_to(root)
+    else:
+        output = output_dir / input_path.name
+    return output.with_suffix(".stl")
+
+
+def preflight(input_path: Path, output_path: Path):
+    """Cheap checks run before Blender is involved; raises on failure.
+
+    Creates the output directory once the job passes, so every writer (the
+    NumPy and Blender exporters, copies of clean inputs) finds it in place.
+    """
+    if not input_path.is_file():
+        raise FileNotFoundError(f"Input file does not exist: {input_path}")
+    if sniff_format(input_path) is None:
+        raise ValueError(f"Not an STL file: {input_path}")
+    # The closest existing ancestor decides whether the output can be created
+    parent = output_path.parent
+    while not parent.exists() and parent != parent.parent:
+        parent = parent.parent
+    if not parent.is_dir() or not os.access(parent, os.W_OK | os.X_OK):
+        raise PermissionError(f"Output directory is not writable: {parent}")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def reject_invalid(
+    jobs: Iterable[tuple[Path, Path]],
+) -> tuple[list[FileResult], list[tuple[Path, Path]]]:
+    """Split ``jobs`` into pre-flight failures and jobs worth starting."""
+    rejected, remaining = [], []
+    for input_path, output_path in jobs:
+        start = time.perf_counter()
+        try:
+            preflight(input_path, output_path)
+        except Exception as e:
+            logger.error("Rejected {}: {}", input_path, e)
+            result = FileResult(input_path, output_path, False, str(e))
+            result.seconds = time.perf_counter() - start
+            rejected.append(result)
+        else:
+            remaining.append((input_path, output_path))
+    return rejected, remaining
+
+
+def run_batch(
+    jobs: Iterable[tuple[Path, Path]],
+    repair: Callable[[Path, Path, RepairMetrics], Path],
+    on_result: Callable[[FileResult], None] | None = None,
+) -> list[FileResult]:
+    """Run ``repair`` on every ``(input, output)`` pair, isolating failures.
+
+    ``on_result`` is called as soon as each file finishes.
+    """
+    results = []
+    jobs = list(jobs)
+    for n, (input_path, output_path) in enumerate(jobs, 1):
+        logger.info("[{}/{}] Repairing {}", n, len(jobs), input_path)
+        start = time.perf_counter()
+        metrics = RepairMetrics()
+        try:
+            preflight(input_path, output_path)
+            final = repair(input_path, output_path, metrics)
+            result = FileResult(input_path, Path(final), True)
+        except Exception as e:
+            logger.error("Repair failed for {}: {}", input_path, e)
+            result = FileResult(input_path, output_path, False, str(e))
+        result.seconds = time.perf_counter() - start
+        result.metrics = metrics.as_dict()
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def log_summary(results: list[FileResult]):
+    """Log a per-file status table and totals."""
+    failed = [r for r in results if not r.ok]
+    labels = {
+        "ok": "OK  ",
+        "failed": "FAIL",
+        "timeout": "TIME",
+        "memory": "MEM ",
+        "crashed": "CRSH",
+    }
+    for r in results:
+        detail = r.output_path if r.ok else r.error
+        logger.info(
+            "{} {} ({:.2f}s) -> {}", labels[r.status], r.input_path, r.seconds, detail
+        )
+    killed = sum(r.killed is not None for r in results)
+    logger.info(
+        "Batch finished: {} ok, {} failed ({} killed), {} total",
+        len(results) - len(failed),
+        len(failed),
+        killed,
+        len(results),
+    )
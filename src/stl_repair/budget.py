@@ -0,0 +1,24 @@
+"""Peak-memory estimates used to admit repairs within a memory budget."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from .stl_io import triangle_count
+
+# Blender worker with the scene and add-on loaded, before any mesh
+WORKER_BASE_MB = 250.0
+# NumPy read and weld buffers, the Blender mesh and its edit-mode BMesh copy
+BYTES_PER_TRIANGLE = 1024
+
+
+def estimate_memory_mb(triangles: int) -> float:
+    """Estimated peak resident memory of a worker repairing ``triangles``."""
+    return WORKER_BASE_MB + triangles * BYTES_PER_TRIANGLE / (1024 * 1024)
+
+
+def file_memory_mb(path: Path) -> float:
+    """Estimated peak memory for repairing ``path``, without reading the mesh."""
+    try:
+        return estimate_memory_mb(triangle_count(path))
+    except OSError:
+        return estimate_memory_mb(0)
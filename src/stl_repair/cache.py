@@ -0,0 +1,138 @@
+"""Content-addressed cache of repaired STL files."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from . import __version__
+from .batch import FileResult
+
+CHUNK_SIZE = 1 << 20
+CACHED = {"stages": {}, "cached": True}
+
+
+class ResultCache:
+    """On-disk cache keyed by input bytes, repair options and tool version.
+
+    Entries are plain STL files under ``directory``; their mtime doubles as
+    the LRU timestamp, so the cache can be shared between processes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, input_path: Path, options: dict[str, Any]) -> str:
+        """Hash of the input file together with the options that shape output."""
+        h = hashlib.sha256()
+        h.update(__version__.encode())
+        h.update(json.dumps(options, sort_keys=True, default=str).encode())
+        with open(input_path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.stl"
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """Materialise a cached result at ``dest``; return whether it was a hit."""
+        entry = self._entry(key)
+        if not entry.is_file():
+            self.misses += 1
+            return False
+        os.utime(entry)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(entry, dest)
+        except OSError:
+            shutil.copyfile(entry, dest)
+        self.hits += 1
+        return True
+
+    def store(self, key: str, src: Path):
+        """Add a repaired file to the cache and enforce the size bound."""
+        entry = self._entry(key)
+        entry.parent.mkdir(exist_ok=True)
+        tmp = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, entry)
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            logger.warning("Could not cache {}: {}", src, e)
+            return
+        if self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until under ``max_bytes``."""
+        entries = []
+        for p in self.directory.glob("*/*.stl"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            logger.debug("Evicted cache entry {}", p.name)
+
+    def log_summary(self):
+        """Log hit/miss counters for the run."""
+        total = self.hits + self.misses
+        rate = 100.0 * self.hits / total if total else 0.0
+        logger.info(
+            "Cache: {} hits, {} misses ({:.0f}% hit rate)", self.hits, self.misses, rate
+        )
+
+
+def partition_jobs(
+    cache: ResultCache, jobs: Iterable[tuple[Path, Path]], options: dict[str, Any]
+) -> tuple[list[FileResult], list[tuple[Path, Path]], dict[Path, str]]:
+    """Serve cache hits and return ``(hit_results, remaining_jobs, keys)``."""
+    hits, remaining, keys = [], [], {}
+    for src, dst in jobs:
+        if not src.is_file():
+            remaining.append((src, dst))
+            continue
+        start = time.perf_counter()
+        keys[src] = cache.key(src, options)
+        if cache.fetch(keys[src], dst):
+            logger.info("Cache hit for {}", src)
+            seconds = time.perf_counter() - start
+            hits.append(FileResult(src, dst, True, seconds=seconds, metrics=CACHED))
+        else:
+            remaining.append((src, dst))
+    return hits, remaining, keys
+
+
+def store_results(
+    cache: ResultCache, results: Iterable[FileResult], keys: dict[Path, str]
+):
+    """Cache the outputs of successful repairs.
+
+    Outputs of cheaper retries are not what the key's options describe, so
+    they are never cached.
+    """
+    for r in results:
+        retried = "retried_after" in (r.metrics or {})
+        if r.ok and not retried and r.input_path in keys:
+            cache.store(keys[r.input_path], r.output_path)
@@ -1,55 +1,121 @@
 #!/usr/bin/env python3
 """CLI entry point for STL repair tool."""
 from __future__ import annotations
+
 import argparse
 import importlib
+import json
 import os
+import shutil
+import signal
 import sys
 import tempfile
-import urllib.request
-import zipfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 from loguru import logger
 
-# Try to import bpy early with clear error
-try:
-    import bpy  # type: ignore
-except Exception as e:
-    logger.error(
-        f"ERROR: This script must be executed inside Blender's Python. ({e})",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+from .addon import ADDON_NAME, AddonSource, provision_addon
+from .batch import (
+    FileResult,
+    collect_inputs,
+    is_glob,
+    log_summary,
+    output_path_for,
+    preflight,
+    reject_invalid,
+    run_batch,
+)
+from .budget import estimate_memory_mb, file_memory_mb
+from .cache import CACHED, ResultCache, partition_jobs, store_results
+from .components import drop_fragments, label_components, merge_meshes, split_mesh
+from .geometry import (
+    MERGE_DISTANCE,
+    center_vertices,
+    drop_bad_faces,
+    weld_by_distance,
+)
+from .manifest import Manifest
+from .metrics import MetricsWriter, RepairMetrics
+from .orient import orient_faces
+from .pool import Job, WorkerPool
+from .service import RepairService, make_server
+from .stl_io import (
+    ASCII_CHUNK,
+    load_binary_mesh,
+    load_mesh,
+    sniff_format,
+    write_binary_stl,
+)
+from .topology import analyze_topology
+from .validate import check_mesh
+from .watch import DirectoryWatcher, HotFolder
+
+# Options applied when retrying a repair that ran over its budget: the bmesh
+# engine skips the add-on and only fills small holes
+CHEAP_RETRY = {"engine": "bmesh"}
+# The ladder's wider weld closes cracks up to this many merge distances
+WIDE_MERGE_FACTOR = 10
+
+# Blender modules are imported on first use so that argument parsing,
+# pre-flight checks and tooling importing this module stay fast.
+bpy = None
+bmesh = None
+
+
+def load_bpy():
+    """Import ``bpy`` and ``bmesh`` if that has not happened yet."""
+    global bpy, bmesh
+    if bpy is None:
+        try:
+            import bmesh as _bmesh  # type: ignore
+            import bpy as _bpy  # type: ignore
+        except Exception as e:
+            raise RuntimeError(
+                f"This script must be executed inside Blender's Python. ({e})"
+            ) from e
+        bpy, bmesh = _bpy, _bmesh
+    return bpy
+
+
+def require_bpy():
+    """Load Blender or exit with the classic error message."""
+    try:
+        load_bpy()
+    except RuntimeError as e:
+        logger.error(f"ERROR: {e}")
+        sys.exit(1)
+
+
+def link_addon(addon_path: Path, user_addon_dir: Path):
+    """Expose ``addon_path`` in Blender's user add-on directory."""
+    target = user_addon_dir / ADDON_NAME
+    if target.is_symlink() or target.exists():
+        return
+    try:
+        target.symlink_to(addon_path, target_is_directory=True)
+    except FileExistsError:
+        pass  # another worker linked it first
+    except OSError:
+        shutil.copytree(addon_path, target, dirs_exist_ok=True)
 
 
-def attempt_install_print_addon() -> bool:
+def attempt_install_print_addon(source: AddonSource | None = None) -> bool:
     """Attempt to install the Blender 3D print add-on."""
+    source = source or AddonSource()
     try:
-        user_addon_dir = bpy.utils.user_resource("SCRIPTS", path="addons", create=True)
-        addon_folder = os.path.join(user_addon_dir, "object_print3d_utils")
-        if not os.path.isdir(addon_folder):
-            logger.info("Downloading object_print3d_utils (blender-addons main)...")
-            url = (
-                "https://github.com/blender/blender-addons/archive/refs/heads/main.zip"
-            )
-            with tempfile.TemporaryDirectory() as td:
-                zip_path = os.path.join(td, "addons.zip")
-                urllib.request.urlretrieve(url, zip_path)
-                with zipfile.ZipFile(zip_path) as zf:
-                    for m in zf.namelist():
-                        if m.startswith("blender-addons-main/object_print3d_utils/"):
-                            rel = m.split("blender-addons-main/")[-1]
-                            target_path = os.path.join(user_addon_dir, rel)
-                            if m.endswith("/"):
-                                os.makedirs(target_path, exist_ok=True)
-                            else:
-                                os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                                with zf.open(m) as src, open(target_path, "wb") as dst:
-                                    dst.write(src.read())
-            logger.info("Add-on extracted to {}", addon_folder)
+        user_addon_dir = Path(
+            bpy.utils.user_resource("SCRIPTS", path="addons", create=True)
+        )
+        if not (user_addon_dir / ADDON_NAME).is_dir():
+            addon_path = provision_addon(source, bpy.app.version_string)
+            link_addon(addon_path, user_addon_dir)
+            logger.info("Add-on {} installed from {}", ADDON_NAME, addon_path)
         importlib.invalidate_caches()
-        bpy.ops.preferences.addon_enable(module="object_print3d_utils")
+        bpy.ops.preferences.addon_enable(module=ADDON_NAME)
         logger.info("Enabled object_print3d_utils after install")
         return True
     except Exception as e:
@@ -57,8 +123,10 @@ def attempt_install_print_addon() -> bool:
         return False
 
 
-def enable_print_addon() -> bool:
+def enable_print_addon(source: AddonSource | None = None) -> bool:
     """Enable the Blender 3D print add-on."""
+    load_bpy()
+    source = source or AddonSource()
     try:
         import addon_utils  # type: ignore
 
@@ -72,7 +140,7 @@ def enable_print_addon() -> bool:
             except Exception as e:
                 logger.debug(f"Enable failure: {e}")
         logger.info("3D Print add-on not present; attempting install")
-        return attempt_install_print_addon()
+        return attempt_install_print_addon(source)
     except Exception as e:
         logger.debug(f"Add-on check failed: {e}")
         return False
@@ -93,80 +161,749 @@ def safe_call(op_path: str, **kwargs) -> bool:
         return False
 
 
-def basic_mesh_repair(obj):
-    """Apply basic mesh repair operations."""
+def release_scene(factory_reset: bool = False):
+    """Free every object and mesh left by the previous file, then purge orphans.
+
+    ``object.delete`` only unlinks objects; their mesh datablocks would stay in
+    ``bpy.data`` and grow a long-running worker with every file.
+    ``factory_reset`` reloads the factory startup file with an empty scene
+    instead; preferences, and so enabled add-ons, are kept.
+    """
+    if factory_reset and safe_call(
+        "wm.read_homefile", use_empty=True, use_factory_startup=True
+    ):
+        return
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh, do_unlink=True)
+    if hasattr(bpy.data, "orphans_purge"):
+        # Materials, images etc. only referenced by what was just removed
+        bpy.data.orphans_purge(do_recursive=True)
+
+
+def needs(defects: set[str] | None, *kinds: str) -> bool:
+    """Whether a fix for ``kinds`` is due; unknown defects mean always."""
+    return defects is None or bool(defects.intersection(kinds))
+
+
+def nothing_to_fix(weld: bool, defects: set[str] | None, what: str) -> bool:
+    """Whether the basic repairs have no work; logs why they are skipped.
+
+    They only fill holes and fix winding, so other defects are reported as
+    left over rather than hidden behind "no defects".
+    """
+    if weld or needs(defects, "holes", "winding", "inverted"):
+        return False
+    if defects:
+        logger.warning(
+            "{} cannot fix {}; skipping it (try --engine ladder)",
+            what,
+            ", ".join(sorted(defects)),
+        )
+    else:
+        logger.info("No topology defects; skipping {}", what)
+    return True
+
+
+def basic_mesh_repair(
+    obj,
+    merge_distance: float = MERGE_DISTANCE,
+    weld: bool = True,
+    defects: set[str] | None = None,
+):
+    """Apply basic mesh repair operations.
+
+    ``weld=False`` skips merging by distance for meshes already welded.
+    ``defects`` (see :func:`analyze_topology`) limits the work to the fixes
+    needed; ``None`` runs all of them.
+    """
+    if nothing_to_fix(weld, defects, "basic mesh repair"):
+        return
     logger.info("Applying basic mesh repair")
     bpy.context.view_layer.objects.active = obj
     safe_call("object.mode_set", mode="EDIT")
     safe_call("mesh.select_all", action="SELECT")
     # Merge by distance (replace old remove_doubles)
-    if not safe_call("mesh.remove_doubles"):  # older
-        safe_call("mesh.merge_by_distance")
-    safe_call("mesh.fill_holes")
-    safe_call("mesh.normals_make_consistent", inside=False)
+    if weld and not safe_call("mesh.remove_doubles", threshold=merge_distance):
+        safe_call("mesh.merge_by_distance", threshold=merge_distance)
+    if needs(defects, "holes"):
+        safe_call("mesh.fill_holes")
+    if needs(defects, "winding", "inverted"):
+        safe_call("mesh.normals_make_consistent", inside=False)
     safe_call("object.mode_set", mode="OBJECT")
 
 
-def repair_stl(input_path: Path, output_path: Path, use_print_addon: bool, suffix: str):
-    """Repair an STL file using Blender."""
-    # Reset scene
-    safe_call("object.select_all", action="SELECT")
-    safe_call("object.delete", use_global=False, confirm=False)
+def bmesh_mesh_repair(
+    obj,
+    merge_distance: float = MERGE_DISTANCE,
+    weld: bool = True,
+    defects: set[str] | None = None,
+):
+    """Apply basic mesh repair with bmesh, without edit-mode round-trips."""
+    if nothing_to_fix(weld, defects, "bmesh mesh repair"):
+        return
+    logger.info("Applying bmesh mesh repair")
+    mesh = obj.data
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        if weld:
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+        if needs(defects, "holes"):
+            # Same default as mesh.fill_holes: only close holes up to 4 sides
+            bmesh.ops.holes_fill(bm, edges=bm.edges, sides=4)
+        if needs(defects, "winding", "inverted"):
+            bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
+
+
+def build_mesh_object(name: str, vertices: np.ndarray, faces: np.ndarray):
+    """Create a mesh object from vertex and triangle arrays and select it."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(vertices, np.float32).ravel())
+    mesh.loops.add(faces.size)
+    mesh.loops.foreach_set(
+        "vertex_index", np.ascontiguousarray(faces, np.int32).ravel()
+    )
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, faces.size, 3, dtype=np.int32))
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    for other in bpy.context.selected_objects:
+        other.select_set(False)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+
+def read_mesh(input_path: Path, ascii_cache: bool = False):
+    """Load an STL natively, logging progress through large ASCII files."""
+    last = [0]
+
+    def progress(done: int, total: int):
+        tenth = 10 * done // max(total, 1)
+        if total > 4 * ASCII_CHUNK and tenth > last[0]:
+            last[0] = tenth
+            logger.info("Parsing {}: {}%", input_path.name, 10 * tenth)
+
+    return load_mesh(input_path, ascii_cache, progress)
+
+
+def import_stl(input_path: Path, reader: str = "native", mesh_data=None):
+    """Import ``input_path`` and return the new object.
+
+    ``mesh_data`` is an already loaded ``(vertices, faces)`` pair to reuse.
+    """
+    if reader == "native" and mesh_data is not None:
+        return build_mesh_object(input_path.stem, *mesh_data)
+    if reader == "native":
+        vertices, faces = read_mesh(input_path)
+        logger.debug("Read {} vertices, {} faces natively", len(vertices), len(faces))
+        return build_mesh_object(input_path.stem, vertices, faces)
 
-    # Import
     if not safe_call(
         "wm.stl_import", filepath=str(input_path), directory=str(input_path.parent)
     ):
         raise RuntimeError("Failed to import STL")
+    return bpy.context.view_layer.objects.active or bpy.context.selected_objects[0]
+
+
+def mesh_arrays(obj) -> tuple[np.ndarray, np.ndarray]:
+    """World-space vertices and triangulated faces of ``obj`` as arrays."""
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    faces = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", faces)
+    vertices = vertices.reshape(-1, 3)
+    bpy.context.view_layer.update()
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    if not np.allclose(matrix, np.eye(4)):
+        vertices = (vertices @ matrix[:3, :3].T + matrix[:3, 3]).astype(np.float32)
+    return vertices, faces.reshape(-1, 3)
+
+
+def edit_bmesh(obj, edit: Callable):
+    """Run ``edit(bm)`` on a bmesh of ``obj`` and write the result back."""
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(obj.data)
+        edit(bm)
+        bm.to_mesh(obj.data)
+    finally:
+        bm.free()
+    obj.data.update()
+
+
+def operator_repair(obj, *ops: tuple[str, dict]):
+    """Run edit-mode operators on all of ``obj``."""
+    bpy.context.view_layer.objects.active = obj
+    safe_call("object.mode_set", mode="EDIT")
+    safe_call("mesh.select_all", action="SELECT")
+    for op, kwargs in ops:
+        safe_call(op, **kwargs)
+    safe_call("object.mode_set", mode="OBJECT")
+
+
+@dataclass(frozen=True)
+class Rung:
+    """One step of the repair ladder and the defect classes it addresses."""
+
+    name: str
+    fixes: frozenset[str]
+    apply: Callable  # (obj, merge_distance)
+    addon: bool = False
+
+
+def split_non_manifold(bm):
+    """Split edges shared by more than two faces and drop loose geometry.
+
+    Fins and other faces glued on along one edge become separate pieces;
+    the openings this leaves are closed by the hole-filling rung after it.
+    """
+    edges = [e for e in bm.edges if len(e.link_faces) > 2]
+    if edges:
+        bmesh.ops.split_edges(bm, edges=edges)
+    wire = [e for e in bm.edges if not e.link_faces]
+    if wire:
+        bmesh.ops.delete(bm, geom=wire, context="EDGES")
+    loose = [v for v in bm.verts if not v.link_faces]
+    if loose:
+        bmesh.ops.delete(bm, geom=loose, context="VERTS")
+
+
+# Cheapest first; a rung only runs while a defect it fixes remains
+LADDER = (
+    Rung(
+        "recalc_normals",
+        frozenset({"winding", "inverted"}),
+        lambda obj, d: edit_bmesh(
+            obj, lambda bm: bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        ),
+    ),
+    Rung(
+        "fill_small_holes",
+        frozenset({"holes"}),
+        lambda obj, d: edit_bmesh(
+            obj, lambda bm: bmesh.ops.holes_fill(bm, edges=bm.edges, sides=4)
+        ),
+    ),
+    Rung(
+        "merge_wide",
+        frozenset({"holes"}),
+        lambda obj, d: edit_bmesh(
+            obj,
+            lambda bm: bmesh.ops.remove_doubles(
+                bm, verts=bm.verts, dist=d * WIDE_MERGE_FACTOR
+            ),
+        ),
+    ),
+    Rung(
+        "split_non_manifold",
+        frozenset({"non_manifold"}),
+        lambda obj, d: edit_bmesh(obj, split_non_manifold),
+    ),
+    Rung(
+        "fill_holes",
+        frozenset({"holes"}),
+        lambda obj, d: edit_bmesh(
+            obj, lambda bm: bmesh.ops.holes_fill(bm, edges=bm.edges, sides=0)
+        ),
+    ),
+    Rung(
+        "print3d_clean_non_manifold",
+        frozenset({"holes", "non_manifold", "winding", "inverted"}),
+        lambda obj, d: operator_repair(obj, ("mesh.print3d_clean_non_manifold", {})),
+        addon=True,
+    ),
+)
+
+
+def ladder_mesh_repair(
+    obj,
+    merge_distance: float = MERGE_DISTANCE,
+    weld: bool = True,
+    defects: set[str] | None = None,
+    use_addon: bool = False,
+    metrics: RepairMetrics | None = None,
+) -> set[str]:
+    """Fix each defect class with the cheapest rung, escalating while it remains.
+
+    Every rung is followed by a NumPy re-analysis; decisions and their cost
+    are logged and recorded under ``ladder``. Returns the defects left.
+    """
+    metrics = metrics or RepairMetrics()
+    if weld:
+        edit_bmesh(
+            obj,
+            lambda bm: bmesh.ops.remove_doubles(
+                bm, verts=bm.verts, dist=merge_distance
+            ),
+        )
+        defects = None
+    if defects is None:
+        defects = analyze_topology(*mesh_arrays(obj)).defects()
+    steps = []
+    for rung in LADDER:
+        if not defects & rung.fixes or (rung.addon and not use_addon):
+            continue
+        start = time.perf_counter()
+        rung.apply(obj, merge_distance)
+        after = analyze_topology(*mesh_arrays(obj)).defects()
+        seconds = time.perf_counter() - start
+        logger.info(
+            "Ladder {}: {} -> {} in {:.3f}s",
+            rung.name,
+            ", ".join(sorted(defects)),
+            ", ".join(sorted(after)) or "clean",
+            seconds,
+        )
+        steps.append(
+            {
+                "rung": rung.name,
+                "before": sorted(defects),
+                "after": sorted(after),
+                "seconds": round(seconds, 6),
+            }
+        )
+        defects = after
+        if not defects:
+            break
+    metrics.note("ladder", steps)
+    if defects:
+        logger.warning("Defects left after the repair ladder: {}", sorted(defects))
+    return defects
+
+
+def center_object(obj):
+    """Move ``obj``'s volume centroid to the origin by shifting its vertices."""
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    faces = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", faces)
+    co = center_vertices(co.reshape(-1, 3), faces.reshape(-1, 3))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.update()
+    obj.location = (0.0, 0.0, 0.0)
+
+
+def export_stl(obj, output_path: Path, writer: str = "native") -> Path:
+    """Write ``obj`` to exactly ``output_path``."""
+    if writer == "native":
+        return write_binary_stl(output_path, *mesh_arrays(obj))
+
+    # export_selected_objects with batch expects a directory path
+    export_dir = output_path.parent
+    old_name = obj.name
+    obj.name = output_path.stem  # ensure expected filename
+    try:
+        if not safe_call(
+            "wm.stl_export",
+            filepath=str(export_dir) + os.sep,
+            display_type="DEFAULT",
+            use_batch=True,
+            export_selected_objects=True,
+        ):
+            raise RuntimeError("Failed to export STL")
+        return export_dir / f"{obj.name}.stl"
+    finally:
+        obj.name = old_name  # restore
+
 
-    obj = bpy.context.view_layer.objects.active or bpy.context.selected_objects[0]
-    safe_call("object.origin_set", type="ORIGIN_CENTER_OF_VOLUME", center="MEDIAN")
-    for i in range(3):
-        obj.location[i] = 0.0
+def repair_stl(
+    input_path: Path,
+    output_path: Path,
+    use_print_addon: bool,
+    suffix: str,
+    reader: str = "native",
+    writer: str = "native",
+    metrics: RepairMetrics | None = None,
+    engine: str = "ops",
+    skip_clean: bool = False,
+    merge_distance: float = MERGE_DISTANCE,
+    center: bool = True,
+    ascii_cache: bool = False,
+    factory_reset: bool = False,
+    orient: str = "blender",
+):
+    """Repair an STL file using Blender.
+
+    ``center=False`` keeps the mesh where it is instead of moving its centre
+    of volume to the origin. ``ascii_cache`` keeps a binary copy of ASCII
+    inputs next to them for faster re-runs. ``factory_reset`` starts from a
+    factory-empty scene rather than just clearing the previous file's data.
+    ``orient="numpy"`` fixes winding before import with :func:`orient_faces`
+    (natively read meshes only).
+    """
+    load_bpy()
+    metrics = metrics or RepairMetrics()
+    mesh_data = None
+    if skip_clean and sniff_format(input_path) == "binary":
+        with metrics.stage("precheck"):
+            mesh_data = load_binary_mesh(input_path)
+            report = check_mesh(*mesh_data, merge_distance)
+        metrics.note("precheck", report.as_dict())
+        if report.clean:
+            logger.info("{} is already clean; copying unchanged", input_path)
+            if input_path.resolve() != output_path.resolve():
+                shutil.copyfile(input_path, output_path)
+            return output_path
+        logger.info("{} needs repair: {}", input_path, ", ".join(report.problems()))
+        if reader != "native":
+            # wm.stl_import reads the raw file again; these arrays are not used
+            mesh_data = None
+
+    with metrics.stage("reset"):
+        release_scene(factory_reset)
+
+    if mesh_data is None and reader == "native":
+        with metrics.stage("read"):
+            mesh_data = read_mesh(input_path, ascii_cache)
+    # Natively read meshes are welded in NumPy so Blender does not have to
+    welded = mesh_data is not None
+    defects = None
+    if welded:
+        with metrics.stage("weld"):
+            count = len(mesh_data[0])
+            mesh_data = weld_by_distance(*mesh_data, merge_distance)
+        metrics.note("welded_vertices", count - len(mesh_data[0]))
+        with metrics.stage("clean"):
+            faces, degenerate, duplicates = drop_bad_faces(*mesh_data, merge_distance)
+            mesh_data = (mesh_data[0], faces)
+        metrics.note(
+            "dropped_faces", {"degenerate": degenerate, "duplicate": duplicates}
+        )
+        if degenerate or duplicates:
+            logger.info(
+                "Dropped {} degenerate and {} duplicate faces", degenerate, duplicates
+            )
+        # Only a welded mesh has meaningful edges to analyse
+        with metrics.stage("analyze"):
+            topology = analyze_topology(*mesh_data)
+        metrics.note("topology", topology.as_dict())
+        defects = topology.defects()
+        logger.info("{} defects: {}", input_path, ", ".join(sorted(defects)) or "none")
+        if orient == "numpy" and defects & {"winding", "inverted"}:
+            with metrics.stage("orient"):
+                faces, report = orient_faces(*mesh_data)
+                mesh_data = (mesh_data[0], faces)
+            metrics.note("orient", report.as_dict())
+            defects.discard("inverted")
+            if not report.conflicts:
+                defects.discard("winding")
+
+    if center and mesh_data is not None:
+        # Translating the arrays is far cheaper than origin_set on the object
+        with metrics.stage("origin"):
+            mesh_data = (center_vertices(*mesh_data), mesh_data[1])
+
+    with metrics.stage("import"):
+        obj = import_stl(input_path, reader, mesh_data)
+    metrics.count("before", len(obj.data.vertices), len(obj.data.polygons))
+
+    if center and mesh_data is None:
+        with metrics.stage("origin"):
+            center_object(obj)
 
     if suffix:
         obj.name = obj.name + suffix
 
-    if use_print_addon:
+    if engine == "bmesh":
+        with metrics.stage("repair"):
+            bmesh_mesh_repair(obj, merge_distance, not welded, defects)
+    elif engine == "ladder":
+        with metrics.stage("repair"):
+            ladder_mesh_repair(
+                obj, merge_distance, not welded, defects, use_print_addon, metrics
+            )
+    elif use_print_addon and defects == set():
+        logger.info("No topology defects; skipping 3D Print add-on checks")
+    elif use_print_addon:
         try:
             logger.info("Running 3D Print add-on checks")
-            safe_call("mesh.print3d_check_all")
-            safe_call("mesh.print3d_clean_non_manifold")
+            with metrics.stage("addon_checks"):
+                safe_call("mesh.print3d_check_all")
+                safe_call("mesh.print3d_clean_non_manifold")
         except Exception as e:
             logger.warning(f"3D print utilities failed: {e}")
-            basic_mesh_repair(obj)
+            with metrics.stage("repair"):
+                basic_mesh_repair(obj, merge_distance, not welded, defects)
     else:
-        basic_mesh_repair(obj)
+        with metrics.stage("repair"):
+            basic_mesh_repair(obj, merge_distance, not welded, defects)
+    metrics.count("after", len(obj.data.vertices), len(obj.data.polygons))
 
-    # Export (export_selected_objects with batch expects directory path)
-    export_dir = output_path.parent
-    export_name = output_path.stem
-    old_name = obj.name
-    obj.name = export_name  # ensure expected filename
-    if not safe_call(
-        "wm.stl_export",
-        filepath=str(export_dir) + os.sep,
-        display_type="DEFAULT",
-        use_batch=True,
-        export_selected_objects=True,
-    ):
-        raise RuntimeError("Failed to export STL")
-    final_file = export_dir / f"{obj.name}.stl"
-    obj.name = old_name  # restore
+    with metrics.stage("export"):
+        final_file = export_stl(obj, output_path, writer)
     logger.info(f"Wrote {final_file}")
+    # Free the mesh now rather than holding it until the next file arrives
+    with metrics.stage("release"):
+        release_scene()
     return final_file
 
 
-def parse_args():
+def repair_components(
+    input_path: Path,
+    output_path: Path,
+    options: dict,
+    use_print_addon: bool = False,
+    pool: WorkerPool | None = None,
+    metrics: RepairMetrics | None = None,
+    min_faces: int = 0,
+    min_volume: float = 0.0,
+) -> Path:
+    """Repair every connected component separately and merge the results.
+
+    Components are written to temporary STLs and repaired on ``pool`` if
+    given (largest first), otherwise one after another in this process.
+    Fragments below ``min_faces`` or ``min_volume`` are dropped.
+    """
+    metrics = metrics or RepairMetrics()
+    merge_distance = options.get("merge_distance", MERGE_DISTANCE)
+    with metrics.stage("read"):
+        vertices, faces = read_mesh(input_path, options.get("ascii_cache", False))
+    with metrics.stage("weld"):
+        vertices, faces = weld_by_distance(vertices, faces, merge_distance)
+    with metrics.stage("split"):
+        labels, count = label_components(faces, len(vertices))
+        parts, dropped = drop_fragments(
+            split_mesh(vertices, faces, labels, count), min_faces, min_volume
+        )
+        parts.sort(key=lambda p: len(p[1]), reverse=True)
+    metrics.count("before", len(vertices), len(faces))
+    metrics.note("components", count)
+    metrics.note("dropped_fragments", dropped)
+    logger.info("{}: {} components, {} fragments dropped", input_path, count, dropped)
+
+    part_options = {**options, "suffix": "", "center": False}
+    with tempfile.TemporaryDirectory(prefix="stl-repair-parts-") as tmp:
+        jobs = []
+        with metrics.stage("write_parts"):
+            for i, (v, f) in enumerate(parts):
+                src = Path(tmp) / f"part{i}.stl"
+                write_binary_stl(src, v, f)
+                dst = Path(tmp) / f"part{i}_fixed.stl"
+                jobs.append(Job(i, src, dst, memory_mb=estimate_memory_mb(len(f))))
+        with metrics.stage("repair_parts"):
+            if pool is None:
+                results = []
+                for job in jobs:
+                    final = repair_stl(
+                        job.input_path, job.output_path, use_print_addon, **part_options
+                    )
+                    results.append(FileResult(job.input_path, Path(final), True))
+            else:
+                for job in jobs:
+                    job.options = part_options
+                    pool.submit(job)
+                done = {}
+                while len(done) < len(jobs):
+                    done.update((job.index, r) for job, r in pool.poll())
+                results = [done[i] for i in range(len(jobs))]
+        failed = [r for r in results if not r.ok]
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {len(jobs)} components failed: {failed[0].error}"
+            )
+        with metrics.stage("merge"):
+            vertices, faces = merge_meshes(
+                [load_binary_mesh(r.output_path) for r in results]
+            )
+            if options.get("center", True):
+                vertices = center_vertices(vertices, faces)
+    metrics.count("after", len(vertices), len(faces))
+    with metrics.stage("export"):
+        return write_binary_stl(output_path, vertices, faces)
+
+
+def worker_init(force_basic: bool, addon_source: AddonSource) -> dict:
+    """Pool initializer: enable the add-on once per worker process."""
+    load_bpy()
+    use_addon = False if force_basic else enable_print_addon(addon_source)
+    return {"use_addon": use_addon}
+
+
+def worker_repair(job: Job, state: dict, metrics: RepairMetrics) -> Path:
+    """Pool handler: repair one job inside a warm worker."""
+    if not job.input_path.exists():
+        raise FileNotFoundError(f"Input file does not exist: {job.input_path}")
+    return repair_stl(
+        job.input_path,
+        job.output_path,
+        state["use_addon"],
+        metrics=metrics,
+        **job.options,
+    )
+
+
+def add_repair_arguments(p: argparse.ArgumentParser):
+    """Options shared by one-off repairs and the repair service."""
+    p.add_argument(
+        "--force-basic",
+        action="store_true",
+        help="Skip attempting to use/ install 3D print add-on",
+    )
+    p.add_argument(
+        "--addon-dir",
+        type=Path,
+        help="Pre-extracted object_print3d_utils add-on (or its parent directory)",
+    )
+    p.add_argument(
+        "--addon-archive",
+        type=Path,
+        help="Local blender-addons zip to extract the 3D Print add-on from",
+    )
+    p.add_argument(
+        "--addon-cache",
+        type=Path,
+        help="Per-Blender-version add-on cache (default: ~/.cache/stl-repair/addons)",
+    )
+    p.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download the add-on; use --addon-dir, --addon-archive or cache",
+    )
+    p.add_argument(
+        "--reader",
+        choices=["native", "blender"],
+        default="native",
+        help="STL reader: NumPy (chunked binary, streamed ASCII) or "
+        "wm.stl_import (default: native)",
+    )
+    p.add_argument(
+        "--ascii-cache",
+        action="store_true",
+        help="Keep a hidden binary copy next to ASCII inputs and reuse it while "
+        "the source is unchanged",
+    )
+    p.add_argument(
+        "--no-center",
+        action="store_true",
+        help="Keep the original coordinates instead of moving the centre of "
+        "volume to the origin",
+    )
+    p.add_argument(
+        "--factory-reset",
+        action="store_true",
+        help="Reload a factory-empty scene before every file instead of only "
+        "freeing the previous file's meshes",
+    )
+    p.add_argument(
+        "--writer",
+        choices=["native", "blender"],
+        default="native",
+        help="STL writer: NumPy binary writer or wm.stl_export (default: native)",
+    )
+    p.add_argument(
+        "--engine",
+        choices=["ops", "bmesh", "ladder"],
+        default="ops",
+        help="Repair engine: add-on/edit-mode operators, direct bmesh.ops, or "
+        "a ladder that escalates per remaining defect (default: ops)",
+    )
+    p.add_argument(
+        "--merge-distance",
+        type=float,
+        default=MERGE_DISTANCE,
+        help="Weld vertices closer than this, in model units "
+        f"(default: {MERGE_DISTANCE})",
+    )
+    p.add_argument(
+        "--orient",
+        choices=["blender", "numpy"],
+        default="blender",
+        help="Fix winding and inside-out shells with Blender's operators or "
+        "by BFS over face adjacency in NumPy/SciPy before import; numpy needs "
+        "--reader native (default: blender)",
+    )
+    p.add_argument(
+        "--timeout",
+        type=float,
+        default=0.0,
+        help="Kill a repair after this many seconds and restart its worker "
+        "(default: 0, no limit)",
+    )
+    p.add_argument(
+        "--memory-limit",
+        type=float,
+        default=0.0,
+        help="Kill a repair whose worker exceeds this resident memory in MB "
+        "(Linux; default: 0, no limit)",
+    )
+    p.add_argument(
+        "--memory-budget",
+        type=float,
+        default=0.0,
+        help="Only start repairs while their estimated peak memory, summed over "
+        "running workers, stays within this many MB (default: 0, no limit)",
+    )
+    p.add_argument(
+        "--retry-cheap",
+        action="store_true",
+        help="Retry a killed repair once with the cheaper bmesh engine",
+    )
+    p.add_argument(
+        "--skip-clean",
+        action="store_true",
+        help="Validate binary STLs with NumPy first and copy already clean files "
+        "unchanged (not re-centred)",
+    )
+
+
+def check_repair_arguments(p: argparse.ArgumentParser, args):
+    """Normalise the options added by :func:`add_repair_arguments`."""
+    if args.engine == "bmesh":
+        # The bmesh engine never uses the 3D Print add-on
+        args.force_basic = True
+    if args.merge_distance < 0:
+        p.error("--merge-distance must be >= 0")
+    if min(args.timeout, args.memory_limit, args.memory_budget) < 0:
+        p.error("--timeout, --memory-limit and --memory-budget must be >= 0")
+    if args.orient == "numpy" and args.reader != "native":
+        # wm.stl_import never hands the faces to NumPy
+        p.error("--orient numpy needs --reader native")
+
+
+def parse_args(argv: list[str] | None = None):
     """Parse command line arguments."""
-    p = argparse.ArgumentParser(description="Repair a single STL file using Blender.")
-    p.add_argument("input", type=Path, help="Input STL file")
+    p = argparse.ArgumentParser(
+        description="Repair STL files using Blender. "
+        "Run 'stl-repair serve --help' for the repair service."
+    )
+    p.add_argument(
+        "inputs",
+        nargs="*",
+        type=Path,
+        metavar="input",
+        help="Input STL files, directories or glob patterns",
+    )
     p.add_argument(
         "-o",
         "--output",
         type=Path,
         help="Output STL file path (default: alongside input with suffix)",
     )
+    p.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        help="Directory for repaired files (batch mode)",
+    )
+    p.add_argument(
+        "--file-list",
+        type=Path,
+        help="Text file with one input path or glob per line",
+    )
     p.add_argument(
         "-s",
         "--suffix",
@@ -177,41 +914,598 @@ def parse_args():
         "-v", "--verbose", type=int, default=2, help="Verbosity 0-3 (default: 2)"
     )
     p.add_argument("--no-log-file", action="store_true", help="Do not write a log file")
+    add_repair_arguments(p)
     p.add_argument(
-        "--force-basic",
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parallel Blender worker processes for batch runs (default: 1)",
+    )
+    p.add_argument(
+        "--max-jobs-per-worker",
+        type=int,
+        default=0,
+        help="Recycle a worker after this many files (default: 0, never)",
+    )
+    p.add_argument(
+        "--split-components",
         action="store_true",
-        help="Skip attempting to use/ install 3D print add-on",
+        help="Repair each connected component separately (in parallel with "
+        "--jobs) and merge the results",
+    )
+    p.add_argument(
+        "--min-component-faces",
+        type=int,
+        default=0,
+        help="With --split-components, drop components with fewer faces",
+    )
+    p.add_argument(
+        "--min-component-volume",
+        type=float,
+        default=0.0,
+        help="With --split-components, drop components enclosing less volume",
+    )
+    p.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse repaired results for identical inputs from this directory",
+    )
+    p.add_argument(
+        "--cache-max-size",
+        type=float,
+        default=2048,
+        help="Cache size bound in MB, least recently used entries are evicted "
+        "(default: 2048, 0 for unbounded)",
+    )
+    p.add_argument(
+        "--metrics-json",
+        type=Path,
+        help="Append per-file stage timings, peak RSS and mesh sizes as JSON lines",
+    )
+    p.add_argument(
+        "--manifest",
+        type=Path,
+        help="SQLite job manifest; reruns skip finished files and retry failed "
+        "ones (see 'stl-repair status')",
+    )
+    p.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="With --manifest, stop retrying a file after this many failures "
+        "(default: 3)",
+    )
+    p.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=60.0,
+        help="With --manifest, seconds before a failed file is retried, doubled "
+        "after every further failure (default: 60)",
+    )
+    p.add_argument(
+        "--watch",
+        type=Path,
+        metavar="DIR",
+        help="Repair STL files as they land in DIR until interrupted; results "
+        "go to --output-dir (default: DIR/repaired)",
+    )
+    p.add_argument(
+        "--quarantine-dir",
+        type=Path,
+        help="With --watch, where failed inputs are moved (default: DIR/quarantine)",
+    )
+    p.add_argument(
+        "--done-dir",
+        type=Path,
+        help="With --watch, where repaired inputs are moved (default: DIR/done)",
+    )
+    p.add_argument(
+        "--settle",
+        type=float,
+        help="With --watch, seconds a file must stay unchanged before pickup "
+        "(default: 0 with inotify, 2 when polling)",
+    )
+    p.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll the directory instead of using inotify",
+    )
+    args = p.parse_args(argv)
+    if args.jobs < 1:
+        p.error("--jobs must be >= 1")
+    if args.watch is not None:
+        if args.inputs or args.file_list is not None or args.output is not None:
+            p.error("--watch takes no inputs, --file-list or --output")
+        if not args.watch.is_dir():
+            p.error(f"--watch directory does not exist: {args.watch}")
+        check_repair_arguments(p, args)
+        return args
+    if args.max_attempts < 1 or args.retry_backoff < 0:
+        p.error("--max-attempts must be >= 1 and --retry-backoff >= 0")
+    check_repair_arguments(p, args)
+    if not args.inputs and args.file_list is None:
+        p.error("at least one input or --file-list is required")
+    if args.output is not None and (
+        len(args.inputs) > 1 or args.file_list is not None or args.output_dir
+    ):
+        p.error("--output only applies to a single input; use --output-dir")
+    return args
+
+
+def parse_serve_args(argv: list[str] | None = None):
+    """Parse arguments of the ``serve`` subcommand."""
+    p = argparse.ArgumentParser(
+        prog="stl-repair serve",
+        description="Run a local repair service backed by warm Blender workers.",
+    )
+    p.add_argument(
+        "--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)"
+    )
+    p.add_argument("--port", type=int, default=8080, help="TCP port (default: 8080)")
+    p.add_argument(
+        "--socket",
+        type=Path,
+        help="Listen on this Unix socket instead of TCP",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=2,
+        help="Warm Blender worker processes (default: 2)",
+    )
+    p.add_argument(
+        "--max-jobs-per-worker",
+        type=int,
+        default=0,
+        help="Recycle a worker after this many files (default: 0, never)",
+    )
+    p.add_argument(
+        "--workdir",
+        type=Path,
+        help="Directory for uploaded files (default: a temporary directory)",
+    )
+    p.add_argument(
+        "--output-root",
+        type=Path,
+        help="Confine /repair outputs to this directory (relative outputs are "
+        "resolved inside it); required for /repair on non-loopback hosts",
+    )
+    add_repair_arguments(p)
+    args = p.parse_args(argv)
+    if args.jobs < 1:
+        p.error("--jobs must be >= 1")
+    check_repair_arguments(p, args)
+    return args
+
+
+def parse_analyze_args(argv: list[str] | None = None):
+    """Parse arguments of the ``analyze`` subcommand."""
+    p = argparse.ArgumentParser(
+        prog="stl-repair analyze",
+        description="Report topology defects as JSON lines, without Blender.",
+    )
+    p.add_argument("inputs", nargs="+", type=Path, metavar="input", help="STL files")
+    p.add_argument(
+        "--merge-distance",
+        type=float,
+        default=MERGE_DISTANCE,
+        help=f"Weld vertices closer than this first (default: {MERGE_DISTANCE})",
+    )
+    return p.parse_args(argv)
+
+
+def parse_status_args(argv: list[str] | None = None):
+    """Parse arguments of the ``status`` subcommand."""
+    p = argparse.ArgumentParser(
+        prog="stl-repair status",
+        description="Show the progress recorded in a job manifest.",
+    )
+    p.add_argument("manifest", type=Path, help="Manifest written with --manifest")
+    p.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    return p.parse_args(argv)
+
+
+def is_single_file(args) -> bool:
+    """Whether the invocation is the classic one-file repair."""
+    return (
+        len(args.inputs) == 1
+        and args.file_list is None
+        and args.output_dir is None
+        and args.manifest is None
+        and not args.inputs[0].is_dir()
+        and not is_glob(str(args.inputs[0]))
+    )
+
+
+def repair_options(args) -> dict:
+    """Keyword arguments for ``repair_stl`` shared by every file in a run."""
+    return {
+        "reader": args.reader,
+        "writer": args.writer,
+        "engine": args.engine,
+        "skip_clean": args.skip_clean,
+        "merge_distance": args.merge_distance,
+        "ascii_cache": args.ascii_cache,
+        "factory_reset": args.factory_reset,
+        "center": not args.no_center,
+        "orient": args.orient,
+    }
+
+
+def addon_source(args) -> AddonSource:
+    """Add-on provisioning settings from the command line."""
+    return AddonSource(
+        directory=args.addon_dir,
+        archive=args.addon_archive,
+        cache_dir=args.addon_cache,
+        offline=args.offline,
+    )
+
+
+def open_cache(args) -> ResultCache | None:
+    """Result cache configured on the command line, if any."""
+    if args.cache_dir is None:
+        return None
+    return ResultCache(args.cache_dir, int(args.cache_max_size * 1024 * 1024))
+
+
+def cache_options(args) -> dict:
+    """Options that influence the repaired output and so the cache key."""
+    options = {**repair_options(args), "force_basic": args.force_basic}
+    # Only affect speed and memory, not the output
+    del options["ascii_cache"], options["factory_reset"]
+    if args.split_components:
+        options["components"] = [args.min_component_faces, args.min_component_volume]
+    return options
+
+
+def is_supervised(args) -> bool:
+    """Whether repairs have a time or memory budget to enforce."""
+    return bool(args.timeout or args.memory_limit)
+
+
+def make_pool(args, workers: int) -> WorkerPool:
+    """Worker pool configured from the command line."""
+    return WorkerPool(
+        workers,
+        worker_repair,
+        initializer=worker_init,
+        init_args=(args.force_basic, addon_source(args)),
+        max_jobs_per_worker=args.max_jobs_per_worker,
+        timeout=args.timeout,
+        memory_limit_mb=args.memory_limit,
+        retry_options=CHEAP_RETRY if args.retry_cheap else None,
+        memory_budget_mb=args.memory_budget,
     )
-    return p.parse_args()
+
+
+def component_pool(args) -> WorkerPool | None:
+    """Warm pool for repairing components in parallel or supervised."""
+    if not args.split_components or (args.jobs < 2 and not is_supervised(args)):
+        return None
+    pool = make_pool(args, args.jobs)
+    pool.start()
+    return pool
+
+
+def file_repairer(args, options: dict, use_addon: bool, pool: WorkerPool | None):
+    """``repair(input, output, metrics)`` callable for in-process runs."""
+    if not args.split_components:
+        return lambda src, dst, m: repair_stl(src, dst, use_addon, metrics=m, **options)
+    return lambda src, dst, m: repair_components(
+        src,
+        dst,
+        options,
+        use_addon,
+        pool,
+        m,
+        args.min_component_faces,
+        args.min_component_volume,
+    )
+
+
+def result_sink(args, manifest: Manifest | None):
+    """``on_result`` callback feeding the metrics file and the manifest."""
+    sinks = []
+    if args.metrics_json:
+        sinks.append(MetricsWriter(args.metrics_json))
+    if manifest is not None:
+        sinks.append(manifest.record)
+    if not sinks:
+        return None
+
+    def on_result(result: FileResult):
+        for sink in sinks:
+            sink(result)
+
+    return on_result
+
+
+def claiming(manifest: Manifest, repair):
+    """Wrap an in-process ``repair`` so the manifest counts each attempt first."""
+
+    def claimed(input_path: Path, output_path: Path, metrics: RepairMetrics):
+        manifest.claim(input_path)
+        return repair(input_path, output_path, metrics)
+
+    return claimed
+
+
+def run_batch_cli(args):
+    """Repair every input either in-process or across a worker pool."""
+    inputs = collect_inputs(args.inputs, args.file_list)
+    if not inputs:
+        logger.error("No input files found")
+        sys.exit(1)
+    options = repair_options(args)
+    options["suffix"] = "" if args.output_dir else args.suffix
+    jobs = [
+        (path, output_path_for(path, args.suffix, args.output_dir, root))
+        for path, root in inputs
+    ]
+    order = {src: i for i, (src, _) in enumerate(jobs)}
+
+    manifest = None
+    if args.manifest is not None:
+        manifest = Manifest(args.manifest, args.max_attempts, args.retry_backoff)
+    on_result = result_sink(args, manifest)
+    rejected, jobs = reject_invalid(jobs)
+    for result in rejected:
+        if on_result is not None:
+            on_result(result)
+    if manifest is not None:
+        plan = manifest.plan(jobs, cache_options(args))
+        jobs = plan.todo
+        rejected += plan.done + plan.deferred
+        logger.info(
+            "Manifest: {} finished, {} failed and waiting, {} to repair",
+            len(plan.done),
+            len(plan.deferred),
+            len(jobs),
+        )
+    cache = open_cache(args)
+    cached, keys = [], {}
+    if cache is not None:
+        cached, jobs, keys = partition_jobs(cache, jobs, cache_options(args))
+        for result in cached:
+            if on_result is not None:
+                on_result(result)
+
+    if not jobs:
+        results = []
+    elif (args.jobs > 1 or is_supervised(args)) and not args.split_components:
+        pool = make_pool(args, min(args.jobs, len(jobs)))
+        pool_jobs = [
+            Job(i, src, dst, options, memory_mb=file_memory_mb(src))
+            for i, (src, dst) in enumerate(jobs)
+        ]
+        # Largest first: big meshes start early instead of forming the tail
+        pool_jobs.sort(key=lambda job: job.memory_mb, reverse=True)
+        results = []
+        for result in pool.run(pool_jobs):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    else:
+        pool = component_pool(args)
+        use_addon = False
+        if pool is None:
+            require_bpy()
+            if not args.force_basic:
+                use_addon = enable_print_addon(addon_source(args))
+        try:
+            repair = file_repairer(args, options, use_addon, pool)
+            if manifest is not None:
+                # A crash here takes the whole run down; count it up front
+                repair = claiming(manifest, repair)
+            results = run_batch(jobs, repair, on_result)
+        finally:
+            if pool is not None:
+                pool.close()
+    if cache is not None:
+        store_results(cache, results, keys)
+        cache.log_summary()
+    if manifest is not None:
+        manifest.close()
+    results = sorted(rejected + cached + results, key=lambda r: order[r.input_path])
+    log_summary(results)
+    if not all(r.ok for r in results):
+        sys.exit(2)
+
+
+def repair_in_process(args, output: Path, options: dict) -> FileResult:
+    """Repair the single input here (components may still use a pool)."""
+    pool = component_pool(args)
+    use_addon = False
+    if pool is None:
+        require_bpy()
+        if not args.force_basic:
+            use_addon = enable_print_addon(addon_source(args))
+            if not use_addon:
+                logger.info("Proceeding without 3D Print add-on")
+    repair = file_repairer(args, options, use_addon, pool)
+    metrics = RepairMetrics()
+    start = time.perf_counter()
+    try:
+        final_file = repair(args.input, output, metrics)
+        result = FileResult(args.input, final_file, True)
+    except Exception as e:
+        logger.exception(f"Repair failed: {e}")
+        result = FileResult(args.input, output, False, str(e))
+    finally:
+        if pool is not None:
+            pool.close()
+    result.seconds = time.perf_counter() - start
+    result.metrics = metrics.as_dict()
+    return result
+
+
+def serve_cli(args):
+    """Run the repair service until interrupted."""
+    pool = make_pool(args, args.jobs)
+    options = {**repair_options(args), "suffix": ""}
+    service = RepairService(pool, options, args.workdir, args.output_root)
+    server = make_server(service, args.host, args.port, args.socket)
+    if not server.local and args.output_root is None:
+        logger.warning(
+            "Listening on {} without --output-root: /repair requests are "
+            "refused, only /upload is served",
+            args.host,
+        )
+    # Service managers stop us with SIGTERM; shut down as for Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    service.start()
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    logger.info("Serving repairs on {} with {} warm workers", where, args.jobs)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        logger.info("Repair service stopped")
+
+
+def analyze_cli(args):
+    """Print one topology report per input as a JSON line."""
+    failed = False
+    for path in args.inputs:
+        try:
+            vertices, faces = weld_by_distance(*load_mesh(path), args.merge_distance)
+            record = {"input": str(path), **analyze_topology(vertices, faces).as_dict()}
+        except Exception as e:
+            failed = True
+            record = {"input": str(path), "error": str(e)}
+        print(json.dumps(record, sort_keys=True), flush=True)
+    if failed:
+        sys.exit(1)
+
+
+def status_cli(args):
+    """Print the progress recorded in a manifest."""
+    if not args.manifest.is_file():
+        logger.error(f"No manifest at {args.manifest}")
+        sys.exit(1)
+    manifest = Manifest(args.manifest)
+    try:
+        summary = manifest.summary()
+    finally:
+        manifest.close()
+    if args.json:
+        print(json.dumps(summary, indent=2, sort_keys=True))
+        return
+    counts = ", ".join(
+        f"{n} {status}" for status, n in sorted(summary["counts"].items())
+    )
+    print(
+        f"{summary['total']} files ({counts or 'none'}), {summary['progress']:.1%} done"
+    )
+    print(f"Repair time so far: {summary['repair_seconds']:.1f}s")
+    now = time.time()
+    for entry in summary["failed"]:
+        wait = max(0.0, entry["next_attempt"] - now)
+        print(
+            f"  {entry['status'].upper()} {entry['input']} "
+            f"(attempt {entry['attempts']}, retry in {wait:.0f}s): {entry['error']}"
+        )
+
+
+def watch_cli(args):
+    """Repair files landing in the watched directory until interrupted."""
+    output_dir = args.output_dir or args.watch / "repaired"
+    quarantine_dir = args.quarantine_dir or args.watch / "quarantine"
+    done_dir = args.done_dir or args.watch / "done"
+    watcher = DirectoryWatcher(args.watch, args.settle, use_inotify=not args.poll)
+    pool = make_pool(args, args.jobs)
+    options = {**repair_options(args), "suffix": ""}
+    folder = HotFolder(
+        watcher,
+        pool,
+        options,
+        output_dir,
+        quarantine_dir,
+        result_sink(args, None),
+        done_dir,
+    )
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    pool.start()
+    logger.info(
+        "Watching {} ({}) with {} warm workers",
+        args.watch,
+        "inotify" if watcher.uses_inotify else "polling",
+        args.jobs,
+    )
+    try:
+        folder.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.close()
+        watcher.close()
+        folder.log_summary()
 
 
 def main():
     """Main CLI entry point."""
+    if sys.argv[1:2] == ["serve"]:
+        serve_cli(parse_serve_args(sys.argv[2:]))
+        return
+    if sys.argv[1:2] == ["analyze"]:
+        analyze_cli(parse_analyze_args(sys.argv[2:]))
+        return
+    if sys.argv[1:2] == ["status"]:
+        status_cli(parse_status_args(sys.argv[2:]))
+        return
     args = parse_args()
-    if not args.input.exists():
-        logger.error("Input file does not exist: {}", args.input)
-        sys.exit(1)
+    if args.watch is not None:
+        watch_cli(args)
+        return
+    if not is_single_file(args):
+        run_batch_cli(args)
+        return
 
+    args.input = args.inputs[0]
     output = args.output
     if output is None:
         output = args.input.with_stem(args.input.stem + args.suffix)
     if output.suffix.lower() != ".stl":
         output = output.with_suffix(".stl")
-
-    logger.info(f"Repairing {args.input}")
-    use_addon = False
-    if not args.force_basic:
-        use_addon = enable_print_addon()
-        if not use_addon:
-            logger.info("Proceeding without 3D Print add-on")
-
     try:
-        final_file = repair_stl(
-            args.input, output, use_addon, "" if args.output else args.suffix
-        )
-        logger.info(f"Repaired file saved: {final_file}")
+        preflight(args.input, output)
     except Exception as e:
-        logger.exception(f"Repair failed: {e}")
+        logger.error(str(e))
+        sys.exit(1)
+
+    on_result = MetricsWriter(args.metrics_json) if args.metrics_json else None
+    cache = open_cache(args)
+    if cache is not None:
+        key = cache.key(args.input, cache_options(args))
+        if cache.fetch(key, output):
+            logger.info(f"Repaired file restored from cache: {output}")
+            if on_result is not None:
+                on_result(FileResult(args.input, output, True, metrics=CACHED))
+            return
+
+    logger.info(f"Repairing {args.input}")
+    options = {**repair_options(args), "suffix": "" if args.output else args.suffix}
+    if is_supervised(args) and not args.split_components:
+        # The watchdog lives in the pool, so even one file runs in a worker
+        (result,) = make_pool(args, 1).run([Job(0, args.input, output, options)])
+        if not result.ok:
+            logger.error(f"Repair failed: {result.error}")
+    else:
+        result = repair_in_process(args, output, options)
+    if result.ok:
+        logger.info(f"Repaired file saved: {result.output_path}")
+        if cache is not None:
+            store_results(cache, [result], {args.input: key})
+            cache.log_summary()
+    if on_result is not None:
+        on_result(result)
+    if not result.ok:
         sys.exit(2)
 
 
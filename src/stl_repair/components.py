@@ -0,0 +1,105 @@
+"""Connected-component labelling, splitting and merging of triangle meshes."""
+from __future__ import annotations
+
+import numpy as np
+
+from .geometry import signed_volume
+
+
+def union_roots(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Root (lowest member) of every node after joining each pair ``a[i], b[i]``.
+
+    Vectorised union-find: each round hooks the larger root of every pair
+    that still joins two trees onto the smaller one, then compresses paths
+    until every node points straight at its root.
+    """
+    parent = np.arange(n)
+    a, b = a.astype(np.int64), b.astype(np.int64)
+    while True:
+        ra, rb = parent[a], parent[b]
+        crossing = ra != rb
+        if not crossing.any():
+            break
+        # Pairs inside one tree stay there; only crossing pairs matter
+        a, b, ra, rb = a[crossing], b[crossing], ra[crossing], rb[crossing]
+        np.minimum.at(parent, np.maximum(ra, rb), np.minimum(ra, rb))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    return parent
+
+
+def label_components(faces: np.ndarray, n_vertices: int) -> tuple[np.ndarray, int]:
+    """Component label of every face; faces sharing a vertex are connected.
+
+    Returns ``(labels, count)`` with labels numbered from 0 in order of their
+    lowest vertex.
+    """
+    if len(faces) == 0:
+        return np.zeros(0, dtype=np.int64), 0
+    parent = union_roots(
+        n_vertices,
+        np.concatenate([faces[:, 0], faces[:, 0]]),
+        np.concatenate([faces[:, 1], faces[:, 2]]),
+    )
+    _, labels = np.unique(parent[faces[:, 0]], return_inverse=True)
+    labels = labels.reshape(-1)
+    return labels, int(labels.max()) + 1
+
+
+def split_mesh(
+    vertices: np.ndarray, faces: np.ndarray, labels: np.ndarray, count: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Compact ``(vertices, faces)`` sub-mesh for every component label."""
+    order = np.argsort(labels, kind="stable")
+    bounds = np.searchsorted(labels[order], np.arange(count + 1))
+    parts = []
+    for k in range(count):
+        sub = faces[order[bounds[k] : bounds[k + 1]]]
+        used, inverse = np.unique(sub, return_inverse=True)
+        parts.append((vertices[used], inverse.reshape(-1, 3).astype(faces.dtype)))
+    return parts
+
+
+def drop_fragments(
+    parts: list[tuple[np.ndarray, np.ndarray]],
+    min_faces: int = 0,
+    min_volume: float = 0.0,
+) -> tuple[list[tuple[np.ndarray, np.ndarray]], int]:
+    """Remove parts below ``min_faces`` faces or ``min_volume`` enclosed volume.
+
+    Volumes are taken about each part's vertex mean, so an open fragment is
+    judged the same wherever it sits. The largest part is always kept so the
+    result is never empty. Returns ``(kept, dropped_count)``.
+    """
+    if not parts or (min_faces <= 0 and min_volume <= 0):
+        return parts, 0
+
+    def volume(v: np.ndarray, f: np.ndarray) -> float:
+        points = np.asarray(v, dtype=np.float64)
+        return abs(signed_volume(points - points.mean(axis=0), f))
+
+    kept = [
+        (v, f)
+        for v, f in parts
+        if len(f) >= min_faces and (min_volume <= 0 or volume(v, f) >= min_volume)
+    ]
+    if not kept:
+        kept = [max(parts, key=lambda p: len(p[1]))]
+    return kept, len(parts) - len(kept)
+
+
+def merge_meshes(
+    parts: list[tuple[np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenate parts into one mesh, offsetting face indices."""
+    if not parts:
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.int32)
+    offsets = np.cumsum([0] + [len(v) for v, _ in parts[:-1]])
+    vertices = np.concatenate([v for v, _ in parts])
+    faces = np.concatenate(
+        [f + off for (_, f), off in zip(parts, offsets, strict=True)]
+    )
+    return vertices, faces.astype(np.int32)
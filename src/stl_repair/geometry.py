@@ -0,0 +1,262 @@
+"""Vectorized geometric helpers operating on vertex/face arrays."""
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+
+MERGE_DISTANCE = 0.0001  # Blender's default merge-by-distance threshold
+CENTROID_CHUNK = 1 << 20  # faces per chunk in volume_centroid
+WELD_ROUNDS = 16  # vectorised rounds in weld_targets before the ordered pass
+_KEEP, _MERGED, _OPEN = 0, 1, 2  # weld_targets vertex states
+
+# Neighbour cell offsets covering each unordered pair of adjacent cells once:
+# the first non-zero component is positive.
+HALF_OFFSETS = np.array(
+    [
+        off
+        for off in itertools.product((-1, 0, 1), repeat=3)
+        if any(off) and next(c for c in off if c) > 0
+    ],
+    dtype=np.int64,
+)
+CHUNK = 1 << 20
+
+
+def _hash_cells(cells: np.ndarray) -> np.ndarray:
+    """Spatial hash of integer grid cells (collisions are filtered later)."""
+    c = cells.astype(np.uint64)
+    h = c[:, 0] * np.uint64(0x9E3779B97F4A7C15)
+    h ^= c[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+    h ^= c[:, 2] * np.uint64(0x165667B19E3779F9)
+    return h
+
+
+def close_vertex_pairs(vertices: np.ndarray, distance: float) -> np.ndarray:
+    """All index pairs ``(i, j)``, ``i < j``, closer than ``distance``.
+
+    Points are bucketed into a hashed grid so only the surrounding cells need
+    to be compared. Returns an ``(m, 2)`` array.
+    """
+    points = np.asarray(vertices, dtype=np.float64)
+    n = len(points)
+    if n < 2 or distance <= 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    # Cells twice the search radius: a point only needs to look into a
+    # neighbouring cell when it lies in the half of its cell facing it.
+    scaled = points / (2 * distance)
+    cells = np.floor(scaled).astype(np.int64)
+    upper = (scaled - cells) >= 0.5
+    hashes = _hash_cells(cells)
+    order = np.argsort(hashes)
+    sorted_hashes = hashes[order]
+    limit = distance * distance
+
+    found = []
+    for start in range(0, n, CHUNK):
+        chunk = np.arange(start, min(start + CHUNK, n))
+        for off in itertools.chain([np.zeros(3, np.int64)], HALF_OFFSETS):
+            near = np.ones(len(chunk), dtype=bool)
+            for axis in np.flatnonzero(off):
+                side = upper[chunk, axis]
+                near &= side if off[axis] > 0 else ~side
+            idx = chunk[near]
+            if len(idx) == 0:
+                continue
+            target = cells[idx] + off
+            th = _hash_cells(target)
+            # Sorted queries make searchsorted cache friendly; order is irrelevant
+            q = np.argsort(th)
+            lo = np.searchsorted(sorted_hashes, th[q], "left")
+            hi = np.searchsorted(sorted_hashes, th[q], "right")
+            hit = hi > lo
+            if not hit.any():
+                continue
+            q, lo, counts = q[hit], lo[hit], (hi - lo)[hit]
+            total = int(counts.sum())
+            target = target[q]
+            i = np.repeat(idx[q], counts)
+            base = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+            j = order[base + np.arange(total)]
+            keep = np.all(cells[j] == np.repeat(target, counts, axis=0), axis=1)
+            keep &= (j > i) if not off.any() else (j != i)
+            i, j = i[keep], j[keep]
+            d2 = np.sum((points[i] - points[j]) ** 2, axis=1)
+            close = d2 <= limit
+            found.append(np.stack([i[close], j[close]], axis=1))
+    if not found:
+        return np.zeros((0, 2), dtype=np.int64)
+    pairs = np.concatenate(found)
+    return np.sort(pairs, axis=1)
+
+
+def weld_targets(vertices: np.ndarray, distance: float) -> np.ndarray:
+    """Index of the vertex each vertex merges into (itself if it is kept).
+
+    Mirrors Blender's merge by distance: vertices are visited in index order
+    and each one that has not been merged yet claims every unmerged vertex
+    within ``distance``. Merged vertices keep the claiming vertex's position,
+    so chains are not collapsed transitively.
+    """
+    n = len(vertices)
+    target = np.arange(n)
+    pairs = close_vertex_pairs(vertices, distance)
+    if len(pairs) == 0:
+        return target
+    # Candidate claimers of each vertex j, smallest index first
+    pairs = pairs[np.lexsort((pairs[:, 0], pairs[:, 1]))]
+    state = np.full(n, _KEEP, dtype=np.int8)
+    state[pairs[:, 1]] = _OPEN
+    # Each round settles at least the lowest open vertex, so a chain of
+    # near-duplicates takes one round per link; long chains are finished by
+    # a single pass in index order instead.
+    for _ in range(WELD_ROUNDS):
+        pairs = _open_pairs(pairs, state)
+        if not len(pairs):
+            return target
+        j, first = np.unique(pairs[:, 1], return_index=True)
+        claimer = pairs[first, 0]
+        decided = state[claimer] == _KEEP
+        target[j[decided]] = claimer[decided]
+        state[j[decided]] = _MERGED
+    pairs = _open_pairs(pairs, state)
+    claimers = pairs[:, 0].tolist()
+    j, first = np.unique(pairs[:, 1], return_index=True)
+    bounds = np.r_[first, len(pairs)].tolist()
+    for k, vertex in enumerate(j.tolist()):
+        # Every candidate is lower, so its own fate is already settled
+        for i in claimers[bounds[k] : bounds[k + 1]]:
+            if state[i] == _KEEP:
+                target[vertex] = i
+                state[vertex] = _MERGED
+                break
+        else:
+            state[vertex] = _KEEP
+    return target
+
+
+def _open_pairs(pairs: np.ndarray, state: np.ndarray) -> np.ndarray:
+    """Pairs still able to merge; open vertices left without one are kept."""
+    pairs = pairs[(state[pairs[:, 0]] != _MERGED) & (state[pairs[:, 1]] == _OPEN)]
+    orphans = state == _OPEN
+    orphans[pairs[:, 1]] = False
+    state[orphans] = _KEEP
+    return pairs
+
+
+def weld_by_distance(
+    vertices: np.ndarray, faces: np.ndarray, distance: float = MERGE_DISTANCE
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge vertices closer than ``distance`` and remap ``faces``.
+
+    Faces left with fewer than three distinct corners are dropped, as in
+    Blender. Returns new ``(vertices, faces)`` arrays of the input dtypes.
+    """
+    target = weld_targets(vertices, distance)
+    keep = target == np.arange(len(vertices))
+    if keep.all():
+        return vertices, faces
+    remap = np.cumsum(keep, dtype=np.int64) - 1
+    faces = remap[target[faces]].astype(faces.dtype)
+    collapsed = (
+        (faces[:, 0] == faces[:, 1])
+        | (faces[:, 1] == faces[:, 2])
+        | (faces[:, 2] == faces[:, 0])
+    )
+    return vertices[keep], faces[~collapsed]
+
+
+def degenerate_mask(
+    vertices: np.ndarray, faces: np.ndarray, tolerance: float = MERGE_DISTANCE
+) -> np.ndarray:
+    """Faces whose height over their longest edge is at most ``tolerance``.
+
+    This catches zero-area faces as well as float-rounded collinear slivers.
+    """
+    tri = np.asarray(vertices, dtype=np.float64)[faces]
+    edges = tri[:, [1, 2, 0]] - tri
+    longest = np.sqrt(np.max(np.einsum("ijk,ijk->ij", edges, edges), axis=1))
+    double_area = np.linalg.norm(np.cross(edges[:, 0], -edges[:, 2]), axis=1)
+    height = np.divide(
+        double_area, longest, out=np.zeros_like(longest), where=longest > 0
+    )
+    return height <= tolerance
+
+
+def duplicate_mask(faces: np.ndarray, n_vertices: int) -> np.ndarray:
+    """Faces using the same three vertices as an earlier face, in any order.
+
+    Each face's sorted index triple is its canonical key; one stable sort
+    groups equal keys so the first copy of every face is kept.
+    """
+    canonical = np.sort(faces, axis=1).astype(np.int64)
+    n = np.int64(max(n_vertices, 1))
+    if n <= 1 << 21:
+        # Three indices below 2**21 pack into one int64 key
+        keys = (canonical[:, 0] * n + canonical[:, 1]) * n + canonical[:, 2]
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        repeat = keys[1:] == keys[:-1]
+    else:
+        order = np.lexsort(canonical.T[::-1])
+        ranked = canonical[order]
+        repeat = (ranked[1:] == ranked[:-1]).all(axis=1)
+    mask = np.zeros(len(faces), dtype=bool)
+    mask[order[1:][repeat]] = True
+    return mask
+
+
+def drop_bad_faces(
+    vertices: np.ndarray, faces: np.ndarray, tolerance: float = MERGE_DISTANCE
+) -> tuple[np.ndarray, int, int]:
+    """Remove zero-area slivers and duplicate facets before import.
+
+    Degenerate faces are those :func:`degenerate_mask` flags; duplicates are
+    found by :func:`duplicate_mask` among the rest. Returns
+    ``(faces, degenerate, duplicates)`` with the counts removed.
+    """
+    if len(faces) == 0:
+        return faces, 0, 0
+    degenerate = degenerate_mask(vertices, faces, tolerance)
+    kept = faces[~degenerate] if degenerate.any() else faces
+    duplicate = duplicate_mask(kept, len(vertices))
+    if duplicate.any():
+        kept = kept[~duplicate]
+    return kept, int(np.count_nonzero(degenerate)), int(np.count_nonzero(duplicate))
+
+
+def signed_volume(vertices: np.ndarray, faces: np.ndarray) -> float:
+    """Signed enclosed volume; positive for outward-facing closed meshes."""
+    tri = np.asarray(vertices, dtype=np.float64)[faces]
+    return float(np.einsum("ij,ij->", tri[:, 0], np.cross(tri[:, 1], tri[:, 2]))) / 6
+
+
+def volume_centroid(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Centre of the enclosed volume; the vertex mean for flat shells.
+
+    A single signed-tetrahedron sum over the faces, taken in chunks so the
+    float64 corner copies stay small on multi-million-face meshes. The
+    tetrahedra share the vertex mean as their apex rather than the origin,
+    as Blender's median-apex centring does, so an open mesh gets the same
+    centre wherever it sits.
+    """
+    points = np.asarray(vertices, dtype=np.float64)
+    apex = points.mean(axis=0) if len(points) else np.zeros(3)
+    total, moment = 0.0, np.zeros(3)
+    for start in range(0, len(faces), CENTROID_CHUNK):
+        tri = points[faces[start : start + CENTROID_CHUNK]] - apex
+        volumes = np.einsum("ij,ij->i", tri[:, 0], np.cross(tri[:, 1], tri[:, 2]))
+        total += volumes.sum()
+        # Relative to the apex, tetrahedron (apex, a, b, c) has its centroid at
+        # (a + b + c) / 4
+        moment += volumes @ tri.sum(axis=1)
+    scale = np.ptp(points, axis=0).max() if len(faces) else 0.0
+    if abs(total) <= 1e-12 * scale**3:
+        return apex
+    return apex + moment / (4 * total)
+
+
+def center_vertices(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Translate ``vertices`` so their volume centroid sits at the origin."""
+    offset = volume_centroid(vertices, faces)
+    return (np.asarray(vertices, dtype=np.float64) - offset).astype(vertices.dtype)
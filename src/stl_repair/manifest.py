@@ -0,0 +1,231 @@
+"""Persistent SQLite manifest that makes batch runs resumable."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .batch import FileResult
+
+CHUNK_SIZE = 1 << 20
+RESUMED = {"stages": {}, "resumed": True}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    input TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    hash TEXT,
+    options TEXT,
+    output TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    seconds REAL,
+    error TEXT,
+    metrics TEXT,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    updated REAL NOT NULL
+)
+"""
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of the file contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class Plan:
+    """What a (re)run has to do, according to the manifest."""
+
+    todo: list[tuple[Path, Path]]
+    done: list[FileResult]
+    deferred: list[FileResult]
+
+
+class Manifest:
+    """Record of every input's hash, status, output, timing and error.
+
+    The database runs in WAL mode so progress can be queried from another
+    process while a batch is writing to it.
+    """
+
+    def __init__(self, path: Path, max_attempts: int = 3, backoff: float = 60.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(SCHEMA)
+        self.db.commit()
+
+    def close(self):
+        """Close the database."""
+        self.db.close()
+
+    def _row(self, input_path: Path) -> sqlite3.Row | None:
+        return self.db.execute(
+            "SELECT * FROM jobs WHERE input = ?", (str(input_path),)
+        ).fetchone()
+
+    def _fingerprint(self, input_path: Path, row: sqlite3.Row | None):
+        """``(size, mtime_ns, hash)``, rehashing only if size or mtime moved."""
+        st = input_path.stat()
+        if row is not None and (row["size"], row["mtime_ns"]) == (
+            st.st_size,
+            st.st_mtime_ns,
+        ):
+            return st.st_size, st.st_mtime_ns, row["hash"]
+        return st.st_size, st.st_mtime_ns, file_hash(input_path)
+
+    def plan(
+        self,
+        jobs: Iterable[tuple[Path, Path]],
+        options: dict[str, Any],
+        now: float | None = None,
+    ) -> Plan:
+        """Split ``jobs`` into work to do, finished work and backed-off failures.
+
+        An entry counts as finished if its input hash, options and output path
+        are unchanged and the output still exists. Failed entries are retried
+        once their backoff has elapsed, up to ``max_attempts`` times; so are
+        entries still ``running`` from a run that died while repairing them.
+        """
+        now = time.time() if now is None else now
+        key = json.dumps(options, sort_keys=True, default=str)
+        plan = Plan([], [], [])
+        for src, dst in jobs:
+            row = self._row(src)
+            size, mtime_ns, digest = self._fingerprint(src, row)
+            same = (
+                row is not None
+                and row["hash"] == digest
+                and row["options"] == key
+                and row["output"] == str(dst)
+            )
+            if same and row["status"] == "ok" and dst.exists():
+                result = FileResult(src, dst, True, seconds=row["seconds"] or 0.0)
+                result.metrics = RESUMED
+                plan.done.append(result)
+                continue
+            attempts = row["attempts"] if same else 0
+            if same and row["status"] == "running":
+                # Claimed but never recorded: the process died on this file
+                row = self._crashed(row, now)
+            if same and row["status"] not in ("ok", "pending"):
+                if attempts >= self.max_attempts or now < row["next_attempt"]:
+                    result = FileResult(src, dst, False, row["error"])
+                    result.killed = row["status"] if row["status"] != "failed" else None
+                    result.metrics = RESUMED
+                    plan.deferred.append(result)
+                    continue
+            self.db.execute(
+                "INSERT OR REPLACE INTO jobs (input, size, mtime_ns, hash, options,"
+                " output, status, attempts, next_attempt, updated)"
+                " VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, 0, ?)",
+                (str(src), size, mtime_ns, digest, key, str(dst), attempts, now),
+            )
+            plan.todo.append((src, dst))
+        self.db.commit()
+        return plan
+
+    def _crashed(self, row: sqlite3.Row, now: float) -> sqlite3.Row:
+        """Turn a stale ``running`` row into a failure backed off from its claim."""
+        attempts = row["attempts"]
+        self.db.execute(
+            "UPDATE jobs SET status = 'crashed', error = ?, next_attempt = ?,"
+            " updated = ? WHERE input = ?",
+            (
+                f"Run ended while repairing this file (attempt {attempts})",
+                row["updated"] + self.backoff * 2 ** max(attempts - 1, 0),
+                now,
+                row["input"],
+            ),
+        )
+        return self._row(Path(row["input"]))
+
+    def claim(self, input_path: Path, now: float | None = None):
+        """Mark ``input_path`` as being repaired and count the attempt.
+
+        Committed before the repair starts, so a file that takes the whole
+        process down still uses up one of its ``max_attempts``.
+        """
+        now = time.time() if now is None else now
+        self.db.execute(
+            "UPDATE jobs SET status = 'running', attempts = attempts + 1,"
+            " updated = ? WHERE input = ?",
+            (now, str(input_path)),
+        )
+        self.db.commit()
+
+    def record(self, result: FileResult, now: float | None = None):
+        """Store the outcome of one repair; failures get an exponential backoff."""
+        now = time.time() if now is None else now
+        row = self._row(result.input_path)
+        attempts = row["attempts"] if row is not None else 0
+        # Claimed repairs already counted their attempt
+        if not result.ok and (row is None or row["status"] != "running"):
+            attempts += 1
+        retry_at = 0.0 if result.ok else now + self.backoff * 2 ** (attempts - 1)
+        self.db.execute(
+            "INSERT INTO jobs (input, output, status, attempts, seconds, error,"
+            " metrics, next_attempt, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(input) DO UPDATE SET output = excluded.output,"
+            " status = excluded.status, attempts = excluded.attempts,"
+            " seconds = excluded.seconds, error = excluded.error,"
+            " metrics = excluded.metrics, next_attempt = excluded.next_attempt,"
+            " updated = excluded.updated",
+            (
+                str(result.input_path),
+                str(result.output_path),
+                result.status,
+                attempts,
+                result.seconds,
+                result.error,
+                json.dumps(result.metrics, default=str),
+                retry_at,
+                now,
+            ),
+        )
+        self.db.commit()
+
+    def summary(self) -> dict[str, Any]:
+        """Counts per status, total repair time and the failed entries."""
+        counts = dict(
+            self.db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        )
+        seconds = self.db.execute(
+            "SELECT COALESCE(SUM(seconds), 0) FROM jobs WHERE status = 'ok'"
+        ).fetchone()[0]
+        failed = [
+            {
+                "input": r["input"],
+                "status": r["status"],
+                "attempts": r["attempts"],
+                "error": r["error"],
+                "next_attempt": r["next_attempt"],
+            }
+            for r in self.db.execute(
+                "SELECT * FROM jobs WHERE status NOT IN ('ok', 'pending', 'running')"
+                " ORDER BY input"
+            )
+        ]
+        total = sum(counts.values())
+        return {
+            "total": total,
+            "counts": counts,
+            "progress": counts.get("ok", 0) / total if total else 1.0,
+            "repair_seconds": seconds,
+            "failed": failed,
+        }
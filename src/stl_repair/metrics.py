@@ -0,0 +1,149 @@
+"""Per-stage timing and resource metrics for repairs."""
+from __future__ import annotations
+
+import json
+import os
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batch import FileResult
+
+
+# Peaks of the stages currently open in this process, innermost last
+_open_peaks: list[float] = []
+
+
+def _vm_hwm_mb() -> float | None:
+    """``VmHWM`` from ``/proc/self/status`` in MB, if available."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+def reset_peak_rss() -> bool:
+    """Restart the high-water mark at the current RSS; ``False`` if unsupported.
+
+    Writing ``5`` to ``/proc/self/clear_refs`` resets ``VmHWM`` on Linux.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_mb() -> float:
+    """High-water mark of the resident set size in MB.
+
+    This is ``VmHWM`` since the last :func:`reset_peak_rss` where ``/proc``
+    has it, and the lifetime ``ru_maxrss`` elsewhere.
+    """
+    hwm = _vm_hwm_mb()
+    if hwm is not None:
+        return hwm
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def process_rss_mb(pid: int) -> float | None:
+    """Current resident set size of process ``pid`` in MB, if available.
+
+    Reads ``/proc``, so this returns ``None`` on platforms without it.
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class RepairMetrics:
+    """Collects stage timings and mesh sizes for one file."""
+
+    def __init__(self):
+        self.stages: dict[str, dict[str, float]] = {}
+        self.counts: dict[str, dict[str, int]] = {}
+        self.notes: dict[str, Any] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block as stage ``name``; failed stages are recorded too."""
+        # The mark is process-wide: fold it into enclosing stages, then
+        # restart it so this stage (and file) only sees its own peak
+        if _open_peaks:
+            current = peak_rss_mb()
+            _open_peaks[:] = [max(p, current) for p in _open_peaks]
+        _open_peaks.append(0.0)
+        reset_peak_rss()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            peak = max(_open_peaks.pop(), peak_rss_mb())
+            _open_peaks[:] = [max(p, peak) for p in _open_peaks]
+            self.stages[name] = {
+                "wall_s": round(time.perf_counter() - wall, 6),
+                "cpu_s": round(time.process_time() - cpu, 6),
+                "peak_rss_mb": round(peak, 1),
+            }
+
+    def count(self, label: str, vertices: int, faces: int):
+        """Record mesh size at a point in the pipeline (e.g. before/after)."""
+        self.counts[label] = {"vertices": vertices, "faces": faces}
+
+    def note(self, key: str, value: Any):
+        """Attach an extra JSON-serialisable field to the record."""
+        self.notes[key] = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Plain-data view suitable for pickling and JSON."""
+        return {"stages": self.stages, **self.counts, **self.notes}
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of already sorted ``values``."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def metrics_record(result: FileResult) -> dict[str, Any]:
+    """One JSON-serialisable metrics line for ``result``."""
+    record = {
+        "input": str(result.input_path),
+        "output": str(result.output_path),
+        "ok": result.ok,
+        "status": result.status,
+        "error": result.error,
+        "seconds": round(result.seconds, 6),
+    }
+    record.update(result.metrics or {"stages": {}})
+    return record
+
+
+class MetricsWriter:
+    """Appends one JSON line per file to a metrics file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __call__(self, result: FileResult):
+        line = json.dumps(metrics_record(result), sort_keys=True)
+        with open(self.path, "a") as f:
+            f.write(line + "\n")
@@ -0,0 +1,362 @@
+"""Pool of long-lived worker processes for parallel repairs.
+
+bpy is single-threaded, so throughput comes from running several Blender
+interpreters side by side. Each worker pays the ``bpy`` import and add-on
+setup once in its initializer and then runs jobs until it has handled
+``max_jobs_per_worker`` of them, after which the coordinator replaces it with
+a fresh process.
+
+The coordinator doubles as a watchdog: a job running past its wall-clock
+budget, or whose worker grows past its memory budget, is killed together with
+its worker, reported as ``timeout``/``memory`` and optionally retried once
+with cheaper options. With a memory budget, jobs are only handed out while
+the estimated peak memory of all running jobs stays within it; a job that
+does not fit lets smaller queued jobs go first.
+
+Every worker talks to the coordinator over its own pipe rather than a shared
+queue: a worker that crashes can never leave a shared lock held, and the
+coordinator always knows which job the dead process was holding, so only that
+job is failed before the worker is replaced.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .batch import FileResult
+from .metrics import RepairMetrics, process_rss_mb
+
+POLL_INTERVAL = 0.2
+MAX_INIT_FAILURES = 3
+
+
+@dataclass
+class Job:
+    """A single repair request handed to a worker."""
+
+    index: int
+    input_path: Path
+    output_path: Path
+    options: dict[str, Any] = field(default_factory=dict)
+    # Why the previous attempt was killed, if this is a retry
+    retry_of: str | None = None
+    # Estimated peak memory, checked against the pool's memory budget
+    memory_mb: float = 0.0
+
+
+@dataclass
+class _Worker:
+    proc: Any
+    conn: Connection
+    ready: bool = False
+    job: Job | None = None
+    started: float = 0.0
+
+
+def _worker_main(
+    conn: Connection,
+    initializer: Callable[..., Any] | None,
+    init_args: tuple,
+    handler: Callable[[Job, Any, RepairMetrics], Path],
+    max_jobs: int,
+):
+    """Worker loop: initialise once, then run jobs until told to stop."""
+    state = initializer(*init_args) if initializer else None
+    conn.send(("ready",))
+    done = 0
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        start = time.perf_counter()
+        metrics = RepairMetrics()
+        try:
+            final = handler(job, state, metrics)
+            result = FileResult(job.input_path, Path(final), True)
+        except Exception as e:
+            result = FileResult(job.input_path, job.output_path, False, str(e))
+        result.seconds = time.perf_counter() - start
+        result.metrics = metrics.as_dict()
+        done += 1
+        recycle = bool(max_jobs and done >= max_jobs)
+        conn.send(("done", result, recycle))
+        if recycle:
+            break
+    conn.close()
+
+
+class WorkerPool:
+    """Coordinator for a set of recyclable worker processes.
+
+    Batch callers use :meth:`run`; long-running callers :meth:`start` the pool
+    to keep every worker warm, :meth:`submit` jobs as they arrive and
+    :meth:`poll` for finished results.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        handler: Callable[[Job, Any, RepairMetrics], Path],
+        initializer: Callable[..., Any] | None = None,
+        init_args: tuple = (),
+        max_jobs_per_worker: int = 0,
+        timeout: float = 0.0,
+        memory_limit_mb: float = 0.0,
+        retry_options: dict[str, Any] | None = None,
+        memory_budget_mb: float = 0.0,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.handler = handler
+        self.initializer = initializer
+        self.init_args = init_args
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.retry_options = retry_options
+        self.memory_budget_mb = memory_budget_mb
+        # bpy is not fork-safe; always start clean interpreters
+        self._ctx = mp.get_context("spawn")
+        self._workers: dict[int, _Worker] = {}
+        self._pending: deque[Job] = deque()
+        self._next_id = 0
+        self._init_failures = 0
+        self._warm = False
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a free worker."""
+        return len(self._pending)
+
+    @property
+    def busy(self) -> int:
+        """Jobs currently held by a worker."""
+        return sum(w.job is not None for w in self._workers.values())
+
+    @property
+    def idle(self) -> int:
+        """Initialised workers without a job."""
+        return sum(w.ready and w.job is None for w in self._workers.values())
+
+    def _spawn(self):
+        worker_id = self._next_id
+        self._next_id += 1
+        conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self.initializer,
+                self.init_args,
+                self.handler,
+                self.max_jobs_per_worker,
+            ),
+            daemon=True,
+        )
+        proc.start()
+        # Drop our copy of the child's end so a dead worker reads as EOF
+        child_conn.close()
+        self._workers[worker_id] = _Worker(proc, conn)
+        logger.debug("Started worker {} (pid {})", worker_id, proc.pid)
+
+    def _top_up(self):
+        """Spawn workers until the pool has as many as it can use."""
+        if self._init_failures >= MAX_INIT_FAILURES:
+            return
+        wanted = self.workers
+        if not self._warm:
+            wanted = min(wanted, len(self._pending) + self.busy)
+        while len(self._workers) < wanted:
+            self._spawn()
+
+    def _retire(self, worker_id: int):
+        worker = self._workers.pop(worker_id, None)
+        if worker is not None:
+            worker.conn.close()
+            worker.proc.join(timeout=5)
+            if worker.proc.is_alive():
+                worker.proc.kill()
+                worker.proc.join()
+
+    def _dispatch(self):
+        for worker in self._workers.values():
+            if not self._pending:
+                return
+            if worker.ready and worker.job is None:
+                job = self._admit()
+                if job is None:
+                    return
+                worker.job = job
+                worker.started = time.monotonic()
+                worker.conn.send(worker.job)
+
+    def _admit(self) -> Job | None:
+        """Next queued job that fits the memory budget, if any."""
+        if not self.memory_budget_mb:
+            return self._pending.popleft()
+        running = [w.job for w in self._workers.values() if w.job is not None]
+        used = sum(job.memory_mb for job in running)
+        for i, job in enumerate(self._pending):
+            # A job larger than the whole budget still runs, on its own
+            if not running or used + job.memory_mb <= self.memory_budget_mb:
+                del self._pending[i]
+                return job
+        return None
+
+    def start(self):
+        """Spawn every worker now and keep them running until :meth:`close`."""
+        self._warm = True
+        self._top_up()
+
+    def submit(self, job: Job):
+        """Queue ``job`` for the next free worker."""
+        self._pending.append(job)
+
+    def poll(
+        self, timeout: float = POLL_INTERVAL, wake: Iterable[Any] = ()
+    ) -> list[tuple[Job, FileResult]]:
+        """Dispatch queued jobs and collect results finished within ``timeout``.
+
+        Readiness of any object in ``wake`` (e.g. a socket) ends the wait early.
+        """
+        self._top_up()
+        self._dispatch()
+        finished = []
+        if not self._workers and self._init_failures >= MAX_INIT_FAILURES:
+            finished.extend(self._fail_pending("No workers"))
+        conns = {w.conn: i for i, w in self._workers.items()}
+        wake = list(wake)
+        # Do not sit out the timeout when there is already something to report
+        timeout = 0 if finished else timeout
+        if not conns and not wake:
+            time.sleep(timeout)
+            return finished
+        for conn in wait(list(conns) + wake, timeout=timeout):
+            if conn not in conns:
+                continue
+            worker_id = conns[conn]
+            worker = self._workers[worker_id]
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                finished.extend(self._lost(worker_id))
+                continue
+            if msg[0] == "ready":
+                worker.ready = True
+                self._init_failures = 0
+            elif msg[0] == "done":
+                result = msg[1]
+                if worker.job.retry_of is not None:
+                    result.metrics = {
+                        **(result.metrics or {}),
+                        "retried_after": worker.job.retry_of,
+                    }
+                finished.append((worker.job, result))
+                worker.job = None
+                if msg[2]:
+                    self._retire(worker_id)
+        finished.extend(self._watchdog())
+        self._dispatch()
+        return finished
+
+    def run(self, jobs: Iterable[Job]) -> Iterator[FileResult]:
+        """Run ``jobs`` across the pool, yielding results as they finish."""
+        for job in jobs:
+            self.submit(job)
+        try:
+            while self._pending or self.busy:
+                for _, result in self.poll():
+                    yield result
+        finally:
+            self.close()
+
+    def _watchdog(self) -> list[tuple[Job, FileResult]]:
+        """Kill workers whose job ran over its time or memory budget."""
+        if not (self.timeout or self.memory_limit_mb):
+            return []
+        killed = []
+        now = time.monotonic()
+        for worker_id, worker in list(self._workers.items()):
+            job = worker.job
+            # A finished job may be waiting in the pipe; collect it next poll
+            if job is None or worker.conn.poll():
+                continue
+            elapsed = now - worker.started
+            reason = None
+            if self.timeout and elapsed > self.timeout:
+                reason, msg = "timeout", f"Timed out after {elapsed:.1f}s"
+            elif self.memory_limit_mb:
+                rss = process_rss_mb(worker.proc.pid)
+                if rss is not None and rss > self.memory_limit_mb:
+                    reason = "memory"
+                    msg = (
+                        f"Memory budget exceeded ({rss:.0f} MB > "
+                        f"{self.memory_limit_mb:.0f} MB)"
+                    )
+            if reason is None:
+                continue
+            logger.warning(
+                "Killing worker {}: {} on {}", worker_id, msg, job.input_path
+            )
+            worker.proc.kill()
+            self._retire(worker_id)
+            if self.retry_options is not None and job.retry_of is None:
+                logger.info("Retrying {} with {}", job.input_path, self.retry_options)
+                options = {**job.options, **self.retry_options}
+                self._pending.appendleft(replace(job, options=options, retry_of=reason))
+                continue
+            result = FileResult(job.input_path, job.output_path, False, msg, elapsed)
+            result.killed = reason
+            killed.append((job, result))
+        return killed
+
+    def _lost(self, worker_id: int) -> list[tuple[Job, FileResult]]:
+        """Handle a worker that went away; fail whatever it was holding."""
+        worker = self._workers[worker_id]
+        self._retire(worker_id)
+        code = worker.proc.exitcode
+        failed = []
+        if worker.job is not None:
+            logger.warning("Worker {} died with code {}", worker_id, code)
+            job = worker.job
+            msg = f"Worker crashed (exit code {code})"
+            failed.append(
+                (job, FileResult(job.input_path, job.output_path, False, msg))
+            )
+        elif not worker.ready:
+            self._init_failures += 1
+            logger.warning("Worker {} failed to start (code {})", worker_id, code)
+            if self._init_failures >= MAX_INIT_FAILURES:
+                failed.extend(self._fail_pending("No workers"))
+        return failed
+
+    def _fail_pending(self, reason: str) -> list[tuple[Job, FileResult]]:
+        failed = [
+            (j, FileResult(j.input_path, j.output_path, False, reason))
+            for j in self._pending
+        ]
+        self._pending.clear()
+        return failed
+
+    def close(self):
+        """Stop all workers."""
+        self._warm = False
+        for worker in self._workers.values():
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker_id in list(self._workers):
+            self._retire(worker_id)
@@ -0,0 +1,368 @@
+"""Local repair service: a warm worker pool behind an HTTP or Unix-socket API.
+
+Endpoints:
+
+- ``GET /health``: liveness probe
+- ``GET /stats``: queue depth, worker usage and per-job latency percentiles
+- ``POST /repair``: JSON ``{"input": path, "output": path}``; the repaired file
+  is written next to the input (or to ``output``) and a JSON result returned.
+  With an output root every output must lie inside it; without one, ``output``
+  is only accepted on loopback and Unix-socket servers
+- ``POST /upload``: raw STL request body; the repaired STL is the response
+"""
+from __future__ import annotations
+
+import ipaddress
+import itertools
+import json
+import os
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from . import __version__
+from .batch import FileResult, output_path_for, preflight
+from .budget import file_memory_mb
+from .metrics import metrics_record, percentile
+from .pool import Job, WorkerPool
+
+LATENCY_WINDOW = 1000
+MAX_UPLOAD_BYTES = 512 * 1024 * 1024
+
+
+class RepairService:
+    """Accepts jobs from any thread and runs them on a warm :class:`WorkerPool`.
+
+    A single coordinator thread owns the pool; request threads hand it jobs
+    through a lock-protected queue and wait on a future for the result.
+    ``output_root`` confines the outputs of path-based requests.
+    """
+
+    def __init__(
+        self,
+        pool: WorkerPool,
+        options: dict[str, Any] | None = None,
+        workdir: Path | None = None,
+        output_root: Path | None = None,
+    ):
+        self.pool = pool
+        self.options = dict(options or {})
+        self.output_root = Path(output_root).resolve() if output_root else None
+        self._own_workdir = workdir is None
+        self.workdir = Path(workdir or tempfile.mkdtemp(prefix="stl-repair-"))
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._inbox: list[Job] = []
+        self._tickets: dict[int, tuple[Future, float]] = {}
+        self._index = itertools.count()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._busy = 0
+        self.completed = 0
+        self.failed = 0
+        # Writing to this socket pair wakes the coordinator out of its wait
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Start the workers and the coordinator thread."""
+        self.pool.start()
+        self._thread = threading.Thread(
+            target=self._coordinate, name="stl-repair-pool", daemon=True
+        )
+        self._thread.start()
+
+    def close(self):
+        """Stop the coordinator, fail outstanding jobs and stop the workers."""
+        self._stop.set()
+        self._wake_w.send(b"x")
+        if self._thread is not None:
+            self._thread.join()
+        self.pool.close()
+        with self._lock:
+            tickets = list(self._tickets.values())
+            self._tickets.clear()
+        for future, _ in tickets:
+            future.set_exception(RuntimeError("Service stopped"))
+        self._wake_r.close()
+        self._wake_w.close()
+        if self._own_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def submit(self, input_path: Path, output_path: Path) -> Future:
+        """Queue a repair; the future resolves to ``(FileResult, latency_s)``."""
+        future: Future = Future()
+        job = Job(
+            next(self._index),
+            input_path,
+            output_path,
+            dict(self.options),
+            memory_mb=file_memory_mb(input_path),
+        )
+        with self._lock:
+            if self._stop.is_set():
+                raise RuntimeError("Service stopped")
+            self._tickets[job.index] = (future, time.perf_counter())
+            self._inbox.append(job)
+        self._wake_w.send(b"x")
+        return future
+
+    def repair(self, input_path: Path, output_path: Path) -> tuple[FileResult, float]:
+        """Submit a repair and block until it finishes."""
+        return self.submit(input_path, output_path).result()
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, worker usage and latency over the recent window."""
+        with self._lock:
+            outstanding = len(self._tickets)
+            busy = self._busy
+            latencies = sorted(self._latencies)
+            completed, failed = self.completed, self.failed
+        return {
+            "workers": self.pool.workers,
+            "busy": busy,
+            "queued": outstanding - busy,
+            "completed": completed,
+            "failed": failed,
+            "latency_s": {
+                "p50": percentile(latencies, 0.5),
+                "p95": percentile(latencies, 0.95),
+                "max": latencies[-1] if latencies else None,
+                "window": len(latencies),
+            },
+        }
+
+    def _coordinate(self):
+        """Coordinator loop: feed the pool and resolve finished tickets."""
+        while not self._stop.is_set():
+            try:
+                while self._wake_r.recv(4096):
+                    pass
+            except BlockingIOError:
+                pass
+            with self._lock:
+                inbox, self._inbox = self._inbox, []
+            for job in inbox:
+                self.pool.submit(job)
+            finished = self.pool.poll(wake=[self._wake_r])
+            with self._lock:
+                self._busy = self.pool.busy
+            for job, result in finished:
+                self._finish(job, result)
+
+    def _finish(self, job: Job, result: FileResult):
+        with self._lock:
+            ticket = self._tickets.pop(job.index, None)
+            if ticket is None:
+                return
+            latency = time.perf_counter() - ticket[1]
+            self._latencies.append(latency)
+            if result.ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+        logger.info(
+            "{} {} in {:.3f}s (repair {:.3f}s)",
+            "Repaired" if result.ok else "Failed",
+            job.input_path,
+            latency,
+            result.seconds,
+        )
+        ticket[0].set_result((result, latency))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = f"stl-repair/{__version__}"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> RepairService:
+        return self.server.service
+
+    def log_message(self, format, *args):
+        # Unix-socket clients have no address; never rely on it
+        logger.debug("HTTP {}", format % args)
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, sort_keys=True).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self, limit: int) -> bytes | None:
+        header = self.headers.get("Content-Length")
+        try:
+            length = int(header) if header is not None else None
+        except ValueError:
+            length = -1
+        # An unread body would corrupt the next request on this connection
+        self.close_connection = length is None or not 0 <= length <= limit
+        if length is None:
+            self._send_json(411, {"error": "Content-Length required"})
+            return None
+        if length < 0:
+            self._send_json(400, {"error": f"Invalid Content-Length {header!r}"})
+            return None
+        if length > limit:
+            self._send_json(413, {"error": f"Body larger than {limit} bytes"})
+            return None
+        return self.rfile.read(length)
+
+    def _output_path(self, input_path: Path, output: str | None) -> Path:
+        """Where a path-based request may write; raises PermissionError."""
+        root = self.service.output_root
+        default = output_path_for(input_path, "_fixed", None)
+        if root is None:
+            # Any client could otherwise write next to any readable file
+            if not self.server.local:
+                raise PermissionError(
+                    "Path requests are only accepted on local servers; "
+                    "start the service with --output-root"
+                )
+            return Path(output) if output else default
+        target = (root / (output or default.name)).resolve()
+        if not target.is_relative_to(root):
+            raise PermissionError(f"Output must be inside {root}")
+        return target
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "version": __version__})
+        elif path == "/stats":
+            self._send_json(200, self.service.stats())
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {path}"})
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == "/repair":
+            self._repair_path()
+        elif path == "/upload":
+            self._repair_upload()
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {path}"})
+
+    def _repair_path(self):
+        body = self._read_body(1024 * 1024)
+        if body is None:
+            return
+        try:
+            request = json.loads(body or b"{}")
+            input_path = Path(request["input"])
+            output = request.get("output")
+            if output is not None and not isinstance(output, str):
+                raise TypeError("output must be a path")
+        except (ValueError, KeyError, TypeError):
+            self._send_json(400, {"error": 'Expected JSON {"input": path}'})
+            return
+        try:
+            output_path = self._output_path(input_path, output)
+        except PermissionError as e:
+            self._send_json(403, {"error": str(e)})
+            return
+        try:
+            preflight(input_path, output_path)
+        except Exception as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            result, latency = self.service.repair(input_path, output_path)
+        except RuntimeError as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        record = {**metrics_record(result), "latency_s": round(latency, 6)}
+        self._send_json(200 if result.ok else 422, record)
+
+    def _repair_upload(self):
+        body = self._read_body(MAX_UPLOAD_BYTES)
+        if body is None:
+            return
+        name = uuid.uuid4().hex
+        input_path = self.service.workdir / f"{name}.stl"
+        output_path = self.service.workdir / f"{name}_fixed.stl"
+        try:
+            input_path.write_bytes(body)
+            preflight(input_path, output_path)
+        except Exception as e:
+            input_path.unlink(missing_ok=True)
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            try:
+                result, latency = self.service.repair(input_path, output_path)
+            except RuntimeError as e:
+                self._send_json(503, {"error": str(e)})
+                return
+            if not result.ok:
+                self._send_json(422, {"error": result.error})
+                return
+            size = result.output_path.stat().st_size
+            self.send_response(200)
+            self.send_header("Content-Type", "model/stl")
+            self.send_header("Content-Length", str(size))
+            self.send_header("X-Repair-Seconds", f"{result.seconds:.6f}")
+            self.send_header("X-Latency-Seconds", f"{latency:.6f}")
+            self.end_headers()
+            with open(result.output_path, "rb") as f:
+                shutil.copyfileobj(f, self.wfile)
+        finally:
+            input_path.unlink(missing_ok=True)
+            output_path.unlink(missing_ok=True)
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def is_loopback(host: str) -> bool:
+    """Whether ``host`` only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def make_server(
+    service: RepairService,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """HTTP server bound to ``host:port``, or to ``socket_path`` if given.
+
+    ``server.local`` records whether only this machine can connect.
+    """
+    if socket_path is not None:
+        socket_path = Path(socket_path)
+        if socket_path.is_socket():
+            socket_path.unlink()
+        server = _UnixServer(str(socket_path), _Handler)
+        os.chmod(socket_path, 0o660)
+        server.local = True
+    else:
+        server = _TCPServer((host, port), _Handler)
+        server.local = is_loopback(host)
+    server.service = service
+    return server
@@ -0,0 +1,301 @@
+"""NumPy based STL reading and writing that bypasses Blender's operators."""
+from __future__ import annotations
+
+import os
+import re
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+HEADER_SIZE = 80
+COUNT_SIZE = 4
+DEFAULT_HEADER = b"Binary STL written by stl-repair"
+ASCII_CHUNK = 16 << 20
+ASCII_FACET_BYTES = 250  # Typical size of one facet record in an ASCII STL
+ASCII_CACHE_TAG = b"stl-repair ascii cache"
+WELD_CHUNK = 1 << 20  # corners (or binary records) per slice while welding
+# "vertex x y z" records; everything else in an ASCII STL is structure
+_VERTEX = re.compile(rb"vertex\s+(\S+\s+\S+\s+\S+)")
+# One binary STL record: facet normal, three vertices, attribute byte count
+BINARY_STL_DTYPE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")]
+)
+
+
+def sniff_format(path: Path) -> str | None:
+    """Return ``"binary"``, ``"ascii"`` or ``None`` if ``path`` is not an STL.
+
+    Binary files whose size matches their facet count exactly win over a
+    ``solid`` header; longer files without one are binary with trailing data.
+    """
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        head = f.read(HEADER_SIZE + COUNT_SIZE)
+    if len(head) == HEADER_SIZE + COUNT_SIZE:
+        count = int.from_bytes(head[HEADER_SIZE:], "little")
+        expected = HEADER_SIZE + COUNT_SIZE + count * BINARY_STL_DTYPE.itemsize
+        # Binary files may also start with "solid", so trust the size first
+        if size == expected:
+            return "binary"
+    if head.lstrip().lower().startswith(b"solid"):
+        return "ascii"
+    if len(head) == HEADER_SIZE + COUNT_SIZE and size > expected:
+        # Some exporters pad or append data; Blender reads the records anyway
+        logger.warning(
+            "{} has {} bytes after its {} facets; ignoring them",
+            path,
+            size - expected,
+            count,
+        )
+        return "binary"
+    return None
+
+
+def triangle_count(path: Path) -> int:
+    """Triangles in ``path``: exact from a binary header, estimated for ASCII."""
+    kind = sniff_format(path)
+    if kind == "binary":
+        with open(path, "rb") as f:
+            f.seek(HEADER_SIZE)
+            return int.from_bytes(f.read(COUNT_SIZE), "little")
+    if kind == "ascii":
+        return path.stat().st_size // ASCII_FACET_BYTES
+    return 0
+
+
+def _hash_rows(keys: np.ndarray) -> np.ndarray:
+    """Mix three ``uint32`` columns into one ``uint64`` sort key."""
+    k = keys.astype(np.uint64)
+    h = k[:, 0] * np.uint64(0x9E3779B97F4A7C15)
+    h ^= k[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+    h ^= k[:, 2] * np.uint64(0x165667B19E3779F9)
+    return h
+
+
+def _weld_points(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Weld a contiguous ``(3n, 3)`` float32 corner array into indexed faces.
+
+    Hashes, group starts and the collision check are computed in
+    ``WELD_CHUNK`` slices, so apart from ``points`` only one key and one
+    index per corner are alive at the peak.
+    """
+    keys = points.view(np.uint32)
+    n = len(points)
+    hashes = np.empty(n, dtype=np.uint64)
+    for start in range(0, n, WELD_CHUNK):
+        hashes[start : start + WELD_CHUNK] = _hash_rows(
+            keys[start : start + WELD_CHUNK]
+        )
+    order = np.argsort(hashes)
+    first = np.empty(n, dtype=bool)
+    first[0] = True
+    collision = False
+    for start in range(1, n, WELD_CHUNK):
+        # One corner of overlap compares each slice with its predecessor
+        idx = order[start - 1 : start + WELD_CHUNK]
+        ranked = keys[idx]
+        new = np.any(ranked[1:] != ranked[:-1], axis=1)
+        first[start : start + len(new)] = new
+        # A new group inside a run of equal hashes is a hash collision
+        h = hashes[idx]
+        collision = collision or bool(np.any(new & (h[1:] == h[:-1])))
+    del hashes
+    if collision:
+        # Fall back to an exact lexicographic sort in that (very rare) case
+        order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0]))
+        ranked = keys[order]
+        np.any(ranked[1:] != ranked[:-1], axis=1, out=first[1:])
+        del ranked
+    ranks = np.cumsum(first, dtype=np.int32)
+    ranks -= 1
+    inverse = np.empty(n, dtype=np.int32)
+    inverse[order] = ranks
+    del ranks
+    vertices = points[order[first]]
+    return vertices, inverse.reshape(-1, 3)
+
+
+def weld_triangles(triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge bit-identical corners of a ``(n, 3, 3)`` triangle soup.
+
+    Returns ``(vertices, faces)`` with ``float32`` vertices of shape ``(v, 3)``
+    and ``int32`` vertex indices of shape ``(n, 3)``.
+    """
+    # Adding 0.0 folds -0.0 onto 0.0 so both weld together
+    points = np.ascontiguousarray(triangles, dtype=np.float32).reshape(-1, 3) + 0.0
+    if len(points) == 0:
+        return points.reshape(0, 3), np.zeros((0, 3), dtype=np.int32)
+    return _weld_points(points)
+
+
+def load_binary_mesh(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """Read a binary STL into welded ``(vertices, faces)`` arrays.
+
+    Records are read ``WELD_CHUNK`` at a time straight into the corner array
+    rather than memory-mapped, so file pages do not stay resident while the
+    mesh is welded.
+    """
+    with open(path, "rb") as f:
+        f.seek(HEADER_SIZE)
+        count = int.from_bytes(f.read(COUNT_SIZE), "little")
+        points = np.empty((3 * count, 3), dtype=np.float32)
+        done = 0
+        while done < count:
+            records = np.fromfile(
+                f, dtype=BINARY_STL_DTYPE, count=min(WELD_CHUNK, count - done)
+            )
+            if not len(records):
+                raise ValueError(f"Truncated binary STL: {path}")
+            corners = records["vertices"].reshape(-1, 3)
+            points[3 * done : 3 * done + len(corners)] = corners
+            done += len(records)
+    if count == 0:
+        return points, np.zeros((0, 3), dtype=np.int32)
+    # Adding 0.0 folds -0.0 onto 0.0 so both weld together
+    points += 0.0
+    return _weld_points(points)
+
+
+def read_ascii_stl(
+    path: Path,
+    chunk_size: int = ASCII_CHUNK,
+    progress: Callable[[int, int], None] | None = None,
+) -> np.ndarray:
+    """Stream the triangles of an ASCII STL into an ``(n, 3, 3)`` array.
+
+    The file is read in ``chunk_size`` blocks cut at line ends, so transient
+    memory stays bounded regardless of file size. The output buffer is
+    preallocated from the file size and grown if that estimate is too small.
+    ``progress(bytes_read, total_bytes)`` is called after every block.
+    """
+    total = path.stat().st_size
+    buffer = np.empty(max(total // ASCII_FACET_BYTES, 1) * 9, dtype=np.float32)
+    used = 0
+    done = 0
+    rest = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            done += len(block)
+            data = rest + block
+            if block:
+                cut = data.rfind(b"\n") + 1
+                data, rest = data[:cut], data[cut:]
+            else:
+                rest = b""
+            tokens = b" ".join(_VERTEX.findall(data)).split()
+            if tokens:
+                try:
+                    values = np.array(tokens, dtype=np.float32)
+                except ValueError as e:
+                    raise ValueError(f"Malformed vertex in {path}: {e}") from None
+                if used + len(values) > len(buffer):
+                    grown = np.empty(
+                        max(2 * len(buffer), used + len(values)), np.float32
+                    )
+                    grown[:used] = buffer[:used]
+                    buffer = grown
+                buffer[used : used + len(values)] = values
+                used += len(values)
+            if progress is not None:
+                progress(done, total)
+            if not block:
+                break
+    if used % 9:
+        raise ValueError(f"Incomplete facet in {path}")
+    return buffer[:used].reshape(-1, 3, 3)
+
+
+def _ascii_cache_header(path: Path) -> bytes:
+    """Header tying a binary cache to the exact size and mtime of ``path``."""
+    st = path.stat()
+    return ASCII_CACHE_TAG + b" %d %d" % (st.st_size, st.st_mtime_ns)
+
+
+def ascii_cache_path(path: Path) -> Path:
+    """Hidden binary copy next to ``path`` (not picked up as an ``.stl`` input)."""
+    return path.with_name(f".{path.name}.bin")
+
+
+def load_ascii_mesh(
+    path: Path,
+    cache: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read an ASCII STL into welded ``(vertices, faces)`` arrays.
+
+    With ``cache`` a binary STL copy is written next to the source and reused
+    while the source's size and modification time are unchanged.
+    """
+    cached = ascii_cache_path(path)
+    header = _ascii_cache_header(path)
+    if cache and cached.exists():
+        with open(cached, "rb") as f:
+            stored = f.read(HEADER_SIZE).rstrip(b"\0")
+        if stored == header:
+            return load_binary_mesh(cached)
+    triangles = read_ascii_stl(path, progress=progress)
+    if cache:
+        points = triangles.reshape(-1, 3)
+        try:
+            write_binary_stl(
+                cached, points, np.arange(len(points)).reshape(-1, 3), header
+            )
+        except OSError:
+            pass  # A read-only source directory only costs the cache
+    return weld_triangles(triangles)
+
+
+def load_mesh(
+    path: Path,
+    ascii_cache: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read a binary or ASCII STL into welded ``(vertices, faces)`` arrays."""
+    kind = sniff_format(path)
+    if kind == "binary":
+        return load_binary_mesh(path)
+    if kind == "ascii":
+        return load_ascii_mesh(path, ascii_cache, progress)
+    raise ValueError(f"Not an STL file: {path}")
+
+
+def face_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Unit normals of each triangle; degenerate faces get a zero normal."""
+    tri = vertices[faces]
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    return normals
+
+
+def write_binary_stl(
+    path: Path,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    header: bytes = DEFAULT_HEADER,
+) -> Path:
+    """Write indexed triangles as a binary STL to exactly ``path``.
+
+    The file is written to a temporary name in the same directory and moved
+    into place, so concurrent writers never see partial files.
+    """
+    vertices = np.asarray(vertices, dtype=np.float32)
+    records = np.zeros(len(faces), dtype=BINARY_STL_DTYPE)
+    records["normal"] = face_normals(vertices, faces)
+    records["vertices"] = vertices[faces]
+    head = header[:HEADER_SIZE].ljust(HEADER_SIZE, b"\0")
+    head += np.uint32(len(faces)).tobytes()
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(head)
+            f.write(records.data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
@@ -0,0 +1,98 @@
+"""Synthetic meshes with controlled defects for tests and benchmarks."""
+from __future__ import annotations
+
+import numpy as np
+
+
+def torus(triangles: int, radius: float = 40.0, tube: float = 10.0):
+    """Closed, outward-facing torus with roughly ``triangles`` faces.
+
+    Returns ``(vertices, faces)``.
+    """
+    m = max(3, int(np.sqrt(triangles / 8)))  # tube segments
+    n = max(3, triangles // (2 * m))  # ring segments
+    u = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    v = np.linspace(0, 2 * np.pi, m, endpoint=False)
+    uu, vv = np.meshgrid(u, v, indexing="ij")
+    ring = radius + tube * np.cos(vv)
+    vertices = np.stack(
+        [ring * np.cos(uu), ring * np.sin(uu), tube * np.sin(vv)], axis=-1
+    ).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(n), np.arange(m), indexing="ij")
+    a = i * m + j
+    b = ((i + 1) % n) * m + j
+    c = ((i + 1) % n) * m + (j + 1) % m
+    d = i * m + (j + 1) % m
+    faces = np.concatenate(
+        [np.stack([a, b, c], -1).reshape(-1, 3), np.stack([a, c, d], -1).reshape(-1, 3)]
+    )
+    return vertices.astype(np.float32), faces.astype(np.int32)
+
+
+def defective_mesh(
+    triangles: int,
+    duplicates: float = 0.01,
+    holes: int = 8,
+    flipped: float = 0.01,
+    non_manifold: int = 8,
+    degenerate: int = 8,
+    jitter: float = 1e-5,
+    seed: int = 0,
+):
+    """Torus with injected defects.
+
+    ``duplicates`` and ``flipped`` are fractions of faces; the other defect
+    amounts are absolute counts. Near-duplicate vertices are offset by
+    ``jitter``, which should be below the merge distance. Returns
+    ``(vertices, faces, applied)`` where ``applied`` counts each defect.
+    """
+    rng = np.random.default_rng(seed)
+    vertices, faces = torus(triangles)
+    vertices = list(vertices.reshape(1, -1, 3))
+    faces = faces.copy()
+    applied = {}
+
+    # Holes: drop random faces; adjacent drops open one larger hole
+    drop = rng.choice(len(faces), size=min(holes, len(faces) // 4), replace=False)
+    faces = np.delete(faces, drop, axis=0)
+    applied["holes"] = len(drop)
+
+    # Flipped normals
+    flip = rng.random(len(faces)) < flipped
+    faces[flip] = faces[flip, ::-1]
+    applied["flipped"] = int(flip.sum())
+
+    # Near-duplicate vertices: re-point one corner to a jittered copy
+    count = len(vertices[0])
+    dup = np.flatnonzero(rng.random(len(faces)) < duplicates)
+    corner = rng.integers(0, 3, size=len(dup))
+    originals = faces[dup, corner]
+    offsets = rng.normal(size=(len(dup), 3))
+    offsets *= jitter / np.linalg.norm(offsets, axis=1, keepdims=True)
+    vertices.append((vertices[0][originals] + offsets).astype(np.float32))
+    faces[dup, corner] = count + np.arange(len(dup))
+    count += len(dup)
+    applied["duplicates"] = len(dup)
+
+    # Corners may now point at the jittered copies as well. Those sit within
+    # the weld radius of their originals, so a fin or sliver built on one
+    # only shares its edge with the torus once the mesh is welded.
+    points = np.concatenate(vertices)
+
+    # Non-manifold edges: fins sharing an existing edge with a new apex
+    base = faces[rng.choice(len(faces), size=non_manifold, replace=False)]
+    apex = points[base[:, 0]] + rng.normal(scale=1.0, size=(non_manifold, 3))
+    vertices.append(apex.astype(np.float32))
+    fins = np.stack([base[:, 0], base[:, 1], count + np.arange(non_manifold)], 1)
+    count += non_manifold
+    applied["non_manifold"] = non_manifold
+
+    # Degenerate triangles: collinear corners on existing edges
+    base = faces[rng.choice(len(faces), size=degenerate, replace=False)]
+    mid = (points[base[:, 0]] + points[base[:, 1]]) / 2
+    vertices.append(mid.astype(np.float32))
+    slivers = np.stack([base[:, 0], count + np.arange(degenerate), base[:, 1]], 1)
+    applied["degenerate"] = degenerate
+
+    faces = np.concatenate([faces, fins, slivers]).astype(np.int32)
+    return np.concatenate(vertices), faces, applied
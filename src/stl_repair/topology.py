@@ -0,0 +1,162 @@
+"""Edge-table topology analysis: boundary, manifold and non-manifold edges."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from .geometry import signed_volume
+
+LARGEST_LOOPS = 10
+
+
+@dataclass
+class EdgeTable:
+    """Sorted unique undirected edges and how many faces use each.
+
+    ``inverse`` maps the ``3 * F`` face edges (in ``half_edges`` order) to
+    their row in ``edges``.
+    """
+
+    edges: np.ndarray
+    counts: np.ndarray
+    inverse: np.ndarray
+
+    @property
+    def boundary(self) -> np.ndarray:
+        return self.counts == 1
+
+    @property
+    def manifold(self) -> np.ndarray:
+        return self.counts == 2
+
+    @property
+    def non_manifold(self) -> np.ndarray:
+        return self.counts > 2
+
+
+def half_edges(faces: np.ndarray) -> np.ndarray:
+    """Directed edges ``(a, b)`` of every face, three per face in order."""
+    return faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+
+
+def edge_table(faces: np.ndarray, n_vertices: int) -> EdgeTable:
+    """Build the :class:`EdgeTable` with one sort over packed edge keys."""
+    half = half_edges(faces)
+    n = np.int64(max(n_vertices, 1))
+    keys = half.min(axis=1) * n + half.max(axis=1)
+    unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    edges = np.stack([unique // n, unique % n], axis=1)
+    return EdgeTable(edges, counts, inverse.reshape(-1))
+
+
+def inconsistent_edges(faces: np.ndarray, table: EdgeTable) -> int:
+    """Directed edges used twice, i.e. neighbours wound in opposite senses.
+
+    Counted from the edge table without a second sort: an edge is traversed
+    low-to-high by ``forward`` faces and high-to-low by the rest.
+    """
+    half = half_edges(faces)
+    forward = np.bincount(
+        table.inverse, weights=half[:, 0] < half[:, 1], minlength=len(table.edges)
+    )
+    backward = table.counts - forward
+    return int(np.count_nonzero(forward > 1) + np.count_nonzero(backward > 1))
+
+
+def boundary_loops(faces: np.ndarray, table: EdgeTable) -> list[np.ndarray]:
+    """Vertex sequences around each hole, in the winding of the faces.
+
+    Boundary half-edges are grouped by start vertex with one sort and then
+    chained end-to-start, visiting each once. Where a non-manifold vertex or
+    inconsistent winding leaves no continuation the chain is returned open.
+    """
+    half = half_edges(faces)
+    border = half[table.boundary[table.inverse]]
+    if not len(border):
+        return []
+    border = border[np.argsort(border[:, 0], kind="stable")]
+    starts = border[:, 0]
+    first = np.searchsorted(starts, border[:, 1], "left").tolist()
+    stop = np.searchsorted(starts, border[:, 1], "right").tolist()
+    # Next candidate out of each start-vertex group, indexed by group start
+    cursor = list(range(len(border)))
+    used = [False] * len(border)
+    vertex = starts.tolist()
+    loops = []
+    for seed in range(len(border)):
+        if used[seed]:
+            continue
+        loop, e = [], seed
+        while True:
+            used[e] = True
+            loop.append(vertex[e])
+            g = first[e]
+            c = cursor[g]
+            while c < stop[e] and used[c]:
+                c += 1
+            cursor[g] = c
+            if c == stop[e]:
+                break
+            e = c
+        loops.append(np.array(loop, dtype=np.int64))
+    return loops
+
+
+@dataclass
+class TopologyReport:
+    """Machine-readable result of :func:`analyze_topology`."""
+
+    vertices: int
+    faces: int
+    edges: int = 0
+    boundary_edges: int = 0
+    manifold_edges: int = 0
+    non_manifold_edges: int = 0
+    inconsistent_edges: int = 0
+    boundary_loops: int = 0
+    largest_loops: list[int] = field(default_factory=list)
+    inverted: bool = False
+
+    def defects(self) -> set[str]:
+        """Defect classes present: holes, non_manifold, winding, inverted."""
+        found = set()
+        if self.boundary_loops:
+            found.add("holes")
+        if self.non_manifold_edges:
+            found.add("non_manifold")
+        if self.inconsistent_edges:
+            found.add("winding")
+        if self.inverted:
+            found.add("inverted")
+        return found
+
+    def as_dict(self) -> dict:
+        """Plain-data view including the defect classes."""
+        return {**asdict(self), "defects": sorted(self.defects())}
+
+
+def analyze_topology(vertices: np.ndarray, faces: np.ndarray) -> TopologyReport:
+    """Classify the edges of an indexed triangle mesh and find its holes.
+
+    ``largest_loops`` holds the vertex counts of the biggest holes. Expects
+    welded vertices: an unwelded triangle soup is all boundary.
+    """
+    report = TopologyReport(vertices=len(vertices), faces=len(faces))
+    if len(faces) == 0:
+        return report
+    table = edge_table(faces, len(vertices))
+    report.edges = len(table.edges)
+    report.boundary_edges = int(np.count_nonzero(table.boundary))
+    report.manifold_edges = int(np.count_nonzero(table.manifold))
+    report.non_manifold_edges = int(np.count_nonzero(table.non_manifold))
+    report.inconsistent_edges = inconsistent_edges(faces, table)
+    if report.boundary_edges:
+        sizes = sorted(
+            (len(loop) for loop in boundary_loops(faces, table)), reverse=True
+        )
+        report.boundary_loops = len(sizes)
+        report.largest_loops = sizes[:LARGEST_LOOPS]
+    elif not report.non_manifold_edges and not report.inconsistent_edges:
+        report.inverted = bool(signed_volume(vertices, faces) < 0)
+    return report
@@ -0,0 +1,87 @@
+"""Fast NumPy checks deciding whether a mesh needs repair at all."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from .geometry import MERGE_DISTANCE, close_vertex_pairs, degenerate_mask, signed_volume
+from .topology import edge_table, inconsistent_edges
+
+
+@dataclass
+class CleanReport:
+    """Defect counts found by :func:`check_mesh`."""
+
+    vertices: int
+    faces: int
+    boundary_edges: int = 0
+    non_manifold_edges: int = 0
+    inconsistent_edges: int = 0
+    degenerate_faces: int = 0
+    duplicate_vertices: int = 0
+    inverted: bool = False
+
+    @property
+    def clean(self) -> bool:
+        """True when no defect was found."""
+        return self.faces > 0 and not self.problems()
+
+    def problems(self) -> list[str]:
+        """Human-readable list of defects."""
+        found = [
+            f"{n} {label}"
+            for n, label in [
+                (self.boundary_edges, "boundary edges"),
+                (self.non_manifold_edges, "non-manifold edges"),
+                (self.inconsistent_edges, "edges with inconsistent winding"),
+                (self.degenerate_faces, "zero-area faces"),
+                (self.duplicate_vertices, "duplicate vertex pairs"),
+            ]
+            if n
+        ]
+        if self.inverted:
+            found.append("normals point inwards")
+        if self.faces == 0:
+            found.append("no faces")
+        return found
+
+    def reasons(self) -> list[str]:
+        """Why the mesh was (or was not) considered clean."""
+        if not self.clean:
+            return self.problems()
+        return [
+            "every edge is shared by exactly two faces",
+            "winding is consistent and normals point outwards",
+            "no zero-area faces",
+            "no vertices closer than the merge distance",
+        ]
+
+    def as_dict(self) -> dict:
+        """Plain-data view including the verdict."""
+        return {**asdict(self), "clean": self.clean, "reasons": self.reasons()}
+
+
+def check_mesh(
+    vertices: np.ndarray, faces: np.ndarray, merge_distance: float = MERGE_DISTANCE
+) -> CleanReport:
+    """Validate an indexed triangle mesh without touching Blender."""
+    report = CleanReport(vertices=len(vertices), faces=len(faces))
+    if len(faces) == 0:
+        return report
+    # Each edge of a closed 2-manifold is shared by exactly two faces
+    table = edge_table(faces, len(vertices))
+    report.boundary_edges = int(np.count_nonzero(table.boundary))
+    report.non_manifold_edges = int(np.count_nonzero(table.non_manifold))
+    # Consistent winding: neighbours traverse a shared edge in opposite
+    # directions, so no directed edge may appear twice
+    report.inconsistent_edges = inconsistent_edges(faces, table)
+
+    report.degenerate_faces = int(
+        np.count_nonzero(degenerate_mask(vertices, faces, merge_distance))
+    )
+    report.duplicate_vertices = len(close_vertex_pairs(vertices, merge_distance))
+    closed = not (report.boundary_edges or report.non_manifold_edges)
+    if closed and not report.inconsistent_edges:
+        report.inverted = signed_volume(vertices, faces) < 0
+    return report
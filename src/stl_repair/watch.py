@@ -0,0 +1,324 @@
+"""Hot-folder ingestion: repair STL files as they finish landing in a directory."""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import itertools
+import os
+import shutil
+import struct
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .batch import FileResult, output_path_for, preflight
+from .budget import file_memory_mb
+from .metrics import percentile
+from .pool import POLL_INTERVAL, Job, WorkerPool
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+_EVENT = struct.Struct("iIII")
+
+SCAN_INTERVAL = 1.0
+SCAN_SETTLE = 2.0
+
+
+class _Inotify:
+    """Minimal inotify binding via ctypes; raises OSError where unavailable."""
+
+    def __init__(self, directory: Path):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (OSError, AttributeError, TypeError) as e:
+            raise OSError(f"inotify unavailable: {e}") from e
+        self.fd = init(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO
+        if add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def read(self) -> tuple[list[str], bool]:
+        """Names of files written or moved in, and whether events were lost."""
+        names, overflow = [], False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return names, overflow
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                elif name:
+                    names.append(os.fsdecode(name))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """Reports STL files in ``directory`` once they are completely written.
+
+    With inotify a file is a candidate when it is closed after writing or
+    moved in; without it the directory is rescanned every ``poll_interval``.
+    A candidate is ready once its size and mtime have not changed for
+    ``settle`` seconds (default: 0 with inotify, 2 when polling).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        settle: float | None = None,
+        poll_interval: float = SCAN_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._inotify = None
+        if use_inotify:
+            try:
+                self._inotify = _Inotify(directory)
+            except OSError as e:
+                logger.warning("Falling back to polling {}: {}", directory, e)
+        if settle is None:
+            settle = 0.0 if self._inotify is not None else SCAN_SETTLE
+        self.settle = settle
+        self._pending: dict[Path, tuple[tuple[int, int], float]] = {}
+        self._seen: dict[Path, tuple[int, int]] = {}
+        self._next_scan = 0.0
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def fileno(self) -> int | None:
+        """inotify descriptor to wait on, if any."""
+        return self._inotify.fileno() if self._inotify is not None else None
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+
+    def timeout(self, now: float | None = None) -> float:
+        """Seconds until something may become ready without a new event."""
+        now = time.monotonic() if now is None else now
+        deadlines = [since + self.settle for _, since in self._pending.values()]
+        if self._inotify is None:
+            deadlines.append(self._next_scan)
+        return max(0.0, min(deadlines, default=now + SCAN_INTERVAL) - now)
+
+    def _signature(self, path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _touch(self, path: Path, now: float):
+        if path.name.startswith(".") or path.suffix.lower() != ".stl":
+            return
+        sig = self._signature(path)
+        if sig is None or sig == self._seen.get(path):
+            return
+        if self._pending.get(path, (None,))[0] != sig:
+            self._pending[path] = (sig, now)
+
+    def forget(self, path: Path):
+        """Stop remembering ``path``, e.g. after it was moved away."""
+        self._seen.pop(path, None)
+
+    def _scan(self, now: float):
+        self._seen = {p: sig for p, sig in self._seen.items() if p.exists()}
+        for path in self.directory.iterdir():
+            if path.is_file():
+                self._touch(path, now)
+        self._next_scan = now + self.poll_interval
+
+    def ready(self, now: float | None = None) -> list[Path]:
+        """Files that finished landing since the last call."""
+        now = time.monotonic() if now is None else now
+        if self._inotify is None:
+            if now >= self._next_scan:
+                self._scan(now)
+        elif not self._next_scan:
+            # Files that arrived before we started watching
+            self._scan(now)
+        else:
+            names, overflow = self._inotify.read()
+            if overflow:
+                logger.warning(
+                    "inotify queue overflowed; rescanning {}", self.directory
+                )
+                self._scan(now)
+            for name in names:
+                self._touch(self.directory / name, now)
+        ready = []
+        for path, (sig, since) in list(self._pending.items()):
+            current = self._signature(path)
+            if current is None:
+                del self._pending[path]
+            elif current != sig:
+                self._pending[path] = (current, now)
+            elif now - since >= self.settle:
+                del self._pending[path]
+                self._seen[path] = sig
+                ready.append(path)
+        return sorted(ready)
+
+
+def move_into(path: Path, directory: Path) -> Path:
+    """Move ``path`` into ``directory``, timestamping the name on a clash."""
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / path.name
+    if target.exists():
+        target = target.with_stem(f"{target.stem}-{time.strftime('%Y%m%d-%H%M%S')}")
+    shutil.move(path, target)
+    return target
+
+
+def quarantine(path: Path, quarantine_dir: Path, error: str | None) -> Path:
+    """Move ``path`` into ``quarantine_dir`` with an ``.error.txt`` beside it."""
+    target = move_into(path, quarantine_dir)
+    target.with_name(target.name + ".error.txt").write_text(f"{error}\n")
+    return target
+
+
+class HotFolder:
+    """Feeds files from a :class:`DirectoryWatcher` into a warm worker pool.
+
+    Repaired files go to ``output_dir``; inputs that fail pre-flight checks or
+    repair are moved to ``quarantine_dir``, and finished inputs to
+    ``done_dir`` so the hot folder only holds pending work. Without a
+    ``done_dir`` they stay put and are remembered instead. Every result
+    carries ``latency_s``, the time from pickup to the output being written.
+    """
+
+    def __init__(
+        self,
+        watcher: DirectoryWatcher,
+        pool: WorkerPool,
+        options: dict[str, Any],
+        output_dir: Path,
+        quarantine_dir: Path,
+        on_result: Callable[[FileResult], None] | None = None,
+        done_dir: Path | None = None,
+    ):
+        self.watcher = watcher
+        self.done_dir = done_dir
+        self.pool = pool
+        self.options = options
+        self.output_dir = output_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.quarantine_dir = quarantine_dir
+        self.on_result = on_result
+        self._index = itertools.count()
+        self._picked: dict[int, float] = {}
+        self.latencies: list[float] = []
+        self.completed = 0
+        self.failed = 0
+
+    def _pick_up(self, path: Path):
+        output = output_path_for(path, "", self.output_dir)
+        try:
+            if output.exists() and output.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                logger.debug("Already repaired: {}", path)
+                self._retire(path)
+                return
+            preflight(path, output)
+        except Exception as e:
+            logger.error("Rejected {}: {}", path, e)
+            self._finish(FileResult(path, output, False, str(e)), time.perf_counter())
+            return
+        job = Job(
+            next(self._index),
+            path,
+            output,
+            dict(self.options),
+            memory_mb=file_memory_mb(path),
+        )
+        self._picked[job.index] = time.perf_counter()
+        logger.info("Picked up {}", path)
+        self.pool.submit(job)
+
+    def _finish(self, result: FileResult, picked: float):
+        latency = time.perf_counter() - picked
+        result.metrics = {**(result.metrics or {}), "latency_s": round(latency, 6)}
+        if result.ok:
+            self.completed += 1
+            self.latencies.append(latency)
+            logger.info("Repaired {} in {:.3f}s", result.output_path, latency)
+            self._retire(result.input_path)
+        else:
+            self.failed += 1
+            self._quarantine(result)
+        if self.on_result is not None:
+            self.on_result(result)
+
+    def _retire(self, path: Path):
+        """Move a finished input to ``done_dir`` and stop tracking it."""
+        if self.done_dir is None or not path.exists():
+            return
+        try:
+            move_into(path, self.done_dir)
+        except OSError as e:
+            # Still remembered by the watcher, so it is not picked up again
+            logger.error("Could not move {} to {}: {}", path, self.done_dir, e)
+            return
+        self.watcher.forget(path)
+
+    def _quarantine(self, result: FileResult):
+        path = result.input_path
+        if not path.exists():
+            self.watcher.forget(path)
+            return
+        try:
+            target = quarantine(path, self.quarantine_dir, result.error)
+        except OSError as e:
+            logger.error("Could not quarantine {} ({}): {}", path, result.error, e)
+            return
+        self.watcher.forget(path)
+        logger.error("Quarantined {}: {}", target, result.error)
+
+    def step(self, timeout: float | None = None):
+        """Pick up ready files and collect results, waiting at most ``timeout``."""
+        for path in self.watcher.ready():
+            self._pick_up(path)
+        if timeout is None:
+            # Wake at least as often as the pool's watchdog needs
+            timeout = min(self.watcher.timeout(), POLL_INTERVAL)
+        wake = [self.watcher] if self.watcher.fileno() is not None else []
+        for job, result in self.pool.poll(timeout=timeout, wake=wake):
+            self._finish(result, self._picked.pop(job.index))
+
+    def run(self, should_stop: Callable[[], bool] = lambda: False):
+        """Process files until ``should_stop`` returns true."""
+        while not should_stop():
+            self.step()
+
+    def log_summary(self):
+        latencies = sorted(self.latencies)
+        logger.info(
+            "Watch summary: {} repaired, {} quarantined, latency p50 {} p95 {}",
+            self.completed,
+            self.failed,
+            f"{percentile(latencies, 0.5):.3f}s" if latencies else "-",
+            f"{percentile(latencies, 0.95):.3f}s" if latencies else "-",
+        )
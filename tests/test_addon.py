@@ -0,0 +1,41 @@
+"""Tests for offline add-on provisioning."""
+
+import zipfile
+
+import pytest
+
+from stl_repair.addon import ADDON_NAME, AddonSource, provision_addon
+
+
+def make_archive(path):
+    """Zip laid out like the blender-addons repository."""
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(f"blender-addons-main/{ADDON_NAME}/__init__.py", "bl_info = {}\n")
+        zf.writestr(f"blender-addons-main/{ADDON_NAME}/ops.py", "# ops\n")
+        zf.writestr("blender-addons-main/other_addon/__init__.py", "")
+    return path
+
+
+def test_archive_is_extracted_into_version_cache(tmp_path):
+    """Only the add-on is extracted, and later calls hit the cache."""
+    archive = make_archive(tmp_path / "addons.zip")
+    source = AddonSource(archive=archive, cache_dir=tmp_path / "cache")
+    path = provision_addon(source, "4.1.0")
+    assert path == tmp_path / "cache" / "4.1.0" / ADDON_NAME
+    assert sorted(p.name for p in path.iterdir()) == ["__init__.py", "ops.py"]
+    assert not (tmp_path / "cache" / "4.1.0" / "other_addon").exists()
+
+    archive.unlink()
+    cached = AddonSource(cache_dir=tmp_path / "cache", offline=True)
+    assert provision_addon(cached, "4.1.0") == path
+
+
+def test_directory_and_offline(tmp_path):
+    """A pre-extracted directory is used as is; offline never downloads."""
+    addon = tmp_path / "addons" / ADDON_NAME
+    addon.mkdir(parents=True)
+    (addon / "__init__.py").write_text("")
+    assert provision_addon(AddonSource(directory=tmp_path / "addons"), "4.1") == addon
+
+    with pytest.raises(FileNotFoundError):
+        provision_addon(AddonSource(cache_dir=tmp_path / "c", offline=True), "4.1")
@@ -0,0 +1,75 @@
+"""Tests for batch input collection and failure isolation."""
+
+from pathlib import Path
+
+from stl_repair.batch import collect_inputs, output_path_for, reject_invalid, run_batch
+
+ASCII_STL = "solid part\nendsolid part\n"
+
+
+def test_collect_inputs(tmp_path):
+    """Directories, globs and file lists expand to unique STL inputs."""
+    (tmp_path / "sub").mkdir()
+    for name in ["a.stl", "b.STL", "sub/c.stl", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+    listing = tmp_path / "list.txt"
+    listing.write_text(f"# parts\n{tmp_path / 'a.stl'}\n\n")
+
+    found = collect_inputs([tmp_path, str(tmp_path / "*.stl")], listing)
+    names = sorted(p.name for p, _ in found)
+    assert names == ["a.stl", "b.STL", "c.stl"]
+    assert all(root == tmp_path for _, root in found)
+
+
+def test_output_path_for(tmp_path):
+    """Output paths honour suffix, output dir and relative layout."""
+    src = tmp_path / "in" / "sub" / "part.stl"
+    assert output_path_for(src, "_fixed", None) == src.with_name("part_fixed.stl")
+    out = tmp_path / "out"
+    assert output_path_for(src, "_fixed", out) == out / "part.stl"
+    assert output_path_for(src, "_fixed", out, tmp_path / "in") == (
+        out / "sub" / "part.stl"
+    )
+
+
+def test_run_batch_isolates_failures(tmp_path):
+    """One failing file does not stop the others."""
+    good = tmp_path / "good.stl"
+    bad = tmp_path / "bad.stl"
+    good.write_text(ASCII_STL)
+    bad.write_text(ASCII_STL)
+
+    def repair(src: Path, dst: Path, metrics) -> Path:
+        if src == bad:
+            raise RuntimeError("broken mesh")
+        dst.write_bytes(b"ok")
+        return dst
+
+    jobs = [(p, tmp_path / "out" / p.name) for p in [bad, tmp_path / "gone.stl", good]]
+    results = run_batch(jobs, repair)
+    assert [r.ok for r in results] == [False, False, True]
+    assert results[0].error == "broken mesh"
+    assert (tmp_path / "out" / "good.stl").read_bytes() == b"ok"
+
+
+def test_reject_invalid(tmp_path):
+    """Missing, non-STL and unwritable jobs are rejected up front."""
+    good = tmp_path / "good.stl"
+    good.write_text(ASCII_STL)
+    junk = tmp_path / "junk.stl"
+    junk.write_bytes(b"not a mesh")
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    jobs = [
+        (good, tmp_path / "out" / "deep" / "good.stl"),
+        (tmp_path / "gone.stl", tmp_path / "gone_fixed.stl"),
+        (junk, tmp_path / "junk_fixed.stl"),
+        (good, blocker / "good.stl"),
+    ]
+    rejected, remaining = reject_invalid(jobs)
+    assert remaining == jobs[:1]
+    assert [r.input_path for r in rejected] == [tmp_path / "gone.stl", junk, good]
+    assert "Not an STL file" in rejected[1].error
+    assert "not writable" in rejected[2].error
+    # Passing jobs get their output directory, whichever writer runs next
+    assert (tmp_path / "out" / "deep").is_dir()
@@ -0,0 +1,56 @@
+"""Tests for the content-addressed result cache."""
+
+import os
+
+from stl_repair.batch import FileResult
+from stl_repair.cache import ResultCache, partition_jobs, store_results
+
+
+def test_key_depends_on_content_and_options(tmp_path):
+    """Same bytes and options give the same key; any change alters it."""
+    cache = ResultCache(tmp_path / "cache")
+    a = tmp_path / "a.stl"
+    b = tmp_path / "b.stl"
+    a.write_bytes(b"mesh")
+    b.write_bytes(b"mesh")
+    assert cache.key(a, {"x": 1}) == cache.key(b, {"x": 1})
+    assert cache.key(a, {"x": 1}) != cache.key(a, {"x": 2})
+    b.write_bytes(b"other")
+    assert cache.key(a, {"x": 1}) != cache.key(b, {"x": 1})
+
+
+def test_partition_and_store(tmp_path):
+    """Misses are repaired and stored, then served as hits."""
+    cache = ResultCache(tmp_path / "cache")
+    src = tmp_path / "in.stl"
+    src.write_bytes(b"broken")
+    dst = tmp_path / "out" / "in.stl"
+
+    hits, todo, keys = partition_jobs(cache, [(src, dst)], {})
+    assert hits == [] and todo == [(src, dst)]
+    dst.parent.mkdir()
+    dst.write_bytes(b"repaired")
+    store_results(cache, [FileResult(src, dst, True)], keys)
+
+    dst.unlink()
+    hits, todo, _ = partition_jobs(cache, [(src, dst)], {})
+    assert len(hits) == 1 and todo == []
+    assert dst.read_bytes() == b"repaired"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction(tmp_path):
+    """The least recently used entry goes first when over the bound."""
+    cache = ResultCache(tmp_path / "cache", max_bytes=20)
+    src = tmp_path / "src.stl"
+    src.write_bytes(b"x" * 10)
+    for i, key in enumerate(["aa1", "bb2", "cc3"]):
+        cache.store(key, src)
+        entry = cache._entry(key)
+        os.utime(entry, (i, i))
+        if key == "bb2":
+            # Touch "aa1" so "bb2" becomes the oldest
+            cache.fetch("aa1", tmp_path / "hit.stl")
+    assert cache._entry("aa1").exists()
+    assert not cache._entry("bb2").exists()
+    assert cache._entry("cc3").exists()
@@ -1,8 +1,10 @@
 """Tests for STL repair CLI."""
 
-import pytest
+import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 
 def test_imports():
@@ -15,7 +17,164 @@ def test_imports():
     # These would require integration tests with Blender installed
 
 
+def test_import_does_not_load_bpy():
+    """Importing the CLI module leaves Blender unloaded."""
+    from stl_repair import cli
+
+    assert "bpy" not in sys.modules or cli.bpy is sys.modules["bpy"]
+
+
 def test_parse_args():
-    """Test argument parsing (would need to mock bpy for full test)."""
-    # This would require mocking bpy to test properly
-    pass
+    """Test argument parsing."""
+    from stl_repair.cli import is_single_file, parse_args
+
+    argv = ["stl-repair", "part.stl", "--engine", "bmesh", "-j", "4"]
+    with patch.object(sys, "argv", argv):
+        args = parse_args()
+    assert args.inputs == [Path("part.stl")]
+    assert args.force_basic and args.jobs == 4
+    assert is_single_file(args)
+
+    with patch.object(sys, "argv", ["stl-repair", "a.stl", "b.stl", "-o", "x.stl"]):
+        with pytest.raises(SystemExit):
+            parse_args()
+
+    argv = ["stl-repair", "a.stl", "--orient", "numpy", "--reader", "blender"]
+    with patch.object(sys, "argv", argv), pytest.raises(SystemExit):
+        parse_args()
+
+
+def test_ladder_covers_every_defect_class():
+    """Each defect the analyzer reports has a rung that needs no add-on."""
+    from stl_repair.cli import LADDER
+
+    kinds = {"holes", "non_manifold", "winding", "inverted"}
+    assert kinds == set().union(*(r.fixes for r in LADDER if not r.addon))
+    # The add-on is the most expensive fallback, so it comes last
+    assert [r.addon for r in LADDER][-1] and not any(r.addon for r in LADDER[:-1])
+
+
+def test_basic_repair_skip_reports_leftover_defects():
+    """Skipping basic repair is only called "no defects" when that is true."""
+    from loguru import logger
+
+    from stl_repair.cli import nothing_to_fix
+
+    messages = []
+    sink = logger.add(messages.append, format="{level} {message}")
+    try:
+        assert nothing_to_fix(False, set(), "basic mesh repair")
+        assert nothing_to_fix(False, {"non_manifold"}, "basic mesh repair")
+        assert not nothing_to_fix(False, {"holes", "non_manifold"}, "x")
+        assert not nothing_to_fix(True, set(), "x")
+    finally:
+        logger.remove(sink)
+    assert messages[0].startswith("INFO No topology defects")
+    assert messages[1].startswith("WARNING") and "non_manifold" in messages[1]
+
+
+def test_blender_reader_with_skip_clean_still_welds_and_centres(tmp_path):
+    """Precheck arrays are not reused when wm.stl_import reads the raw file."""
+    from stl_repair import cli
+    from stl_repair.stl_io import write_binary_stl
+    from stl_repair.synth import defective_mesh
+
+    source = tmp_path / "part.stl"
+    write_binary_stl(source, *defective_mesh(2000, seed=3)[:2])
+    argv = ["stl-repair", str(source), "--reader", "blender", "--skip-clean"]
+    with patch.object(sys, "argv", argv):
+        options = cli.repair_options(cli.parse_args())
+    with (
+        patch.object(cli, "load_bpy"),
+        patch.object(cli, "release_scene"),
+        patch.object(cli, "import_stl", return_value=MagicMock()) as import_stl,
+        patch.object(cli, "center_object") as center_object,
+        patch.object(cli, "basic_mesh_repair") as repair,
+        patch.object(cli, "export_stl"),
+    ):
+        cli.repair_stl(source, tmp_path / "out.stl", False, "", **options)
+    assert import_stl.call_args.args[1:] == ("blender", None)
+    center_object.assert_called_once()
+    # weld=True: Blender must merge by distance, and no defects are assumed
+    assert repair.call_args.args[1:] == (options["merge_distance"], True, None)
+
+
+def test_main_rejects_bad_input_without_blender(tmp_path):
+    """A missing input fails before Blender is loaded."""
+    from stl_repair import cli
+
+    argv = ["stl-repair", str(tmp_path / "missing.stl")]
+    with patch.object(sys, "argv", argv), patch.object(cli, "load_bpy") as load:
+        with pytest.raises(SystemExit) as exc:
+            cli.main()
+    assert exc.value.code == 1
+    load.assert_not_called()
+
+
+def test_rerun_after_a_crash_reports_the_crashed_file(tmp_path):
+    """A manifest row left running by a dead run shows up in the summary."""
+    from loguru import logger
+
+    from stl_repair import cli
+    from stl_repair.manifest import Manifest
+    from stl_repair.stl_io import write_binary_stl
+    from stl_repair.synth import defective_mesh
+
+    source = tmp_path / "part.stl"
+    write_binary_stl(source, *defective_mesh(200, seed=1)[:2])
+    db = tmp_path / "run.db"
+    argv = ["stl-repair", str(source), "--manifest", str(db)]
+    with patch.object(sys, "argv", argv):
+        options = cli.cache_options(cli.parse_args())
+    manifest = Manifest(db)
+    manifest.plan([(source, tmp_path / "part_fixed.stl")], options)
+    # The previous run died while repairing the file
+    manifest.claim(source)
+    manifest.close()
+
+    messages = []
+    sink = logger.add(messages.append, format="{message}")
+    try:
+        with (
+            patch.object(sys, "argv", argv),
+            patch.object(cli, "load_bpy") as load,
+            pytest.raises(SystemExit) as exc,
+        ):
+            cli.main()
+    finally:
+        logger.remove(sink)
+    assert exc.value.code == 2
+    load.assert_not_called()
+    assert any(m.startswith(f"CRSH {source}") for m in messages)
+
+
+def test_repeated_repairs_do_not_grow_rss(tmp_path):
+    """Meshes are freed between files: RSS stays flat over 1,000 repairs."""
+    pytest.importorskip("bpy")
+    import os
+
+    import numpy as np
+
+    from stl_repair.cli import repair_stl
+    from stl_repair.metrics import process_rss_mb
+    from stl_repair.stl_io import write_binary_stl
+
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+    faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]], dtype=np.int32)
+    # Many disjoint copies give each file enough data for a leak to show
+    copies = 2000
+    offsets = np.repeat(np.arange(copies, dtype=np.float32) * 2, len(vertices))
+    tiled = np.tile(vertices, (copies, 1))
+    tiled[:, 0] += offsets
+    tiled_faces = np.concatenate([faces + i * len(vertices) for i in range(copies)])
+    src = write_binary_stl(tmp_path / "part.stl", tiled, tiled_faces)
+    dst = tmp_path / "part_fixed.stl"
+
+    def repair(n):
+        for _ in range(n):
+            repair_stl(src, dst, False, "", engine="bmesh")
+
+    repair(50)  # warm up allocator pools and operator caches
+    baseline = process_rss_mb(os.getpid())
+    repair(1000)
+    assert process_rss_mb(os.getpid()) - baseline < 25
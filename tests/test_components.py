@@ -0,0 +1,76 @@
+"""Tests for connected-component splitting and per-component repair."""
+
+import shutil
+
+import numpy as np
+
+from stl_repair.components import (
+    drop_fragments,
+    label_components,
+    merge_meshes,
+    split_mesh,
+)
+from stl_repair.pool import WorkerPool
+from stl_repair.stl_io import load_binary_mesh, write_binary_stl
+from stl_repair.synth import torus
+
+
+def copy_handler(job, state, metrics):
+    """Stand-in repair that leaves each component unchanged."""
+    shutil.copyfile(job.input_path, job.output_path)
+    return job.output_path
+
+
+def _assembly(shells: int, seed: int = 0):
+    """Shuffled mesh of ``shells`` tori plus one single-triangle fragment."""
+    parts = [torus(200) for _ in range(shells)]
+    parts = [(v + np.float32(100 * k), f) for k, (v, f) in enumerate(parts)]
+    parts.append((np.eye(3, dtype=np.float32) * 1000, np.array([[0, 1, 2]])))
+    vertices, faces = merge_meshes(parts)
+    perm = np.random.default_rng(seed).permutation(len(vertices))
+    return vertices[perm], np.argsort(perm)[faces].astype(np.int32)
+
+
+def test_label_and_split():
+    """Shuffled shells are found again and split into compact meshes."""
+    vertices, faces = _assembly(5)
+    labels, count = label_components(faces, len(vertices))
+    assert count == 6
+    parts = split_mesh(vertices, faces, labels, count)
+    assert sorted(len(f) for _, f in parts) == [1] + [len(torus(200)[1])] * 5
+    for v, f in parts:
+        assert f.min() == 0 and f.max() == len(v) - 1
+
+    kept, dropped = drop_fragments(parts, min_faces=2)
+    assert (len(kept), dropped) == (5, 1)
+    kept, dropped = drop_fragments(parts, min_volume=1e9)
+    assert (len(kept), dropped) == (1, 5)
+
+
+def test_fragment_volume_does_not_depend_on_position():
+    """An open fragment is dropped or kept the same wherever it sits."""
+    sliver = np.array([[0, 0, 0], [10, 0, 0], [0, 10, 0]], dtype=np.float32)
+    for offset in [0.0, 1000.0, -5e4]:
+        parts = [torus(400), (sliver + np.float32(offset), np.array([[0, 1, 2]]))]
+        kept, dropped = drop_fragments(parts, min_volume=1.0)
+        assert (len(kept), dropped) == (1, 1)
+
+
+def test_repair_components_on_pool(tmp_path):
+    """Components are repaired on the pool, fragments dropped, then merged."""
+    from stl_repair.cli import repair_components
+
+    vertices, faces = _assembly(4)
+    src = tmp_path / "assembly.stl"
+    write_binary_stl(src, vertices, faces)
+    pool = WorkerPool(2, copy_handler)
+    pool.start()
+    try:
+        out = repair_components(
+            src, tmp_path / "out.stl", {"center": False}, pool=pool, min_faces=2
+        )
+    finally:
+        pool.close()
+    merged_v, merged_f = load_binary_mesh(out)
+    assert len(merged_f) == len(faces) - 1
+    assert label_components(merged_f, len(merged_v))[1] == 4
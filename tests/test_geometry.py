@@ -0,0 +1,100 @@
+"""Tests for the NumPy geometry helpers."""
+
+import numpy as np
+
+from stl_repair import geometry
+from stl_repair.geometry import (
+    center_vertices,
+    drop_bad_faces,
+    duplicate_mask,
+    volume_centroid,
+    weld_by_distance,
+    weld_targets,
+)
+from stl_repair.synth import defective_mesh, torus
+from stl_repair.validate import check_mesh
+
+
+def test_weld_targets_follow_index_order():
+    """The first unmerged vertex claims its neighbours; chains do not collapse."""
+    points = np.array([[0, 0, 0], [0.8, 0, 0], [1.6, 0, 0], [0.5, 0, 0]], float)
+    assert weld_targets(points, 1.0).tolist() == [0, 0, 2, 0]
+
+
+def test_long_chains_weld_in_index_order(monkeypatch):
+    """A 32k-link chain of near-duplicates pairs up without one round per link."""
+    points = np.zeros((32_000, 3))
+    points[:, 0] = np.arange(len(points)) * 0.6e-4
+    pairs = np.arange(len(points)) // 2 * 2
+    assert (weld_targets(points, 1e-4) == pairs).all()
+
+    rng = np.random.default_rng(2)
+    cloud = rng.random((300, 3)) * 0.3
+    expected = weld_targets(cloud, 0.05)
+    # The ordered pass alone gives the same answer as the vectorised rounds
+    monkeypatch.setattr(geometry, "WELD_ROUNDS", 0)
+    assert (weld_targets(cloud, 0.05) == expected).all()
+
+
+def test_weld_by_distance_removes_near_duplicates():
+    """Jittered copies merge back and collapsed faces are dropped."""
+    vertices, faces, applied = defective_mesh(20_000, seed=1)
+    welded, remapped = weld_by_distance(vertices, faces, 1e-4)
+    assert len(welded) == len(vertices) - applied["duplicates"]
+    assert remapped.dtype == faces.dtype and remapped.max() < len(welded)
+    assert check_mesh(welded, remapped).duplicate_vertices == 0
+
+    tri = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1e-5, 0, 0]], np.float32)
+    _, kept = weld_by_distance(tri, np.array([[0, 1, 2], [0, 3, 2]]), 1e-4)
+    assert kept.tolist() == [[0, 1, 2]]
+
+
+def test_drop_bad_faces_removes_slivers_and_duplicates():
+    """Slivers go, and only the first copy of a repeated face is kept."""
+    vertices, faces, applied = defective_mesh(20_000, seed=2)
+    vertices, faces = weld_by_distance(vertices, faces)
+    # Re-add faces rotated and reversed; both are the same facet
+    copies = np.concatenate([faces[:50], np.roll(faces[50:80], 1, axis=1)])
+    doubled = np.concatenate([faces, copies[:, ::-1]])
+    kept, degenerate, duplicates = drop_bad_faces(vertices, doubled)
+    assert (degenerate, duplicates) == (applied["degenerate"], len(copies))
+    assert len(kept) == len(faces) - degenerate
+    assert check_mesh(vertices, kept).degenerate_faces == 0
+    assert np.array_equal(kept[:50], faces[:50])
+    # Huge vertex counts fall back from packed keys to a lexsort
+    assert np.array_equal(
+        duplicate_mask(doubled, len(vertices)), duplicate_mask(doubled, 1 << 22)
+    )
+
+
+def test_center_vertices_moves_volume_centroid_to_origin(monkeypatch):
+    """The signed-tetrahedron centroid is exact and independent of chunking."""
+    vertices, faces = torus(5000)
+    shifted = (vertices + np.array([100, -20, 3], np.float32)).astype(np.float32)
+    assert np.allclose(volume_centroid(shifted, faces), [100, -20, 3], atol=1e-3)
+    monkeypatch.setattr(geometry, "CENTROID_CHUNK", 7)
+    assert np.allclose(volume_centroid(shifted, faces), [100, -20, 3], atol=1e-3)
+    centered = center_vertices(shifted, faces)
+    assert centered.dtype == np.float32
+    assert np.allclose(volume_centroid(centered, faces), 0, atol=1e-3)
+    # Flat shells fall back to the vertex mean
+    flat = np.array([[0, 0, 0], [2, 0, 0], [0, 2, 0]], np.float32)
+    assert np.allclose(volume_centroid(flat, np.array([[0, 1, 2]])), [2 / 3, 2 / 3, 0])
+
+
+def test_open_mesh_centroid_does_not_depend_on_position():
+    """Translating an open mesh moves its centroid by the same offset."""
+    vertices, faces = torus(5000)
+    vertices = vertices.astype(np.float64)
+    # Cut a hole: drop every face touching the +x side of the ring
+    faces = faces[~(vertices[faces][:, :, 0] > 0.8 * vertices[:, 0].max()).any(1)]
+    offset = np.array([100.0, -20.0, 3.0])
+    here = volume_centroid(vertices, faces)
+    there = volume_centroid(vertices + offset, faces)
+    np.testing.assert_allclose(there - offset, here, atol=1e-6)
+    # Centring a shifted copy puts it at the same place as the original
+    np.testing.assert_allclose(
+        center_vertices(vertices + offset, faces),
+        center_vertices(vertices, faces),
+        atol=1e-9,
+    )
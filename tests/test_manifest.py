@@ -0,0 +1,107 @@
+"""Tests for the resumable job manifest."""
+
+import sqlite3
+
+from stl_repair.batch import FileResult
+from stl_repair.manifest import Manifest
+
+OPTIONS = {"engine": "ops"}
+
+
+def _jobs(tmp_path, names):
+    jobs = []
+    for name in names:
+        src = tmp_path / f"{name}.stl"
+        if not src.exists():
+            src.write_bytes(name.encode() * 100)
+        jobs.append((src, tmp_path / f"{name}_fixed.stl"))
+    return jobs
+
+
+def test_rerun_skips_finished_and_backs_off_failed(tmp_path):
+    """Finished files are skipped; failures wait out an exponential backoff."""
+    jobs = _jobs(tmp_path, ["a", "b"])
+    manifest = Manifest(tmp_path / "run.db", max_attempts=3, backoff=10)
+    plan = manifest.plan(jobs, OPTIONS, now=0)
+    assert plan.todo == jobs and not plan.done
+    (a, a_out), (b, b_out) = jobs
+    a_out.write_bytes(b"ok")
+    manifest.record(FileResult(a, a_out, True, seconds=1.5), now=1)
+    manifest.record(FileResult(b, b_out, False, "boom"), now=1)
+
+    plan = manifest.plan(jobs, OPTIONS, now=5)
+    assert [r.input_path for r in plan.done] == [a]
+    assert [r.error for r in plan.deferred] == ["boom"] and not plan.todo
+
+    plan = manifest.plan(jobs, OPTIONS, now=12)
+    assert plan.todo == [(b, b_out)]
+    manifest.record(FileResult(b, b_out, False, "boom"), now=12)
+    # Second failure doubles the wait
+    assert manifest.plan(jobs, OPTIONS, now=25).deferred
+    assert manifest.plan(jobs, OPTIONS, now=33).todo == [(b, b_out)]
+    manifest.record(FileResult(b, b_out, False, "boom"), now=33)
+    # Out of attempts: never retried again
+    assert manifest.plan(jobs, OPTIONS, now=1e9).deferred
+
+    summary = manifest.summary()
+    assert summary["counts"] == {"ok": 1, "failed": 1}
+    assert summary["failed"][0]["attempts"] == 3
+    manifest.close()
+
+
+def test_changes_invalidate_finished_entries(tmp_path):
+    """New content, options or a missing output mean the file is repaired again."""
+    jobs = _jobs(tmp_path, ["a"])
+    ((src, dst),) = jobs
+    manifest = Manifest(tmp_path / "run.db")
+    manifest.plan(jobs, OPTIONS)
+    dst.write_bytes(b"ok")
+    manifest.record(FileResult(src, dst, True))
+    assert manifest.plan(jobs, OPTIONS).done
+    assert manifest.plan(jobs, {"engine": "bmesh"}).todo
+    manifest.record(FileResult(src, dst, True))
+    manifest.plan(jobs, {"engine": "bmesh"})
+
+    src.write_bytes(b"changed")
+    assert manifest.plan(jobs, {"engine": "bmesh"}).todo
+    manifest.record(FileResult(src, dst, True))
+    dst.unlink()
+    assert manifest.plan(jobs, {"engine": "bmesh"}).todo
+    manifest.close()
+
+
+def test_crashing_file_uses_up_its_attempts(tmp_path):
+    """A file left running by a dead process is backed off, then given up on."""
+    jobs = _jobs(tmp_path, ["a", "b"])
+    (a, a_out), (b, b_out) = jobs
+    manifest = Manifest(tmp_path / "run.db", max_attempts=2, backoff=10)
+    for now in [0, 20]:
+        assert (a, a_out) in manifest.plan(jobs, OPTIONS, now).todo
+        manifest.claim(a, now=now)
+        # The process dies here, before anything is recorded
+        plan = manifest.plan(jobs, OPTIONS, now=now + 1)
+        assert [r.input_path for r in plan.deferred] == [a]
+        assert plan.deferred[0].status == "crashed"
+        assert (b, b_out) in plan.todo
+    assert manifest.plan(jobs, OPTIONS, now=1e9).deferred[0].input_path == a
+    summary = manifest.summary()
+    assert summary["failed"][0]["attempts"] == 2
+    assert summary["failed"][0]["status"] == "crashed"
+    # A claimed repair that fails normally is counted once
+    manifest.claim(b, now=0)
+    manifest.record(FileResult(b, b_out, False, "boom"), now=1)
+    assert manifest._row(b)["attempts"] == 1
+    manifest.close()
+
+
+def test_progress_readable_while_open(tmp_path):
+    """Another connection sees recorded results while the batch holds the db."""
+    jobs = _jobs(tmp_path, ["a", "b"])
+    manifest = Manifest(tmp_path / "run.db")
+    manifest.plan(jobs, OPTIONS)
+    manifest.record(FileResult(*jobs[0], True))
+    with sqlite3.connect(tmp_path / "run.db") as reader:
+        rows = dict(reader.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"))
+    assert rows == {"ok": 1, "pending": 1}
+    assert Manifest(tmp_path / "run.db").summary()["progress"] == 0.5
+    manifest.close()
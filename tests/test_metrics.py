@@ -0,0 +1,59 @@
+"""Tests for per-stage metrics."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stl_repair.batch import FileResult
+from stl_repair.metrics import MetricsWriter, RepairMetrics, reset_peak_rss
+
+
+def test_stage_records_failures():
+    """Stages are timed even when they raise."""
+    metrics = RepairMetrics()
+    with metrics.stage("import"):
+        sum(range(1000))
+    with pytest.raises(RuntimeError), metrics.stage("repair"):
+        raise RuntimeError("boom")
+    metrics.count("before", 8, 12)
+    data = metrics.as_dict()
+    assert set(data["stages"]) == {"import", "repair"}
+    assert data["stages"]["import"]["wall_s"] >= 0
+    assert data["stages"]["import"]["peak_rss_mb"] > 0
+    assert data["before"] == {"vertices": 8, "faces": 12}
+
+
+@pytest.mark.skipif(not reset_peak_rss(), reason="needs /proc/self/clear_refs")
+def test_peak_rss_is_per_stage():
+    """A large earlier stage does not inflate later stages' peaks."""
+    metrics = RepairMetrics()
+    with metrics.stage("repair_parts"):
+        with metrics.stage("big"):
+            block = np.ones(50_000_000)  # 400 MB
+            del block
+        with metrics.stage("small"):
+            sum(range(1000))
+    with metrics.stage("export"):
+        pass
+    peaks = {name: s["peak_rss_mb"] for name, s in metrics.stages.items()}
+    assert peaks["big"] > peaks["small"] + 300
+    assert peaks["export"] < peaks["big"] - 300
+    # Enclosing stages still see their nested stages' peaks
+    assert peaks["repair_parts"] >= peaks["big"]
+
+
+def test_metrics_writer_jsonl(tmp_path):
+    """One JSON line is appended per file."""
+    writer = MetricsWriter(tmp_path / "m" / "metrics.jsonl")
+    metrics = RepairMetrics()
+    metrics.count("after", 4, 2)
+    writer(
+        FileResult(Path("a.stl"), Path("a_fixed.stl"), True, metrics=metrics.as_dict())
+    )
+    writer(FileResult(Path("b.stl"), Path("b_fixed.stl"), False, "bad"))
+    lines = [json.loads(x) for x in writer.path.read_text().splitlines()]
+    assert [x["input"] for x in lines] == ["a.stl", "b.stl"]
+    assert lines[0]["after"] == {"vertices": 4, "faces": 2}
+    assert lines[1]["error"] == "bad" and lines[1]["stages"] == {}
@@ -0,0 +1,88 @@
+"""Tests for BFS face orientation."""
+
+import numpy as np
+import pytest
+
+from stl_repair import orient
+from stl_repair.components import merge_meshes
+from stl_repair.orient import orient_faces
+from stl_repair.synth import torus
+from stl_repair.topology import analyze_topology
+
+BACKENDS = [
+    pytest.param(False, id="numpy"),
+    pytest.param(
+        True,
+        id="scipy",
+        marks=pytest.mark.skipif(orient.csr_matrix is None, reason="no scipy"),
+    ),
+]
+
+
+@pytest.mark.parametrize("use_scipy", BACKENDS)
+def test_scrambled_shells_are_restored(use_scipy):
+    """Random flips are undone and inside-out shells turned outwards."""
+    a, b = torus(3000), torus(500, radius=200.0)
+    vertices, faces = merge_meshes([a, b])
+    rng = np.random.default_rng(0)
+    scrambled = faces.copy()
+    flip = rng.random(len(faces)) < 0.3
+    scrambled[flip] = scrambled[flip, ::-1]
+    # Turn the second shell inside out as well
+    second = np.arange(len(faces)) >= len(a[1])
+    scrambled[second] = scrambled[second, ::-1]
+
+    fixed, report = orient_faces(vertices, scrambled, use_scipy)
+    assert (fixed == faces).all()
+    assert report.shells == 2 and report.conflicts == 0
+    assert report.backend == ("scipy" if use_scipy else "numpy")
+    assert analyze_topology(vertices, fixed).defects() == set()
+
+
+@pytest.mark.parametrize("use_scipy", BACKENDS)
+def test_long_strip_and_mobius_band(use_scipy):
+    """Deep shells are handled; a non-orientable band reports its conflict."""
+    n = 2000
+    i = np.arange(n)
+    a, b, c, d = 2 * i, 2 * i + 1, (2 * i + 2) % (2 * n), (2 * i + 3) % (2 * n)
+    # Two triangles per quad, quads in order around the band
+    faces = np.stack([np.stack([a, c, b], 1), np.stack([b, c, d], 1)], 1)
+    faces = faces.reshape(-1, 3)
+    angle = np.repeat(i * 2 * np.pi / n, 2)
+    vertices = np.stack(
+        [10 * np.cos(angle), 10 * np.sin(angle), np.tile([-1, 1], n)], 1
+    )
+    open_strip = faces[:-2].copy()
+    open_strip[::3] = open_strip[::3, ::-1]
+    fixed, report = orient_faces(vertices, open_strip, use_scipy)
+    assert report.conflicts == 0 and report.shells == 1
+    assert analyze_topology(vertices, fixed).inconsistent_edges == 0
+
+    # Close the band with a half twist: no consistent winding exists
+    mobius = faces.copy()
+    mobius[-2:] = [[2 * n - 2, 1, 2 * n - 1], [2 * n - 1, 1, 0]]
+    _, report = orient_faces(vertices, mobius, use_scipy)
+    assert report.conflicts == 1
+
+
+@pytest.mark.parametrize("use_scipy", BACKENDS)
+def test_open_and_lone_shells_keep_their_winding(use_scipy):
+    """Shells without an inside are never flipped, wherever they sit."""
+    rng = np.random.default_rng(1)
+    corners = rng.normal(size=(200, 3, 3)) * 10 + rng.normal(size=(200, 1, 3)) * 100
+    lone = np.arange(600).reshape(-1, 3)
+    fixed, report = orient_faces(corners.reshape(-1, 3), lone, use_scipy)
+    assert report.shells == 200 and report.inverted_shells == 0
+    assert (fixed == lone).all()
+
+    # A slightly bumpy open sheet, consistently wound
+    x, y = np.meshgrid(np.arange(10.0), np.arange(10.0))
+    z = rng.normal(size=x.shape) * 0.01
+    grid = np.stack([x.ravel(), y.ravel(), z.ravel()], 1)
+    i = (np.arange(9)[:, None] * 10 + np.arange(9)).ravel()
+    sheet = np.concatenate(
+        [np.stack([i, i + 1, i + 10], 1), np.stack([i + 1, i + 11, i + 10], 1)]
+    )
+    for offset in rng.normal(size=(20, 3)) * 1000:
+        fixed, report = orient_faces(grid + offset, sheet, use_scipy)
+        assert report.inverted_shells == 0 and (fixed == sheet).all()
@@ -0,0 +1,110 @@
+"""Tests for the worker pool (no Blender required)."""
+
+import os
+import time
+from pathlib import Path
+
+from stl_repair.pool import Job, WorkerPool
+
+
+def init_state(tag):
+    """Initializer run once per worker."""
+    return {"tag": tag, "pid": os.getpid()}
+
+
+def write_handler(job, state, metrics):
+    """Write the worker pid so tests can see which process ran the job."""
+    if job.options.get("fail"):
+        raise RuntimeError("bad mesh")
+    if job.options.get("crash"):
+        os._exit(3)
+    if job.options.get("sleep"):
+        start = time.time()
+        time.sleep(job.options["sleep"])
+        job.output_path.write_text(f"{start} {time.time()}")
+        return job.output_path
+    if job.options.get("hang"):
+        time.sleep(60)
+    if job.options.get("hog"):
+        hog = bytearray(job.options["hog"] << 20)  # noqa: F841
+        time.sleep(60)
+    job.output_path.write_text(f"{state['tag']} {state['pid']}")
+    return job.output_path
+
+
+def _jobs(tmp_path: Path, n: int, **options):
+    return [
+        Job(i, tmp_path / f"in{i}.stl", tmp_path / f"out{i}.stl", dict(options))
+        for i in range(n)
+    ]
+
+
+def test_pool_runs_all_jobs(tmp_path):
+    """Every job produces a result and failures are isolated."""
+    jobs = _jobs(tmp_path, 6)
+    jobs[2].options["fail"] = True
+    pool = WorkerPool(2, write_handler, initializer=init_state, init_args=("w",))
+    results = sorted(pool.run(jobs), key=lambda r: r.input_path.name)
+    assert len(results) == 6
+    assert [r.ok for r in results].count(False) == 1
+    assert (tmp_path / "out0.stl").read_text().startswith("w ")
+
+
+def test_pool_recycles_workers(tmp_path):
+    """max_jobs_per_worker=1 gives every job a fresh process."""
+    pool = WorkerPool(2, write_handler, init_state, ("w",), max_jobs_per_worker=1)
+    results = list(pool.run(_jobs(tmp_path, 4)))
+    assert all(r.ok for r in results)
+    pids = {(tmp_path / f"out{i}.stl").read_text().split()[1] for i in range(4)}
+    assert len(pids) == 4
+
+
+def test_pool_survives_crash(tmp_path):
+    """A worker dying mid-job fails that job and is replaced."""
+    jobs = _jobs(tmp_path, 3)
+    jobs[0].options["crash"] = True
+    pool = WorkerPool(1, write_handler, init_state, ("w",))
+    results = {r.input_path.name: r for r in pool.run(jobs)}
+    assert not results["in0.stl"].ok
+    assert "crashed" in results["in0.stl"].error
+    assert results["in1.stl"].ok and results["in2.stl"].ok
+
+
+def test_pool_kills_over_budget_jobs(tmp_path):
+    """Hung and memory-hungry jobs are killed; the worker is replaced."""
+    jobs = _jobs(tmp_path, 3)
+    jobs[0].options["hang"] = True
+    jobs[1].options["hog"] = 400
+    pool = WorkerPool(
+        1, write_handler, init_state, ("w",), timeout=1.5, memory_limit_mb=250
+    )
+    results = {r.input_path.name: r for r in pool.run(jobs)}
+    assert results["in0.stl"].status == "timeout"
+    assert results["in1.stl"].status == "memory"
+    assert results["in2.stl"].ok
+
+
+def test_pool_retries_killed_jobs(tmp_path):
+    """A killed job is retried once with the cheaper options."""
+    jobs = _jobs(tmp_path, 1, hang=True)
+    pool = WorkerPool(
+        1, write_handler, init_state, ("w",), timeout=1.0, retry_options={"hang": False}
+    )
+    (result,) = pool.run(jobs)
+    assert result.ok
+    assert result.metrics["retried_after"] == "timeout"
+
+
+def test_pool_admits_jobs_within_memory_budget(tmp_path):
+    """Jobs that do not fit wait, while smaller ones are backfilled."""
+    jobs = _jobs(tmp_path, 3, sleep=0.5)
+    for job, memory in zip(jobs, [80, 80, 10], strict=True):
+        job.memory_mb = memory
+    pool = WorkerPool(2, write_handler, init_state, ("w",), memory_budget_mb=100)
+    assert all(r.ok for r in pool.run(jobs))
+    spans = [
+        tuple(map(float, (tmp_path / f"out{i}.stl").read_text().split()))
+        for i in range(3)
+    ]
+    assert spans[1][0] >= spans[0][1]  # the two large jobs never overlap
+    assert spans[2][0] < spans[0][1]  # the small one ran beside the first
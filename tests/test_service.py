@@ -0,0 +1,156 @@
+"""Tests for the local repair service (no Blender required)."""
+
+import http.client
+import json
+import socket
+import threading
+
+from stl_repair.pool import WorkerPool
+from stl_repair.service import RepairService, make_server
+
+ASCII_STL = b"solid part\nendsolid part\n"
+
+
+def upper_handler(job, state, metrics):
+    """Stand-in repair: upper-case the input."""
+    if b"broken" in job.input_path.read_bytes():
+        raise RuntimeError("broken mesh")
+    job.output_path.write_bytes(job.input_path.read_bytes().upper())
+    return job.output_path
+
+
+class UnixConnection(http.client.HTTPConnection):
+    """HTTP over a Unix domain socket."""
+
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(self.path))
+
+
+def _serve(tmp_path, output_root=None, **kwargs):
+    service = RepairService(
+        WorkerPool(1, upper_handler), workdir=tmp_path / "work", output_root=output_root
+    )
+    service.start()
+    server = make_server(service, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return service, server
+
+
+def _request(conn, method, path, body=None):
+    conn.request(method, path, body=body)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def test_upload_and_stats(tmp_path):
+    """Uploads are repaired by warm workers and show up in the stats."""
+    service, server = _serve(tmp_path, port=0)
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        status, body = _request(conn, "POST", "/upload", ASCII_STL)
+        assert status == 200
+        assert body == ASCII_STL.upper()
+        status, body = _request(conn, "POST", "/upload", b"not a mesh")
+        assert status == 400
+        status, body = _request(conn, "GET", "/stats")
+        stats = json.loads(body)
+        assert stats["completed"] == 1 and stats["queued"] == 0
+        assert stats["latency_s"]["p50"] > 0
+        assert list((tmp_path / "work").iterdir()) == []
+    finally:
+        server.shutdown()
+        service.close()
+
+
+def test_path_requests_over_unix_socket(tmp_path):
+    """Path-based requests work over a Unix socket and report failures."""
+    sock = tmp_path / "repair.sock"
+    service, server = _serve(tmp_path, socket_path=sock)
+    good = tmp_path / "good.stl"
+    good.write_bytes(ASCII_STL)
+    bad = tmp_path / "bad.stl"
+    bad.write_bytes(b"solid broken\nendsolid broken\n")
+    try:
+        conn = UnixConnection(sock)
+        status, body = _request(
+            conn, "POST", "/repair", json.dumps({"input": str(good)})
+        )
+        assert status == 200 and json.loads(body)["ok"]
+        assert (tmp_path / "good_fixed.stl").read_bytes() == ASCII_STL.upper()
+        status, body = _request(
+            conn, "POST", "/repair", json.dumps({"input": str(bad)})
+        )
+        assert status == 422 and json.loads(body)["error"] == "broken mesh"
+        status, body = _request(conn, "GET", "/health")
+        assert status == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def test_bad_lengths_and_output_paths(tmp_path):
+    """Malformed lengths get a 400; outputs stay inside the output root."""
+    part = tmp_path / "part.stl"
+    part.write_bytes(ASCII_STL)
+    root = tmp_path / "out"
+    root.mkdir()
+    service, server = _serve(tmp_path, output_root=root, host="0.0.0.0", port=0)
+    port = server.server_address[1]
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        conn.putrequest("POST", "/upload")
+        conn.putheader("Content-Length", "lots")
+        conn.endheaders()
+        assert conn.getresponse().status == 400
+
+        def repair(**request):
+            conn = http.client.HTTPConnection("127.0.0.1", port)
+            return _request(conn, "POST", "/repair", json.dumps(request))[0]
+
+        assert repair(input=str(part), output=str(tmp_path / "escape.stl")) == 403
+        assert repair(input=str(part), output="../escape.stl") == 403
+        assert repair(input=str(part), output=5) == 400
+        assert repair(input=str(part)) == 200
+        assert (root / "part_fixed.stl").read_bytes() == ASCII_STL.upper()
+        assert not (tmp_path / "escape.stl").exists()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    # Without an output root, a public bind refuses path requests altogether
+    service, server = _serve(tmp_path, host="0.0.0.0", port=0)
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        request = {"input": str(part), "output": str(tmp_path / "x.stl")}
+        assert _request(conn, "POST", "/repair", json.dumps(request))[0] == 403
+        request = {"input": str(part)}
+        assert _request(conn, "POST", "/repair", json.dumps(request))[0] == 403
+        assert not (tmp_path / "part_fixed.stl").exists()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def test_stopped_service_answers_503(tmp_path):
+    """Requests reaching a service that is shutting down get a 503."""
+    part = tmp_path / "part.stl"
+    part.write_bytes(ASCII_STL)
+    service, server = _serve(tmp_path, port=0)
+    service.close()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        status, body = _request(conn, "POST", "/upload", ASCII_STL)
+        assert status == 503 and json.loads(body)["error"] == "Service stopped"
+        request = json.dumps({"input": str(part)})
+        assert _request(conn, "POST", "/repair", request)[0] == 503
+    finally:
+        server.shutdown()
+        server.server_close()
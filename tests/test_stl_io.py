@@ -0,0 +1,176 @@
+"""Tests for NumPy STL reading."""
+
+import os
+
+import numpy as np
+import pytest
+
+from stl_repair import stl_io
+from stl_repair.stl_io import (
+    BINARY_STL_DTYPE,
+    ascii_cache_path,
+    load_ascii_mesh,
+    load_binary_mesh,
+    load_mesh,
+    read_ascii_stl,
+    sniff_format,
+    triangle_count,
+    weld_triangles,
+    write_binary_stl,
+)
+from stl_repair.synth import torus
+
+# Two triangles of a unit square sharing the diagonal
+SQUARE = np.array(
+    [
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+        [[0, 0, 0], [1, 1, 0], [0, 1, 0]],
+    ],
+    dtype=np.float32,
+)
+
+
+def read_records(path):
+    """Raw triangle records of a binary STL file."""
+    return np.fromfile(path, dtype=BINARY_STL_DTYPE, offset=84)
+
+
+def write_binary(path, triangles, header=b""):
+    """Write a minimal binary STL file."""
+    records = np.zeros(len(triangles), dtype=BINARY_STL_DTYPE)
+    records["vertices"] = triangles
+    with open(path, "wb") as f:
+        f.write(header.ljust(80, b"\0"))
+        f.write(np.uint32(len(triangles)).tobytes())
+        f.write(records.tobytes())
+
+
+def write_ascii(path, triangles):
+    """Write an ASCII STL file."""
+    lines = ["solid square"]
+    for tri in triangles:
+        lines += ["  facet normal 0 0 1", "    outer loop"]
+        lines += [f"      vertex {x:e} {y:e} {z:e}" for x, y, z in tri]
+        lines += ["    endloop", "  endfacet"]
+    path.write_text("\n".join(lines + ["endsolid square", ""]))
+
+
+def test_sniff_format(tmp_path):
+    """Binary detection relies on size, even with a 'solid' header."""
+    binary = tmp_path / "b.stl"
+    write_binary(binary, SQUARE, header=b"solid exported by CAD")
+    ascii_ = tmp_path / "a.stl"
+    ascii_.write_text("solid part\nendsolid part\n")
+    junk = tmp_path / "j.stl"
+    junk.write_bytes(b"not a mesh")
+    assert sniff_format(binary) == "binary"
+    assert sniff_format(ascii_) == "ascii"
+    assert sniff_format(junk) is None
+
+
+def test_binary_with_trailing_bytes(tmp_path):
+    """Padding after the last facet is ignored rather than rejected."""
+    path = tmp_path / "padded.stl"
+    write_binary(path, SQUARE)
+    with open(path, "ab") as f:
+        f.write(b"\0" * 37)
+    assert sniff_format(path) == "binary"
+    assert triangle_count(path) == 2
+    vertices, faces = load_mesh(path)
+    assert len(vertices) == 4 and len(faces) == 2
+
+
+def test_load_binary_mesh(tmp_path):
+    """Records are read with the right layout and their corners welded."""
+    path = tmp_path / "b.stl"
+    write_binary(path, SQUARE)
+    vertices, faces = load_binary_mesh(path)
+    assert vertices.shape == (4, 3) and faces.dtype == np.int32
+    np.testing.assert_array_equal(vertices[faces], SQUARE)
+
+
+def test_weld_triangles():
+    """Shared corners collapse to one vertex, including signed zeros."""
+    soup = SQUARE.copy()
+    soup[1, 0, 2] = -0.0
+    vertices, faces = weld_triangles(soup)
+    assert vertices.shape == (4, 3)
+    assert faces.dtype == np.int32
+    np.testing.assert_array_equal(vertices[faces], SQUARE)
+    assert faces[0, 0] == faces[1, 0]
+
+
+def test_load_binary_mesh_empty(tmp_path):
+    """An STL with no facets yields empty arrays."""
+    path = tmp_path / "empty.stl"
+    write_binary(path, np.zeros((0, 3, 3), dtype=np.float32))
+    vertices, faces = load_binary_mesh(path)
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
+
+
+def test_load_binary_mesh_in_chunks(tmp_path, monkeypatch):
+    """Reading and welding slice by slice matches welding the whole soup."""
+    vertices, faces = torus(500)
+    soup = vertices[faces]
+    path = tmp_path / "torus.stl"
+    write_binary(path, soup)
+    monkeypatch.setattr(stl_io, "WELD_CHUNK", 7)
+    welded, indexed = load_binary_mesh(path)
+    expected = weld_triangles(soup)
+    np.testing.assert_array_equal(welded, expected[0])
+    np.testing.assert_array_equal(indexed, expected[1])
+    assert len(welded) == len(vertices)
+
+
+def test_write_binary_stl_roundtrip(tmp_path):
+    """Written files read back identically with unit normals."""
+    vertices, faces = weld_triangles(SQUARE)
+    path = tmp_path / "out.stl"
+    assert write_binary_stl(path, vertices, faces) == path
+    assert sniff_format(path) == "binary"
+    records = read_records(path)
+    np.testing.assert_array_equal(records["vertices"], SQUARE)
+    np.testing.assert_allclose(records["normal"], [[0, 0, 1], [0, 0, 1]])
+    assert [p.name for p in tmp_path.iterdir()] == ["out.stl"]
+
+
+def test_read_ascii_stl_in_small_chunks(tmp_path):
+    """Records split across chunk boundaries are parsed and progress reported."""
+    path = tmp_path / "a.stl"
+    write_ascii(path, SQUARE)
+    seen = []
+    triangles = read_ascii_stl(path, chunk_size=7, progress=lambda d, t: seen.append(d))
+    assert np.array_equal(triangles, SQUARE)
+    assert seen[-1] == path.stat().st_size
+    vertices, faces = load_mesh(path)
+    assert len(vertices) == 4 and len(faces) == 2
+
+    path.write_text("solid x\nfacet normal 0 0 1\nouter loop\nvertex 1 2 nan3\n")
+    with pytest.raises(ValueError):
+        read_ascii_stl(path)
+
+
+def test_ascii_cache(tmp_path):
+    """The binary cache is reused until the source changes."""
+    path = tmp_path / "a.stl"
+    write_ascii(path, SQUARE)
+    load_ascii_mesh(path, cache=True)
+    cached = ascii_cache_path(path)
+    assert sniff_format(cached) == "binary"
+    assert np.array_equal(read_records(cached)["vertices"], SQUARE)
+
+    write_ascii(path, SQUARE[:1])
+    os.utime(path, ns=(0, 0))
+    vertices, faces = load_ascii_mesh(path, cache=True)
+    assert len(faces) == 1
+    assert len(read_records(cached)) == 1
+
+
+def test_triangle_count(tmp_path):
+    """Binary counts come from the header; ASCII ones are estimated."""
+    binary = tmp_path / "b.stl"
+    write_binary(binary, SQUARE)
+    assert triangle_count(binary) == 2
+    ascii_ = tmp_path / "a.stl"
+    write_ascii(ascii_, np.repeat(SQUARE, 500, axis=0))
+    assert 500 < triangle_count(ascii_) < 2000
@@ -0,0 +1,23 @@
+"""Tests for the synthetic defective-mesh generator."""
+
+from stl_repair.synth import defective_mesh, torus
+from stl_repair.validate import check_mesh
+
+
+def test_torus_is_clean():
+    """The base mesh is closed, manifold and outward facing."""
+    vertices, faces = torus(5000)
+    assert abs(len(faces) - 5000) < 200
+    assert check_mesh(vertices, faces).clean
+
+
+def test_defects_are_injected():
+    """Each requested defect class shows up in the validator."""
+    vertices, faces, applied = defective_mesh(5000, seed=3)
+    report = check_mesh(vertices, faces)
+    assert applied["holes"] == 8
+    assert report.boundary_edges > 0
+    assert report.non_manifold_edges >= applied["non_manifold"]
+    assert report.inconsistent_edges > 0
+    assert report.degenerate_faces == applied["degenerate"]
+    assert report.duplicate_vertices >= applied["duplicates"]
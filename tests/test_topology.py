@@ -0,0 +1,51 @@
+"""Tests for the edge-table topology analyzer."""
+
+import numpy as np
+
+from stl_repair.synth import torus
+from stl_repair.topology import analyze_topology, boundary_loops, edge_table
+
+
+def test_closed_mesh_has_only_manifold_edges():
+    """A closed torus has no defects; every edge is shared by two faces."""
+    vertices, faces = torus(2000)
+    table = edge_table(faces, len(vertices))
+    assert len(table.edges) == len(faces) * 3 // 2
+    assert (table.edges[:, 0] < table.edges[:, 1]).all()
+    assert table.manifold.all()
+    report = analyze_topology(vertices, faces)
+    assert report.defects() == set()
+    assert report.as_dict()["defects"] == []
+
+
+def test_boundary_loops_follow_each_hole():
+    """Removing faces leaves one loop per hole, around its missing faces."""
+    vertices, faces = torus(2000)
+    far_apart = [0, 300, 700]
+    holes = np.delete(faces, far_apart, axis=0)
+    table = edge_table(holes, len(vertices))
+    loops = boundary_loops(holes, table)
+    assert sorted(len(loop) for loop in loops) == [3, 3, 3]
+    for loop in loops:
+        assert any(set(loop) == set(face) for face in faces[far_apart])
+
+    # The two triangles of one quad share an edge: a single four-sided hole
+    quad = np.delete(faces, [0, len(faces) // 2], axis=0)
+    report = analyze_topology(vertices, quad)
+    assert report.boundary_loops == 1 and report.largest_loops == [4]
+    assert report.defects() == {"holes"}
+
+
+def test_fins_flips_and_inversion_are_classified():
+    """Non-manifold edges, inconsistent winding and inside-out shells."""
+    vertices, faces = torus(2000)
+    fin = np.vstack([vertices, [[0, 0, 100]]]).astype(np.float32)
+    report = analyze_topology(fin, np.vstack([faces, [[*faces[0, :2], len(vertices)]]]))
+    assert report.non_manifold_edges == 1 and "non_manifold" in report.defects()
+
+    flipped = faces.copy()
+    flipped[5] = flipped[5, ::-1]
+    report = analyze_topology(vertices, flipped)
+    assert report.defects() == {"winding"} and report.inconsistent_edges == 3
+
+    assert analyze_topology(vertices, faces[:, ::-1]).defects() == {"inverted"}
@@ -0,0 +1,62 @@
+"""Tests for the NumPy clean-mesh pre-check."""
+
+import numpy as np
+
+from stl_repair.geometry import close_vertex_pairs
+from stl_repair.validate import check_mesh
+
+CUBE_VERTICES = np.array(
+    [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float32
+)
+# Outward-facing triangles of the unit cube
+CUBE_FACES = np.array(
+    [
+        [0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5],
+        [0, 4, 5], [0, 5, 1], [2, 3, 7], [2, 7, 6],
+        [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3],
+    ],
+    dtype=np.int32,
+)  # fmt: skip
+
+
+def test_clean_cube():
+    """A closed, outward cube passes with reasons."""
+    report = check_mesh(CUBE_VERTICES, CUBE_FACES)
+    assert report.clean
+    assert report.as_dict()["reasons"]
+
+
+def test_defects_detected():
+    """Each defect class is counted."""
+    assert check_mesh(CUBE_VERTICES, CUBE_FACES[1:]).boundary_edges == 3
+
+    flipped = CUBE_FACES.copy()
+    flipped[0] = flipped[0, ::-1]
+    assert check_mesh(CUBE_VERTICES, flipped).inconsistent_edges == 3
+
+    assert check_mesh(CUBE_VERTICES, CUBE_FACES[:, ::-1]).inverted
+
+    extra = np.concatenate([CUBE_FACES, CUBE_FACES[:1]])
+    report = check_mesh(CUBE_VERTICES, extra)
+    assert report.non_manifold_edges == 3 and not report.clean
+
+    degenerate = np.concatenate([CUBE_FACES, [[0, 0, 1]]])
+    assert check_mesh(CUBE_VERTICES, degenerate).degenerate_faces == 1
+
+    near = np.concatenate([CUBE_VERTICES, [[1, 1, 1.00001]]]).astype(np.float32)
+    report = check_mesh(near, CUBE_FACES)
+    assert report.duplicate_vertices == 1
+    assert "1 duplicate vertex pairs" in report.problems()
+
+
+def test_close_vertex_pairs_matches_brute_force():
+    """The grid search finds exactly the pairs a brute-force scan does."""
+    rng = np.random.default_rng(1)
+    points = rng.random((400, 3))
+    points[200:] = points[:200] + rng.normal(scale=0.01, size=(200, 3))
+    d = 0.02
+    dist = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    i, j = np.nonzero(np.triu(dist <= d, k=1))
+    expected = {(a, b) for a, b in zip(i.tolist(), j.tolist(), strict=True)}
+    found = {tuple(p) for p in close_vertex_pairs(points, d).tolist()}
+    assert found == expected
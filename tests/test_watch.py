@@ -0,0 +1,110 @@
+"""Tests for hot-folder ingestion (no Blender required)."""
+
+import time
+
+import pytest
+
+from stl_repair import watch
+from stl_repair.pool import WorkerPool
+from stl_repair.watch import DirectoryWatcher, HotFolder
+
+ASCII_STL = b"solid part\nendsolid part\n"
+
+
+def upper_handler(job, state, metrics):
+    """Stand-in repair: upper-case the input."""
+    if b"broken" in job.input_path.read_bytes():
+        raise RuntimeError("broken mesh")
+    job.output_path.write_bytes(job.input_path.read_bytes().upper())
+    return job.output_path
+
+
+def _until(step, done, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not done():
+        assert time.monotonic() < deadline, "timed out"
+        step()
+
+
+def test_polling_waits_for_file_to_settle(tmp_path):
+    """Without inotify a file is only ready once it stops changing."""
+    watcher = DirectoryWatcher(tmp_path, settle=2.0, use_inotify=False)
+    part = tmp_path / "part.stl"
+    part.write_bytes(ASCII_STL)
+    (tmp_path / "notes.txt").write_text("ignored")
+    assert watcher.ready(now=0.0) == []
+    assert watcher.ready(now=1.5) == []
+    assert watcher.ready(now=2.5) == [part]
+    # Reported once, until it is rewritten
+    assert watcher.ready(now=10.0) == []
+    part.write_bytes(ASCII_STL * 2)
+    watcher.ready(now=11.0)
+    assert watcher.ready(now=13.5) == [part]
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_hot_folder_repairs_and_quarantines(tmp_path, use_inotify):
+    """Good files land in the output dir, bad ones in quarantine."""
+    inbox, out, bad = tmp_path / "in", tmp_path / "out", tmp_path / "bad"
+    inbox.mkdir()
+    (inbox / "early.stl").write_bytes(ASCII_STL)
+    watcher = DirectoryWatcher(
+        inbox,
+        settle=0.0 if use_inotify else 0.1,
+        poll_interval=0.05,
+        use_inotify=use_inotify,
+    )
+    results = []
+    pool = WorkerPool(1, upper_handler)
+    pool.start()
+    done = tmp_path / "done"
+    folder = HotFolder(watcher, pool, {}, out, bad, results.append, done)
+    try:
+        folder.step(timeout=0.05)
+        (inbox / "part.stl").write_bytes(ASCII_STL)
+        (inbox / "broken.stl").write_bytes(b"solid broken\nendsolid broken\n")
+        (inbox / "junk.stl").write_bytes(b"no mesh here")
+        _until(folder.step, lambda: len(results) == 4)
+    finally:
+        pool.close()
+        watcher.close()
+    assert (out / "part.stl").read_bytes() == ASCII_STL.upper()
+    assert (out / "early.stl").exists()
+    assert sorted(p.name for p in bad.iterdir()) == [
+        "broken.stl",
+        "broken.stl.error.txt",
+        "junk.stl",
+        "junk.stl.error.txt",
+    ]
+    assert "broken mesh" in (bad / "broken.stl.error.txt").read_text()
+    assert all(r.metrics["latency_s"] >= 0 for r in results)
+    assert folder.completed == 2 and folder.failed == 2
+    # Finished inputs leave the hot folder and the watcher forgets them
+    assert sorted(p.name for p in done.iterdir()) == ["early.stl", "part.stl"]
+    assert not list(inbox.glob("*.stl")) and not watcher._seen
+
+
+def test_failed_quarantine_does_not_stop_the_folder(tmp_path, monkeypatch):
+    """A quarantine move that fails is logged and the file is not retried."""
+    inbox = tmp_path / "in"
+    inbox.mkdir()
+    (inbox / "broken.stl").write_bytes(b"solid broken\nendsolid broken\n")
+
+    def refuse(*args):
+        raise PermissionError("read-only quarantine")
+
+    monkeypatch.setattr(watch, "quarantine", refuse)
+    watcher = DirectoryWatcher(inbox, settle=0.0, use_inotify=False)
+    results = []
+    pool = WorkerPool(1, upper_handler)
+    pool.start()
+    folder = HotFolder(watcher, pool, {}, tmp_path / "out", tmp_path / "bad")
+    folder.on_result = results.append
+    try:
+        _until(folder.step, lambda: len(results) == 1)
+        for _ in range(3):
+            folder.step(timeout=0.05)
+    finally:
+        pool.close()
+        watcher.close()
+    assert (inbox / "broken.stl").exists() and folder.failed == 1